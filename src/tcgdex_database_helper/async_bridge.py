@@ -0,0 +1,94 @@
+import queue
+import asyncio
+from concurrent.futures import CancelledError, Future
+from threading import Thread
+
+
+class AsyncBridge:
+    # One long-lived asyncio event loop on a background thread, bridged to Tk:
+    #  - coroutines are submitted from Tk callbacks with submit()
+    #  - results come back on the Tk thread, polled with root.after()
+    #  - futures can be tagged with a group and cancelled together
+    #    (e.g. everything started for a series the user has moved away from)
+
+    def __init__(self, root, poll_ms: int = 20):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.loop = asyncio.new_event_loop()
+        self.results = queue.Queue()
+        self.groups: dict[str, set[Future]] = {}
+        self.closed = False
+
+        self.thread = Thread(target=self.run_loop, name="asyncio-loop", daemon=True)
+        self.thread.start()
+        self.root.after(self.poll_ms, self.poll)
+
+    def run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    # ---------- SUBMIT ----------
+    def submit(self, coro, on_done=None, on_error=None, on_cancel=None, group: str | None = None) -> Future:
+        # Safe to call from the Tk thread; callbacks run back on the Tk thread
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if group is not None:
+            self.groups.setdefault(group, set()).add(future)
+        future.add_done_callback(lambda f: self.results.put((f, on_done, on_error, on_cancel, group)))
+        return future
+
+    def post(self, callback, value=None):
+        # Schedule callback(value) on the Tk thread from any thread
+        future = Future()
+        future.set_result(value)
+        self.results.put((future, callback, None, None, None))
+
+    def cancel_group(self, group: str):
+        for future in self.groups.pop(group, set()):
+            future.cancel()
+
+    # ---------- DELIVER ----------
+    def poll(self):
+        try:
+            while True:
+                try:
+                    future, on_done, on_error, on_cancel, group = self.results.get_nowait()
+                except queue.Empty:
+                    break
+
+                if group is not None and group in self.groups:
+                    self.groups[group].discard(future)
+
+                try:
+                    self.deliver(future, on_done)
+                except CancelledError:
+                    if on_cancel is not None:
+                        self.run_callback(on_cancel)
+                except Exception as e:
+                    if on_error is not None:
+                        self.run_callback(on_error, e)
+                    else:
+                        print(f"⚠️ Background task failed: {e}")
+        finally:
+            # A failing callback must not stop delivery for the rest of the session
+            if not self.closed:
+                self.root.after(self.poll_ms, self.poll)
+
+    @staticmethod
+    def run_callback(callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"⚠️ Background task callback failed: {type(e).__name__}: {e}")
+
+    @staticmethod
+    def deliver(future: Future, on_done):
+        # Errors from the task and from its callback both go to on_error
+        result = future.result()
+        if on_done is not None:
+            on_done(result)
+
+    def shutdown(self):
+        self.closed = True
+        for group in list(self.groups):
+            self.cancel_group(group)
+        self.loop.call_soon_threadsafe(self.loop.stop)
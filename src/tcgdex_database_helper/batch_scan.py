@@ -0,0 +1,140 @@
+import sys
+import csv
+import json
+import time
+
+from pathlib import Path
+
+from tcgdex_database_helper.card_index import CardIndex
+
+# ---------- CONFIG (initialized from main) ----------
+DATABASE_ROOT_EN: Path | None = None
+DATABASE_ROOT_JA: Path | None = None
+CARD_INDEX_PATH: Path | None = None
+# -----------------------------------------------
+
+CSV_HEADER = ["Language", "Series", "Set", "Set ID", "Card ID", "Path", "Missing In Set", "Cards In Set"]
+
+
+def configure_batch_scan(
+    database_root_en: Path,
+    database_root_ja: Path,
+    card_index_path: Path,
+):
+    global DATABASE_ROOT_EN, DATABASE_ROOT_JA, CARD_INDEX_PATH
+    DATABASE_ROOT_EN = database_root_en
+    DATABASE_ROOT_JA = database_root_ja
+    CARD_INDEX_PATH = card_index_path
+
+
+def language_roots(language: str) -> list[tuple[str, Path]]:
+    roots = {"en": DATABASE_ROOT_EN, "ja": DATABASE_ROOT_JA}
+    languages = ["en", "ja"] if language == "all" else [language]
+    return [(lang, roots[lang]) for lang in languages if roots[lang] is not None]
+
+
+def scan_sets(index: CardIndex, languages: list[str]):
+    # Same checks as CardInspectorApp.start_scan, answered from the card index per set
+    for language, series, set_name, set_id, total, missing in index.set_summaries(languages):
+        cards = []
+        if missing:
+            cards = [
+                {"card_id": card_id, "path": path}
+                for path, card_id in index.missing_in_set(language, series, set_name)
+            ]
+        yield {
+            "language": language,
+            "series": series,
+            "set": set_name,
+            "set_id": set_id,
+            "total": total,
+            "missing": missing,
+            "cards": cards,
+        }
+
+
+# ---------- OUTPUT ----------
+class JsonlWriter:
+    # One line per set: counts plus the cards missing an illustrator
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write_set(self, result: dict):
+        self.stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+class CsvWriter:
+    # One row per card, with the set-level counts repeated on each row
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = csv.writer(stream)
+        self.writer.writerow(CSV_HEADER)
+
+    def write_set(self, result: dict):
+        for card in result["cards"]:
+            self.writer.writerow([
+                result["language"],
+                result["series"],
+                result["set"],
+                result["set_id"],
+                card["card_id"],
+                card["path"],
+                result["missing"],
+                result["total"],
+            ])
+        self.stream.flush()
+# -------------------------------
+
+
+def run_batch_scan(
+    language: str = "all",
+    output: Path | None = None,
+    output_format: str | None = None,
+    max_workers: int | None = None,
+    include_complete: bool = False,
+):
+    if output_format is None:
+        output_format = "csv" if output is not None and output.suffix.lower() == ".csv" else "jsonl"
+
+    roots = {}
+    for lang, root in language_roots(language):
+        if not root.exists():
+            print(f"⚠️ Database root not found for {lang}: {root}", file=sys.stderr)
+            continue
+        roots[lang] = root
+
+    stream = open(output, "w", newline="", encoding="utf-8") if output is not None else sys.stdout
+    writer = CsvWriter(stream) if output_format == "csv" else JsonlWriter(stream)
+
+    start = time.perf_counter()
+    sets_scanned = 0
+    total_cards = 0
+    total_missing = 0
+    sets_with_missing = 0
+    index = CardIndex(CARD_INDEX_PATH, max_workers=max_workers)
+    try:
+        # Only files changed since the last run are re-parsed, the rest is indexed lookups
+        stats = index.refresh(roots)
+        for result in scan_sets(index, list(roots)):
+            sets_scanned += 1
+            total_cards += result["total"]
+            total_missing += result["missing"]
+            if result["missing"]:
+                sets_with_missing += 1
+            if result["missing"] or include_complete:
+                writer.write_set(result)
+    finally:
+        index.close()
+        if output is not None:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    print("✅ Done", file=sys.stderr)
+    print(f"📁 Sets scanned: {sets_scanned}", file=sys.stderr)
+    print(f"📁 Total card files scanned: {total_cards}", file=sys.stderr)
+    print(f"🔄 Card files re-parsed: {stats['parsed']}", file=sys.stderr)
+    print(f"❓ Cards missing illustrator: {total_missing} in {sets_with_missing} sets", file=sys.stderr)
+    print(f"⏱️ Elapsed: {elapsed:.2f}s", file=sys.stderr)
+    if output is not None:
+        print(f"💾 Output written to: {output}", file=sys.stderr)
@@ -0,0 +1,389 @@
+import io
+import os
+import re
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from pathlib import Path
+
+from tcgdex_database_helper import count_cards_by_illustrator as census
+from tcgdex_database_helper.benchmark.synthetic_database import load_or_generate
+from tcgdex_database_helper.card_files import (
+    atomic_write,
+    extract_card_fields,
+    extract_card_id,
+    list_card_files,
+    missing_illustrator,
+    normalize_illustrator,
+    set_illustrator,
+)
+from tcgdex_database_helper.card_index import CardIndex
+from tcgdex_database_helper.illustrator_index import IllustratorIndex
+
+RESULTS_VERSION = 1
+
+# What the census and the editor ran per file before the single-pass extractor
+PER_FIELD_PATTERNS = [
+    re.compile(r"illustrator\s*:\s*['\"](.+?)['\"]", re.IGNORECASE),
+    re.compile(r"\brarity\s*:\s*['\"](.+?)['\"]"),
+]
+BASELINE_ILLUSTRATOR_REGEX = PER_FIELD_PATTERNS[0]
+
+
+def summarize(samples: list[float], **extra) -> dict:
+    # Seconds in, milliseconds out
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        return {"samples": 0, **extra}
+    return {
+        "samples": n,
+        "total_s": sum(ordered),
+        "mean_ms": 1000 * sum(ordered) / n,
+        "p50_ms": 1000 * ordered[n // 2],
+        "p95_ms": 1000 * ordered[min(n - 1, int(n * 0.95))],
+        "max_ms": 1000 * ordered[-1],
+        **extra,
+    }
+
+
+def timed(func, *args, **kwargs) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+# ---------- BENCHMARKS ----------
+def bench_census(results: dict, roots: dict, work_dir: Path, workers: int | None):
+    census.configure_count_cards_by_illustrator(
+        database_root_en=roots["en"],
+        database_root_ja=roots["ja"],
+        illustrator_csv=work_dir / "illustrator_card_count.csv",
+        card_index_path=work_dir / "card_index.sqlite3",
+        max_workers=workers,
+    )
+
+    # The original algorithm: read and decode every .ts file whole, one regex search, no index
+    def full_read():
+        found = 0
+        for root in roots.values():
+            for file_path in census.iter_ts_files(root):
+                with open(file_path, "r", encoding="utf-8") as f:
+                    match = BASELINE_ILLUSTRATOR_REGEX.search(f.read())
+                if match and normalize_illustrator(match.group(1)):
+                    found += 1
+        return found
+
+    elapsed, _ = timed(full_read)
+    results["census.full_read"] = summarize([elapsed])
+
+    for path in work_dir.glob("card_index.sqlite3*"):
+        path.unlink()
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed, _ = timed(census.run_count_cards_by_illustrator)
+        results["census.cold_index"] = summarize([elapsed])
+
+        elapsed, _ = timed(census.run_count_cards_by_illustrator)
+        results["census.warm_index"] = summarize([elapsed])
+
+        # A git pull touching 1% of the files
+        index = CardIndex(work_dir / "card_index.sqlite3")
+        paths = [row[0] for row in index.query("SELECT path FROM cards")]
+        index.close()
+        touched = random.Random(1).sample(paths, max(1, len(paths) // 100))
+        now = time.time()
+        for path in touched:
+            os.utime(path, (now, now))
+        elapsed, _ = timed(census.run_count_cards_by_illustrator)
+        results["census.touched_1pct"] = summarize([elapsed], files=len(touched))
+
+
+def bench_scan(results: dict, index: CardIndex, sample_sets: int):
+    # CardInspectorApp.start_scan, per set: the original file loop vs the card index
+    sets = index.set_summaries(["en", "ja"])
+    sets = random.Random(2).sample(sets, min(sample_sets, len(sets)))
+    file_samples = []
+    index_samples = []
+    for language, series, set_name, set_id, _, _ in sets:
+        root = census.DATABASE_ROOT_EN if language == "en" else census.DATABASE_ROOT_JA
+        set_path = os.path.join(os.path.abspath(root), series, set_name)
+
+        def scan_files():
+            missing = []
+            for file in list_card_files(set_path):
+                full = os.path.join(set_path, file)
+                with open(full, "r", encoding="utf-8") as f:
+                    content = f.read()
+                if missing_illustrator(content):
+                    missing.append((full, extract_card_id(content=content, set_id=set_id, filename=file)))
+            return missing
+
+        def scan_index():
+            index.refresh_set(language, set_path)
+            return index.missing_in_set(*CardIndex.set_key(language, set_path))
+
+        elapsed, _ = timed(scan_files)
+        file_samples.append(elapsed)
+        elapsed, _ = timed(scan_index)
+        index_samples.append(elapsed)
+
+    results["scan.set_files"] = summarize(file_samples)
+    results["scan.set_index"] = summarize(index_samples)
+
+
+def bench_extract(results: dict, index: CardIndex, sample_files: int):
+    # Per-file field extraction: decode + one regex search per field vs the single-pass extractor
+    rows = index.query("SELECT path FROM cards ORDER BY path")
+    paths = [row[0] for row in random.Random(5).sample(rows, min(sample_files, len(rows)))]
+    raws = []
+    for path in paths:
+        with open(path, "rb") as f:
+            raws.append(f.read())
+
+    def per_field(raw):
+        content = raw.decode("utf-8")
+        missing_illustrator(content)
+        extract_card_id(content, "set", "1.ts")
+        for pattern in PER_FIELD_PATTERNS:
+            pattern.search(content)
+
+    elapsed, _ = timed(lambda: [per_field(raw) for raw in raws])
+    results["extract.per_field_regex"] = summarize([elapsed], files=len(raws), per_file_us=1e6 * elapsed / len(raws))
+    elapsed, _ = timed(lambda: [extract_card_fields(raw) for raw in raws])
+    results["extract.single_pass"] = summarize([elapsed], files=len(raws), per_file_us=1e6 * elapsed / len(raws))
+
+
+def bench_normalize(results: dict, raw_illustrators: list[str], calls: int):
+    if not raw_illustrators:
+        return
+    stream = [raw_illustrators[i % len(raw_illustrators)] for i in range(calls)]
+    elapsed, _ = timed(lambda: [normalize_illustrator(name) for name in stream])
+    results["normalize.call"] = summarize([elapsed], calls=calls, per_call_us=1e6 * elapsed / calls)
+
+
+def bench_autocomplete(results: dict, index: CardIndex, keystrokes: int):
+    counts = census.count_illustrators(index)
+    build_samples = []
+    for _ in range(5):
+        elapsed, illustrator_index = timed(IllustratorIndex, counts)
+        build_samples.append(elapsed)
+    results["autocomplete.build"] = summarize(build_samples, illustrators=len(counts))
+
+    # Typing names keystroke by keystroke, weighted like real lookups toward frequent names
+    rng = random.Random(3)
+    names = list(counts)
+    weights = [counts[name] for name in names]
+    samples = []
+    while len(samples) < keystrokes:
+        name = rng.choices(names, weights)[0]
+        start = rng.randrange(0, max(1, len(name) // 2)) if rng.random() < 0.3 else 0
+        for end in range(start + 1, len(name) + 1):
+            elapsed, _ = timed(illustrator_index.search, name[start:end])
+            samples.append(elapsed)
+    results["autocomplete.keystroke"] = summarize(samples)
+
+    # Unknown-illustrator suggestions: one typo (drop, double or swap a letter) per name
+    elapsed, _ = timed(illustrator_index.prepare_suggestions)
+    results["suggest.build"] = summarize([elapsed], illustrators=len(counts))
+    samples = []
+    for _ in range(1000):
+        name = rng.choices(names, weights)[0]
+        i = rng.randrange(len(name))
+        typo = rng.choice([name[:i] + name[i + 1:], name[:i] + name[i] + name[i:], name[:i] + name[i + 1:i + 2] + name[i:i + 1] + name[i + 2:]])
+        elapsed, _ = timed(illustrator_index.suggest, typo)
+        samples.append(elapsed)
+    results["suggest.lookup"] = summarize(samples)
+
+
+def bench_save(results: dict, index: CardIndex, saves: int):
+    # CardInspectorApp.save_illustrator without the widgets: read, edit, atomic write
+    rows = index.query("SELECT path FROM cards WHERE missing = 1 ORDER BY path")
+    paths = [row[0] for row in random.Random(4).sample(rows, min(saves, len(rows)))]
+    originals = {}
+    samples = []
+    try:
+        for path in paths:
+            start = time.perf_counter()
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            new_content = set_illustrator(content, "Benchmark Artist")
+            if new_content is not None:
+                atomic_write(path, new_content)
+            samples.append(time.perf_counter() - start)
+            originals[path] = content
+    finally:
+        # Keep the synthetic tree reusable across runs
+        for path, content in originals.items():
+            atomic_write(path, content)
+    results["save.illustrator"] = summarize(samples)
+
+
+def bench_http(results: dict, index: CardIndex, work_dir: Path, requests_count: int, latency_ms: float, concurrency: int):
+    from tcgdexsdk import TCGdex
+    from tcgdexsdk.models.Card import Card
+
+    from tcgdex_database_helper.benchmark.stub_server import StubTCGdexServer
+    from tcgdex_database_helper.http_client import HttpClient
+    from tcgdex_database_helper.image_cache import ImageCache, ImagePipeline, card_image_url
+    from tcgdex_database_helper.tcgdex_api import TCGdexApi
+
+    card_ids = [row[0] for row in index.query(
+        "SELECT card_id FROM cards WHERE language = 'en' ORDER BY path LIMIT ?", (requests_count,)
+    )]
+    if not card_ids:
+        return
+
+    with StubTCGdexServer(latency_ms=latency_ms) as stub:
+        http = HttpClient(
+            max_retries=0,
+            timeouts={"default": 30},
+            pool_size=concurrency,
+            max_concurrency=concurrency,
+            local_endpoint=stub.endpoint,
+        )
+        sdk = TCGdex("en")
+        sdk.setEndpoint(stub.endpoint)
+        api = TCGdexApi(sdk, http)
+        try:
+            samples = []
+            payloads = []
+            for card_id in card_ids:
+                elapsed, data = timed(api.get_card_data, card_id)
+                samples.append(elapsed)
+                payloads.append(data)
+            results["http.card_sequential"] = summarize(samples, latency_ms=latency_ms)
+
+            def fetch(card_id):
+                return timed(api.get_card_data, card_id)[0]
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                elapsed, samples = timed(lambda: list(executor.map(fetch, card_ids)))
+            results["http.card_concurrent"] = summarize(
+                samples, latency_ms=latency_ms, wall_s=elapsed, per_second=len(card_ids) / elapsed
+            )
+
+            samples = [timed(api.build, Card, data)[0] for data in payloads]
+            results["card.build_model"] = summarize(samples)
+
+            cache_dir = work_dir / "image_cache"
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            pipeline = ImagePipeline(ImageCache(cache_dir, 1024 * 1024 * 1024), concurrency, http)
+            urls = [card_image_url(api.build(Card, data)) for data in payloads[:max(1, len(payloads) // 4)]]
+            try:
+                results["image.fetch_cold"] = summarize([timed(pipeline.load, url)[0] for url in urls], latency_ms=latency_ms)
+                results["image.load_cached"] = summarize([timed(pipeline.load, url)[0] for url in urls])
+                paths = [pipeline.load(url) for url in urls]
+            finally:
+                pipeline.shutdown()
+
+            # Same disk cache, empty memory cache: decoding a blob vs the in-memory LRU
+            pipeline = ImagePipeline(ImageCache(cache_dir, 1024 * 1024 * 1024), 1, http)
+            try:
+                results["image.display_decode"] = summarize([timed(pipeline.display_image, path)[0] for path in paths])
+                results["image.display_memory"] = summarize([timed(pipeline.display_image, path)[0] for path in paths])
+            finally:
+                pipeline.shutdown()
+        finally:
+            http.close()
+# -------------------------------
+
+
+# ---------- COMPARE ----------
+def compare_results(previous: dict, current: dict):
+    # Mean time per benchmark, previous run vs this one
+    print(f"{'benchmark':<28}{'before ms':>12}{'after ms':>12}{'change':>10}")
+    for name, result in current["results"].items():
+        before = previous.get("results", {}).get(name, {}).get("mean_ms")
+        after = result.get("mean_ms")
+        if before is None or after is None:
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        flag = " ⚠️" if change > 10 else ""
+        print(f"{name:<28}{before:>12.3f}{after:>12.3f}{change:>+9.1f}%{flag}")
+# -------------------------------
+
+
+def run_benchmarks(
+    card_count: int = 10000,
+    work_dir: Path = Path("./cache/benchmark"),
+    output: Path | None = None,
+    compare: Path | None = None,
+    seed: int = 0,
+    regenerate: bool = False,
+    workers: int | None = None,
+    skip_http: bool = False,
+    http_requests: int = 200,
+    latency_ms: float = 20.0,
+    http_concurrency: int = 8,
+):
+    work_dir = Path(work_dir)
+    # Not "cards-database", so a work dir next to the real checkout can't point at it
+    db_root = work_dir / "synthetic-cards-database"
+    roots = {"en": db_root / "data", "ja": db_root / "data-asia"}
+
+    print(f"📁 Synthetic database: {card_count} cards in {db_root}", file=sys.stderr)
+    try:
+        elapsed, meta = timed(load_or_generate, db_root, card_count, seed, regenerate)
+    except FileExistsError as e:
+        print(f"⚠️ {e}", file=sys.stderr)
+        return
+    print(f"✅ Ready in {elapsed:.1f}s", file=sys.stderr)
+
+    results = {}
+    steps = [
+        ("census", lambda: bench_census(results, roots, work_dir, workers)),
+        ("scan", lambda: bench_scan(results, index, sample_sets=50)),
+        ("extract", lambda: bench_extract(results, index, sample_files=20000)),
+        ("normalize", lambda: bench_normalize(results, meta["raw_illustrators"], calls=100000)),
+        ("autocomplete", lambda: bench_autocomplete(results, index, keystrokes=5000)),
+        ("save", lambda: bench_save(results, index, saves=200)),
+    ]
+    if not skip_http:
+        steps.append(("http", lambda: bench_http(results, index, work_dir, http_requests, latency_ms, http_concurrency)))
+
+    index = None
+    try:
+        for name, step in steps:
+            print(f"⏱️ {name}…", file=sys.stderr)
+            step()
+            if index is None:
+                # The census step leaves a populated card index behind for the others
+                index = CardIndex(work_dir / "card_index.sqlite3", max_workers=workers)
+    finally:
+        if index is not None:
+            index.close()
+
+    report = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "card_count": card_count,
+            "seed": seed,
+            "database": meta["stats"],
+            "illustrators": meta["illustrators"],
+        },
+        "results": results,
+    }
+
+    if output is None:
+        output = work_dir / f"results-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    for name, result in results.items():
+        if "mean_ms" in result:
+            print(f"{name:<28} mean {result['mean_ms']:10.3f} ms  p95 {result['p95_ms']:10.3f} ms  n={result['samples']}")
+    if compare is not None:
+        with open(compare, "r", encoding="utf-8") as f:
+            compare_results(json.load(f), report)
+    print(f"💾 Results written to: {output}", file=sys.stderr)
@@ -0,0 +1,122 @@
+import re
+import json
+import time
+import threading
+from io import BytesIO
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CARD_PATH_REGEX = re.compile(r"^/v2/(\w+)/cards/([^/?]+)$")
+IMAGE_PATH_REGEX = re.compile(r"^/assets/(\w+)/([^/]+)/([^/]+)/(low|high)\.(png|webp|jpg)$")
+# TCGdex image sizes
+IMAGE_SIZES = {"low": (245, 337), "high": (600, 825)}
+
+
+def card_payload(base_url: str, language: str, card_id: str) -> dict:
+    # Shaped like GET /v2/<lang>/cards/<id>, with every field the SDK's Card model expects
+    set_id, _, local_id = card_id.rpartition("-")
+    return {
+        "id": card_id, "localId": local_id, "name": f"Card {card_id}",
+        "image": f"{base_url}/assets/{language}/{set_id}/{local_id}",
+        "category": "Pokemon", "illustrator": None, "rarity": "Common",
+        "set": {"id": set_id, "name": f"Set {set_id}", "logo": None, "symbol": None, "cardCount": {"total": 250, "official": 250}},
+        "variants": {"normal": True, "reverse": True, "holo": False, "firstEdition": False, "wPromo": False},
+        "dexId": [25], "hp": 60, "types": ["Lightning"], "evolveFrom": None, "description": None, "level": None,
+        "stage": "Basic", "suffix": None, "item": None, "abilities": None,
+        "attacks": [{"cost": ["Lightning"], "name": "Tackle", "effect": None, "damage": 20}],
+        "weaknesses": [{"type": "Fighting", "value": "×2"}], "resistances": None, "retreat": 1,
+        "effect": None, "trainerType": None, "energyType": None, "regulationMark": "G",
+        "legal": {"standard": True, "expanded": True}, "boosters": None,
+    }
+
+
+def render_image(size: tuple[int, int], extension: str) -> bytes:
+    # Noise, so the encoded size is in the range of a real card scan
+    from PIL import Image
+
+    image = Image.effect_noise(size, 48).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format={"jpg": "JPEG"}.get(extension, extension.upper()))
+    return buffer.getvalue()
+
+
+class StubTCGdexServer:
+    # Local stand-in for api.tcgdex.net and assets.tcgdex.net, with a fixed added latency
+    # per request, so fetch timings measure this tool rather than the network.
+
+    def __init__(self, latency_ms: float = 20.0, host: str = "127.0.0.1"):
+        self.latency = latency_ms / 1000
+        self.images: dict[tuple[str, str], bytes] = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, 0), self.handler_class())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name="stub-tcgdex", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def endpoint(self) -> str:
+        # What TCGdex.setEndpoint() / the local endpoint setting expects
+        return f"{self.base_url}/v2"
+
+    def image(self, quality: str, extension: str) -> bytes:
+        with self.lock:
+            key = (quality, extension)
+            if key not in self.images:
+                self.images[key] = render_image(IMAGE_SIZES[quality], extension)
+            return self.images[key]
+
+    def handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this, delayed ACKs add ~40 ms
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests += 1
+                time.sleep(stub.latency)
+
+                card = CARD_PATH_REGEX.match(self.path)
+                image = IMAGE_PATH_REGEX.match(self.path)
+                if card:
+                    body = json.dumps(card_payload(stub.base_url, card.group(1), card.group(2))).encode()
+                    content_type = "application/json"
+                elif image:
+                    body = stub.image(image.group(4), image.group(5))
+                    content_type = f"image/{image.group(5)}"
+                else:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,258 @@
+import os
+import json
+import random
+import shutil
+from itertools import accumulate
+
+from pathlib import Path
+
+# Synthetic cards-database: data/ (en) and data-asia/ (ja) trees laid out like the real one,
+# <root>/<series>.ts, <root>/<series>/<set>.ts and <root>/<series>/<set>/<number>.ts
+
+META_FILE = "synthetic.json"
+
+FIRST_NAMES = [
+    "Ken", "Mitsuhiro", "Atsuko", "Kagemaru", "Yuka", "Saya", "Kouki", "Tomokazu",
+    "Naoyo", "Midori", "Hitoshi", "Sachiko", "Shinji", "Yusuke", "Ryota", "Akira",
+    "Eri", "Miki", "Kazuma", "Hiroki", "Aya", "Taiga", "Sanosuke", "Teeziro",
+]
+LAST_NAMES = [
+    "Sugimori", "Arita", "Nishida", "Himeno", "Morii", "Tsuruta", "Saito", "Komiya",
+    "Kimura", "Harada", "Iguchi", "Adachi", "Ohara", "Kato", "Egawa", "Yamada",
+    "Tanaka", "Ito", "Watanabe", "Nakamura", "Kobayashi", "Sato", "Suzuki", "Takahashi",
+]
+JP_NAMES = [
+    "杉森 建", "有田 満弘", "西田 敦子", "姫野 かげまる", "森井 ユカ", "鶴田 沙也",
+    "さいとうなおき", "こだまゆうき", "ひこの", "たかみね", "まつもとゆう", "あやか",
+]
+# Single-word / studio style credits as they appear in the database
+CREDITS = ["kawayoo", "PLANETA", "5ban Graphics", "Eske Yoshinob", "aky CG Works", "otumami", "313"]
+
+RARITIES = [
+    ("Common", 50), ("Uncommon", 25), ("Rare", 12), ("Rare Holo", 6),
+    ("Double rare", 3), ("Ultra Rare", 2), ("Illustration rare", 1.5), ("Secret Rare", 0.5),
+]
+
+MISSING_FIELD_RATE = 0.07
+EMPTY_FIELD_RATE = 0.03
+# Same illustrator written differently (full-width, extra spaces): what normalize_illustrator is for
+VARIANT_RATE = 0.05
+
+CARD_TEMPLATE = """import {{ Card }} from '../../../interfaces'
+import Set from '../{set_name}'
+
+const card: Card = {{
+	set: Set,
+
+	name: {{
+		{name_lang}: "{name}"
+	}},
+
+{illustrator_line}	rarity: "{rarity}",
+	category: "Pokemon",
+	hp: {hp},
+	types: ["{type}"],
+
+	attacks: [{{
+		cost: ["{type}", "Colorless"],
+		name: {{
+			{name_lang}: "{attack}"
+		}},
+		damage: {damage}
+	}}],
+
+	weaknesses: [{{
+		type: "Fire",
+		value: "×2"
+	}}],
+
+	retreat: {retreat},
+	regulationMark: "{mark}",
+	variants: {{
+		normal: true,
+		reverse: true,
+		holo: false,
+		firstEdition: false
+	}}
+}}
+
+export default card
+"""
+
+SET_TEMPLATE = """import {{ Set }} from '../../interfaces'
+import serie from '../{series}'
+
+const set: Set = {{
+	id: "{set_id}",
+	name: {{
+		{name_lang}: "{set_name}"
+	}},
+	serie: serie,
+	cardCount: {{
+		official: {count}
+	}},
+	releaseDate: "2020-01-01"
+}}
+
+export default set
+"""
+
+SERIES_TEMPLATE = """import {{ Serie }} from '../interfaces'
+
+const serie: Serie = {{
+	id: "{series_id}",
+	name: {{
+		{name_lang}: "{series}"
+	}}
+}}
+
+export default serie
+"""
+
+TYPES = ["Grass", "Fire", "Water", "Lightning", "Psychic", "Fighting", "Darkness", "Metal", "Dragon", "Colorless"]
+POKEMON_EN = ["Bulbasaur", "Charmander", "Squirtle", "Pikachu", "Eevee", "Snorlax", "Gengar", "Lucario", "Greninja", "Mew"]
+POKEMON_JA = ["フシギダネ", "ヒトカゲ", "ゼニガメ", "ピカチュウ", "イーブイ", "カビゴン", "ゲンガー", "ルカリオ", "ゲッコウガ", "ミュウ"]
+
+
+def full_width(text: str) -> str:
+    # ASCII -> full-width forms (NFKC folds them back)
+    return "".join(
+        "　" if c == " " else chr(ord(c) + 0xFEE0) if "!" <= c <= "~" else c
+        for c in text
+    )
+
+
+def build_illustrators(rng: random.Random, count: int) -> list[str]:
+    names = set(CREDITS)
+    while len(names) < count:
+        r = rng.random()
+        if r < 0.7:
+            names.add(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}")
+        elif r < 0.85:
+            names.add(rng.choice(JP_NAMES) + ("" if rng.random() < 0.5 else str(rng.randint(2, 99))))
+        else:
+            # Credited in full-width capitals, as in some Japanese sets
+            names.add(full_width(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}".upper()))
+    names = sorted(names)
+    rng.shuffle(names)
+    return names
+
+
+def messy_variant(rng: random.Random, name: str) -> str:
+    r = rng.random()
+    if r < 0.4:
+        return full_width(name)
+    if r < 0.7:
+        return name.replace(" ", "  ")
+    return f" {name} "
+
+
+def generate_database(root: Path, card_count: int, seed: int = 0, ja_share: float = 0.4) -> dict:
+    # Writes about card_count card files under root/data and root/data-asia, returns the metadata
+    rng = random.Random(seed)
+    root = Path(root)
+    illustrators = build_illustrators(rng, max(50, card_count // 150))
+    # Zipf-like: a few prolific illustrators, a long tail of occasional ones
+    weights = list(accumulate(1 / (rank + 1) ** 1.1 for rank in range(len(illustrators))))
+    rarity_names = [name for name, _ in RARITIES]
+    rarity_weights = list(accumulate(weight for _, weight in RARITIES))
+
+    stats = {"cards": 0, "sets": 0, "series": 0, "missing_field": 0, "empty_field": 0, "variants": 0}
+    raw_illustrators = []
+
+    for language, folder, share in (("en", "data", 1 - ja_share), ("ja", "data-asia", ja_share)):
+        target = int(card_count * share)
+        written = 0
+        series_number = 0
+        name_lang = language
+        pokemon = POKEMON_EN if language == "en" else POKEMON_JA
+        while written < target:
+            series_number += 1
+            series = f"Series {series_number} & Friends" if series_number % 3 == 0 else f"Series {series_number}"
+            series_path = root / folder / series
+            series_path.mkdir(parents=True, exist_ok=True)
+            (root / folder / f"{series}.ts").write_text(
+                SERIES_TEMPLATE.format(series=series, series_id=f"s{series_number}", name_lang=name_lang),
+                encoding="utf-8",
+            )
+            stats["series"] += 1
+
+            for set_number in range(1, rng.randint(8, 20) + 1):
+                if written >= target:
+                    break
+                set_id = f"s{series_number}-{set_number}"
+                # data-asia folders are named by set id, data/ ones by set name
+                set_name = set_id if language == "ja" else f"Set {series_number}-{set_number}"
+                count = min(rng.randint(60, 250), target - written)
+                set_path = series_path / set_name
+                set_path.mkdir(exist_ok=True)
+                (series_path / f"{set_name}.ts").write_text(
+                    SET_TEMPLATE.format(series=series, set_id=set_id, set_name=set_name, count=count, name_lang=name_lang),
+                    encoding="utf-8",
+                )
+                stats["sets"] += 1
+
+                for number in range(1, count + 1):
+                    r = rng.random()
+                    if r < MISSING_FIELD_RATE:
+                        illustrator_line = ""
+                        stats["missing_field"] += 1
+                    elif r < MISSING_FIELD_RATE + EMPTY_FIELD_RATE:
+                        illustrator_line = '\tillustrator: "",\n'
+                        stats["empty_field"] += 1
+                    else:
+                        name = rng.choices(illustrators, cum_weights=weights)[0]
+                        if rng.random() < VARIANT_RATE:
+                            name = messy_variant(rng, name)
+                            stats["variants"] += 1
+                        raw_illustrators.append(name)
+                        illustrator_line = f'\tillustrator: "{name}",\n'
+
+                    content = CARD_TEMPLATE.format(
+                        set_name=set_name,
+                        name_lang=name_lang,
+                        name=rng.choice(pokemon),
+                        illustrator_line=illustrator_line,
+                        rarity=rng.choices(rarity_names, cum_weights=rarity_weights)[0],
+                        hp=rng.randrange(30, 340, 10),
+                        type=rng.choice(TYPES),
+                        attack="Tackle",
+                        damage=rng.randrange(10, 300, 10),
+                        retreat=rng.randint(0, 4),
+                        mark=rng.choice("DEFGH"),
+                    )
+                    with open(set_path / f"{number}.ts", "w", encoding="utf-8") as f:
+                        f.write(content)
+                written += count
+        stats["cards"] += written
+
+    meta = {
+        "card_count": card_count,
+        "seed": seed,
+        "ja_share": ja_share,
+        "illustrators": len(illustrators),
+        "stats": stats,
+        # Sample of raw (unnormalized) field values for the normalization / autocomplete benchmarks
+        "raw_illustrators": raw_illustrators[:20000],
+    }
+    with open(root / META_FILE, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    return meta
+
+
+def load_or_generate(root: Path, card_count: int, seed: int = 0, regenerate: bool = False) -> dict:
+    # Reuse a previous tree generated with the same parameters
+    meta_path = Path(root) / META_FILE
+    if meta_path.exists() and not regenerate:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("card_count") == card_count and meta.get("seed") == seed:
+            return meta
+
+    if Path(root).exists():
+        # Only ever delete a tree this module generated: the work dir could hold a real cards-database
+        if not meta_path.exists() and any(Path(root).iterdir()):
+            raise FileExistsError(f"{root} exists and is not a synthetic database ({META_FILE} missing), refusing to replace it")
+        shutil.rmtree(root)
+    os.makedirs(root, exist_ok=True)
+    return generate_database(root, card_count, seed)
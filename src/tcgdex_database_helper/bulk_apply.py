@@ -0,0 +1,177 @@
+import os
+import sys
+import csv
+import json
+import difflib
+from concurrent.futures import ThreadPoolExecutor
+
+from pathlib import Path
+
+from tcgdex_database_helper.card_files import atomic_write, set_illustrator
+from tcgdex_database_helper.card_index import CardIndex
+from tcgdex_database_helper.normalization import canonical_illustrator
+
+# ---------- CONFIG (initialized from main) ----------
+DATABASE_ROOT_EN: Path | None = None
+DATABASE_ROOT_JA: Path | None = None
+CARD_INDEX_PATH: Path | None = None
+# -----------------------------------------------
+
+
+def configure_bulk_apply(
+    database_root_en: Path,
+    database_root_ja: Path,
+    card_index_path: Path,
+):
+    global DATABASE_ROOT_EN, DATABASE_ROOT_JA, CARD_INDEX_PATH
+    DATABASE_ROOT_EN = database_root_en
+    DATABASE_ROOT_JA = database_root_ja
+    CARD_INDEX_PATH = card_index_path
+
+
+# ---------- MAPPING ----------
+def normalize_key(key: str) -> str:
+    # "Card ID" (scan CSV header) / "card_id" / "cardId" -> "card_id"
+    key = key.strip().replace(" ", "_").lower()
+    return "card_id" if key == "cardid" else key
+
+
+def read_mapping(mapping_path: Path) -> list[dict]:
+    # CSV with a header, or JSON Lines; each entry needs an illustrator and a card id or path
+    rows = []
+    with open(mapping_path, "r", encoding="utf-8", newline="") as f:
+        if mapping_path.suffix.lower() == ".csv":
+            rows = [{normalize_key(k): v for k, v in row.items() if k} for row in csv.DictReader(f)]
+        else:
+            for line in f:
+                if line.strip():
+                    rows.append({normalize_key(k): v for k, v in json.loads(line).items()})
+
+    entries = []
+    for number, row in enumerate(rows, start=1):
+        entries.append({
+            "entry": number,
+            "card_id": (row.get("card_id") or "").strip() or None,
+            "path": (row.get("path") or "").strip() or None,
+            "illustrator": row.get("illustrator") or "",
+        })
+    return entries
+
+
+def build_card_id_map(language: str, max_workers: int | None) -> dict[str, str]:
+    roots = {"en": DATABASE_ROOT_EN, "ja": DATABASE_ROOT_JA}
+    languages = ["en", "ja"] if language == "all" else [language]
+    roots = {lang: roots[lang] for lang in languages if roots[lang] is not None and roots[lang].exists()}
+
+    index = CardIndex(CARD_INDEX_PATH, max_workers=max_workers)
+    try:
+        index.refresh(roots)
+        return index.card_paths(list(roots))
+    finally:
+        index.close()
+# -------------------------------
+
+
+# ---------- EDITS ----------
+def plan_edit(path: str, illustrator: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception as e:
+        return {"path": path, "status": "error", "error": str(e)}
+
+    new_content = set_illustrator(content, illustrator)
+    if new_content is None:
+        return {"path": path, "status": "error", "error": "Could not locate rarity field"}
+    if new_content == content:
+        return {"path": path, "status": "unchanged"}
+    return {"path": path, "status": "pending", "old": content, "new": new_content}
+
+
+def write_edit(plan: dict) -> dict:
+    try:
+        atomic_write(plan["path"], plan["new"])
+    except Exception as e:
+        return {"path": plan["path"], "status": "error", "error": str(e)}
+    return {"path": plan["path"], "status": "applied"}
+
+
+def unified_diff(plan: dict) -> str:
+    # Paths relative to the cards-database clone, so the diff can be fed to `git apply` there
+    root = DATABASE_ROOT_EN or DATABASE_ROOT_JA
+    path = plan["path"]
+    if root is not None:
+        path = os.path.relpath(path, root.parent).replace(os.sep, "/")
+    return "".join(difflib.unified_diff(
+        plan["old"].splitlines(keepends=True),
+        plan["new"].splitlines(keepends=True),
+        fromfile=f"a/{path}",
+        tofile=f"b/{path}",
+    ))
+# -------------------------------
+
+
+def run_bulk_apply(
+    mapping_path: Path,
+    dry_run: bool = False,
+    output: Path | None = None,
+    language: str = "all",
+    max_workers: int | None = None,
+):
+    entries = read_mapping(mapping_path)
+
+    card_paths = {}
+    if any(entry["path"] is None for entry in entries):
+        card_paths = build_card_id_map(language, max_workers)
+
+    # path -> illustrator; a later entry for the same card wins
+    edits: dict[str, str] = {}
+    skipped = 0
+    for entry in entries:
+        illustrator = canonical_illustrator(entry["illustrator"])
+        path = entry["path"] or card_paths.get(entry["card_id"])
+        if not illustrator or '"' in illustrator:
+            print(f"⚠️ Entry {entry['entry']}: invalid illustrator {entry['illustrator']!r}", file=sys.stderr)
+            skipped += 1
+            continue
+        if path is None:
+            print(f"⚠️ Entry {entry['entry']}: card {entry['card_id']} not found", file=sys.stderr)
+            skipped += 1
+            continue
+        if path in edits:
+            print(f"⚠️ Entry {entry['entry']}: {path} listed more than once, last entry wins", file=sys.stderr)
+        edits[path] = illustrator
+
+    # Read and edit everything in memory first, then write the changed files in one pass
+    with ThreadPoolExecutor(max_workers=max_workers or None) as executor:
+        plans = list(executor.map(lambda item: plan_edit(*item), edits.items()))
+
+        pending = [plan for plan in plans if plan["status"] == "pending"]
+        if dry_run:
+            results = plans
+        else:
+            written = iter(executor.map(write_edit, pending))
+            results = [next(written) if plan["status"] == "pending" else plan for plan in plans]
+
+    if dry_run:
+        stream = open(output, "w", encoding="utf-8") if output is not None else sys.stdout
+        try:
+            for plan in pending:
+                stream.write(unified_diff(plan))
+        finally:
+            if output is not None:
+                stream.close()
+
+    for result in results:
+        if result["status"] == "error":
+            print(f"⚠️ {result['path']}: {result['error']}", file=sys.stderr)
+
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("pending", "applied", "unchanged", "error")}
+    print("✅ Dry run, nothing written" if dry_run else "✅ Done", file=sys.stderr)
+    print(f"📄 Mapping entries: {len(entries)} ({skipped} skipped)", file=sys.stderr)
+    if dry_run:
+        print(f"📝 Files that would change: {counts['pending']}", file=sys.stderr)
+    else:
+        print(f"💾 Files updated: {counts['applied']}", file=sys.stderr)
+    print(f"➖ Already up to date: {counts['unchanged']}", file=sys.stderr)
+    print(f"❌ Errors: {counts['error']}", file=sys.stderr)
@@ -0,0 +1,182 @@
+import os
+import re
+
+from tcgdex_database_helper.normalization import normalize_illustrator
+
+# Helpers over the raw .ts card files of the cards-database; no GUI imports here,
+# so headless tools can share them with the editor.
+
+SET_ID_REGEX = re.compile(r"\bid\s*:\s*['\"](.+?)['\"]")
+# Indentation is [ \t]* so a blank line above the field is never taken for indentation
+RARITY_LINE_REGEX = re.compile(r"^([ \t]*)rarity\s*:", re.MULTILINE)
+ILLUSTRATOR_FIELD_REGEX = re.compile(r"^([ \t]*)illustrator\s*:\s*['\"].*?['\"],?", re.MULTILINE)
+ILLUSTRATOR_KEY_REGEX = re.compile(r"illustrator\s*:")
+EMPTY_ILLUSTRATOR_REGEX = re.compile(r"illustrator\s*:\s*['\"]\s*['\"]")
+CARD_ID_REGEX = re.compile(r"id\s*:\s*['\"](.+?)['\"]")
+
+# Fields pulled from the raw bytes in one pass: each key is located with bytes.find,
+# then its `: "value"` / `: { lang: "value", ... }` is matched in place.
+# Only the captured values get decoded. Callers pass the bytes they already read
+# (the card index hashes the same buffer), so a file is read once.
+FIELD_KEYS = (b"id", b"illustrator", b"rarity", b"name")
+FIELD_VALUE_REGEX = re.compile(rb"\s*:\s*(?:(['\"])(.*?)\1|\{([^{}]*)\})?")
+LOCALIZED_REGEX = re.compile(rb"(\w+)\s*:\s*(['\"])(.*?)\2")
+# The census always matched the illustrator key in any case. Card files spell it in
+# lowercase, which bytes.find handles; this only runs when that spelling isn't there.
+ILLUSTRATOR_ANY_CASE_REGEX = re.compile(rb"(?<![A-Za-z0-9_])illustrator(?=\s*:)", re.IGNORECASE)
+
+
+def missing_illustrator(content):
+    return not ILLUSTRATOR_KEY_REGEX.search(content) or EMPTY_ILLUSTRATOR_REGEX.search(content)
+
+
+def extract_card_id(content, set_id, filename):
+    match = CARD_ID_REGEX.search(content)
+    return match.group(1) if match else f"{set_id}-{filename.replace('.ts','')}"
+
+
+def find_field(raw: bytes, key: bytes):
+    # First `key:` that is a whole word (so "id" never matches inside "Squid:")
+    pos = raw.find(key)
+    while pos != -1:
+        if pos == 0 or not (raw[pos - 1:pos].isalnum() or raw[pos - 1] == 95):  # 95: "_"
+            match = FIELD_VALUE_REGEX.match(raw, pos + len(key))
+            if match:
+                return match
+        pos = raw.find(key, pos + len(key))
+    return None
+
+
+def field_value(match) -> str | None:
+    value = match.group(2) if match is not None else None
+    return value.decode("utf-8", errors="replace") if value is not None else None
+
+
+def extract_card_fields(raw: bytes) -> dict:
+    # id / illustrator / rarity as raw strings (None if absent), name as {lang: name};
+    # missing: no illustrator key, or an empty one (same rule as missing_illustrator)
+    card_id, illustrator, rarity, name = (find_field(raw, key) for key in FIELD_KEYS)
+    if illustrator is None:
+        key = ILLUSTRATOR_ANY_CASE_REGEX.search(raw)
+        if key is not None:
+            illustrator = FIELD_VALUE_REGEX.match(raw, key.end())
+    illustrator_value = field_value(illustrator)
+
+    names = {}
+    if name is not None and name.group(3) is not None:
+        names = {
+            lang.decode(): value.decode("utf-8", errors="replace")
+            for lang, _, value in LOCALIZED_REGEX.findall(name.group(3))
+        }
+
+    return {
+        "id": field_value(card_id),
+        "illustrator": illustrator_value,
+        "rarity": field_value(rarity),
+        "name": names,
+        "missing": illustrator is None or (illustrator_value is not None and not illustrator_value.strip()),
+    }
+
+
+def localized_name(names: dict, language: str) -> str | None:
+    return names.get(language) or next(iter(names.values()), None)
+
+
+def parse_card(raw: bytes, set_id, filename, language=None):
+    # (card id, normalized illustrator or None, rarity or None, missing illustrator?, localized name or None)
+    fields = extract_card_fields(raw)
+    illustrator = fields["illustrator"]
+    return (
+        fields["id"] or f"{set_id}-{filename.replace('.ts','')}",
+        normalize_illustrator(illustrator) or None if illustrator is not None else None,
+        fields["rarity"],
+        fields["missing"],
+        localized_name(fields["name"], language),
+    )
+
+
+def card_sort_key(filename):
+    # Numbered cards in numeric order, everything else after them
+    stem = filename.split(".")[0]
+    return int(stem) if stem.isdigit() else float("inf")
+
+
+def list_card_files(set_path):
+    return sorted(
+        (name for name in os.listdir(set_path) if name.endswith(".ts")),
+        key=card_sort_key,
+    )
+
+
+def read_set_id(series_path, set_name):
+    # data/<Series>/<Set>.ts declares the set id; data-asia folders are already named by id
+    set_file = os.path.join(series_path, f"{set_name}.ts")
+    if os.path.isfile(set_file):
+        with open(set_file, "r", encoding="utf-8") as f:
+            match = SET_ID_REGEX.search(f.read())
+        if match:
+            return match.group(1)
+    return set_name
+
+
+def iter_set_dirs(root):
+    # Yield (series, set, path) for every <root>/<series>/<set>/ folder
+    for series in sorted(os.listdir(root)):
+        series_path = os.path.join(root, series)
+        if not os.path.isdir(series_path):
+            continue
+        for set_name in sorted(os.listdir(series_path)):
+            set_path = os.path.join(series_path, set_name)
+            if os.path.isdir(set_path):
+                yield series, set_name, set_path
+
+
+def set_illustrator(content, illustrator):
+    # Returns the edited file content, or None when there is no rarity field to anchor on
+
+    # 1️⃣ Locate rarity and indentation
+    rarity_match = RARITY_LINE_REGEX.search(content)
+    if not rarity_match:
+        return None
+
+    indent = rarity_match.group(1)
+
+    # 2️⃣ If illustrator already exists → overwrite it (keeping its indentation)
+    if ILLUSTRATOR_FIELD_REGEX.search(content):
+        return ILLUSTRATOR_FIELD_REGEX.sub(
+            lambda m: f'{m.group(1)}illustrator: "{illustrator}",',
+            content,
+            count=1
+        )
+
+    # 3️⃣ Otherwise → insert illustrator on the line before rarity
+    start = rarity_match.start()
+    return f'{content[:start]}{indent}illustrator: "{illustrator}",\n{content[start:]}'
+
+
+def atomic_write(path, content):
+    # Temp file in the same folder, fsync, then rename over the original:
+    # a crash leaves either the old or the new file, never a truncated one
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
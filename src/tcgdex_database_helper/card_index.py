@@ -0,0 +1,273 @@
+import os
+import sys
+import sqlite3
+import hashlib
+import threading
+
+from pathlib import Path
+
+from tcgdex_database_helper.metrics import incr, span
+from tcgdex_database_helper.card_files import (
+    card_sort_key,
+    iter_set_dirs,
+    list_card_files,
+    parse_card,
+    read_set_id,
+)
+
+# Below this many changed files the process pool costs more than it saves
+PARALLEL_THRESHOLD = 256
+
+# Bumped when the stored fields or the way they are parsed change; the index is rebuilt once
+SCHEMA_VERSION = 3
+
+COLUMNS = (
+    "path", "language", "series", "set_name", "set_id", "local_id",
+    "card_id", "name", "illustrator", "rarity", "missing", "mtime_ns", "size", "sha1",
+)
+
+
+def parse_card_file(job: tuple) -> tuple:
+    # Runs in the worker processes: must stay a top-level, picklable function.
+    path, language, set_id, filename, previous = job
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except Exception as e:
+        print(f"⚠️ Could not read {path}: {e}", file=sys.stderr)
+        return path, None
+
+    digest = hashlib.sha1(raw).hexdigest()
+    if previous is not None and previous[0] == digest:
+        # Touched but unchanged (e.g. git checkout) -> keep the previous result
+        return path, previous
+
+    return path, (digest, *parse_card(raw, set_id, filename, language))
+
+
+# ---------- CARD INDEX ----------
+class CardIndex:
+    # Persistent SQLite index of the card files of both databases:
+    # one row per <root>/<series>/<set>/<card>.ts with the parsed fields.
+    # refresh() only re-parses files whose mtime or size changed since the last run.
+
+    def __init__(self, db_path: Path, max_workers: int | None = None):
+        self.db_path = Path(db_path)
+        # 0 / None -> let the executor use os.cpu_count()
+        self.max_workers = max_workers or None
+        self.lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS cards")
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cards (
+                    path        TEXT PRIMARY KEY,
+                    language    TEXT NOT NULL,
+                    series      TEXT NOT NULL,
+                    set_name    TEXT NOT NULL,
+                    set_id      TEXT NOT NULL,
+                    local_id    TEXT NOT NULL,
+                    card_id     TEXT NOT NULL,
+                    name        TEXT,
+                    illustrator TEXT,
+                    rarity      TEXT,
+                    missing     INTEGER NOT NULL,
+                    mtime_ns    INTEGER NOT NULL,
+                    size        INTEGER NOT NULL,
+                    sha1        TEXT NOT NULL
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS cards_set ON cards (language, series, set_name)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS cards_card_id ON cards (card_id)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS cards_illustrator ON cards (illustrator)")
+            self.conn.commit()
+
+    # ---------- REFRESH ----------
+    def refresh(self, roots: dict[str, Path | None]) -> dict:
+        # Bring every set under the given {language: root} up to date
+        sets = []
+        for language, root in roots.items():
+            if root is None or not Path(root).exists():
+                continue
+            for series, set_name, set_path in iter_set_dirs(os.path.abspath(root)):
+                sets.append((language, series, set_name, set_path))
+        return self.refresh_sets(sets, languages=[language for language, root in roots.items() if root is not None])
+
+    @staticmethod
+    def set_key(language: str, set_path: str) -> tuple[str, str, str]:
+        # <root>/<series>/<set> -> (language, series, set) as stored in the index
+        series_path, set_name = os.path.split(os.path.abspath(set_path))
+        return language, os.path.basename(series_path), set_name
+
+    def refresh_set(self, language: str, set_path: str) -> dict:
+        key = self.set_key(language, set_path)
+        sets = [(*key, os.path.abspath(set_path))] if os.path.isdir(set_path) else []
+        return self.refresh_sets(sets, scope=key)
+
+    def refresh_sets(self, sets: list[tuple], languages: list[str] | None = None, scope: tuple | None = None) -> dict:
+        # Rows of the refreshed scope that are no longer on disk get dropped
+        if scope is not None:
+            where, params = "language = ? AND series = ? AND set_name = ?", scope
+        else:
+            languages = languages or []
+            where, params = f"language IN ({','.join('?' * len(languages))})", languages
+
+        with self.lock:
+            existing = {
+                row[0]: row[1:]
+                for row in self.conn.execute(
+                    f"SELECT path, set_id, mtime_ns, size, sha1, card_id, illustrator, rarity, missing, name FROM cards WHERE {where}",
+                    params,
+                )
+            }
+
+        rows = {}
+        jobs = []
+        unchanged = 0
+        with span("index.walk"):
+            for language, series, set_name, set_path in sets:
+                set_id = read_set_id(os.path.dirname(set_path), set_name)
+                for file in list_card_files(set_path):
+                    path = os.path.join(set_path, file)
+                    try:
+                        st = os.stat(path)
+                    except OSError as e:
+                        print(f"⚠️ Could not read {path}: {e}", file=sys.stderr)
+                        continue
+
+                    rows[path] = [path, language, series, set_name, set_id, file[:-3], None, None, None, None, None, st.st_mtime_ns, st.st_size, None]
+                    previous = existing.get(path)
+                    if previous is not None and previous[0] == set_id and previous[1:3] == (st.st_mtime_ns, st.st_size):
+                        unchanged += 1
+                        continue
+                    jobs.append((path, language, set_id, file, previous[3:] if previous is not None and previous[0] == set_id else None))
+
+        with span("index.parse"):
+            if len(jobs) >= PARALLEL_THRESHOLD:
+                # multiprocessing is only imported when a refresh is big enough to use it
+                from concurrent.futures import ProcessPoolExecutor
+
+                chunksize = max(1, len(jobs) // ((self.max_workers or os.cpu_count() or 1) * 8))
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    parsed = list(executor.map(parse_card_file, jobs, chunksize=chunksize))
+            else:
+                parsed = [parse_card_file(job) for job in jobs]
+        incr("index.files", len(rows))
+        incr("index.parsed", len(jobs))
+
+        updates = []
+        # (path, old illustrator, new illustrator) for every file whose illustrator changed
+        changes = []
+        for path, result in parsed:
+            if result is None:
+                continue
+            digest, card_id, illustrator, rarity, missing, name = result
+            row = rows[path]
+            row[6:11] = [card_id, name, illustrator, rarity, int(missing)]
+            row[13] = digest
+            updates.append(tuple(row))
+            previous = existing.get(path)
+            old_illustrator = previous[5] if previous is not None else None
+            if old_illustrator != illustrator:
+                changes.append((path, old_illustrator, illustrator))
+
+        removed = [path for path in existing if path not in rows]
+        changes.extend((path, existing[path][5], None) for path in removed if existing[path][5] is not None)
+        with self.lock, span("index.write"):
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO cards ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                updates,
+            )
+            self.conn.executemany("DELETE FROM cards WHERE path = ?", [(path,) for path in removed])
+            self.conn.commit()
+
+        return {
+            "files": unchanged + len(updates),
+            "parsed": len(jobs),
+            "removed": len(removed),
+            "changes": changes,
+        }
+    # -------------------------------
+
+    # ---------- QUERIES ----------
+    def query(self, sql: str, params=()) -> list[tuple]:
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def count(self, languages: list[str] | None = None) -> int:
+        if languages is None:
+            return self.query("SELECT COUNT(*) FROM cards")[0][0]
+        return self.query(
+            f"SELECT COUNT(*) FROM cards WHERE language IN ({','.join('?' * len(languages))})",
+            languages,
+        )[0][0]
+
+    def illustrators(self) -> list[str]:
+        # Illustrator of every card that has one, in (language, path) order
+        return [row[0] for row in self.query(
+            "SELECT illustrator FROM cards WHERE illustrator IS NOT NULL AND illustrator != '' ORDER BY language, path"
+        )]
+
+    def shared_card_illustrators(self) -> list[tuple[str, str, int]]:
+        # (en illustrator, ja illustrator, cards) over the card ids in both databases
+        return self.query(
+            """
+            SELECT en.illustrator, ja.illustrator, COUNT(*)
+            FROM cards en JOIN cards ja ON ja.card_id = en.card_id AND ja.language = 'ja'
+            WHERE en.language = 'en' AND en.illustrator != '' AND ja.illustrator != ''
+            GROUP BY en.illustrator, ja.illustrator
+            """
+        )
+
+    def set_summaries(self, languages: list[str]) -> list[tuple]:
+        # (language, series, set, set id, cards, missing) per set, in folder order
+        return self.query(
+            f"""
+            SELECT language, series, set_name, MIN(set_id), COUNT(*), SUM(missing)
+            FROM cards WHERE language IN ({','.join('?' * len(languages))})
+            GROUP BY language, series, set_name
+            ORDER BY language, series, set_name
+            """,
+            languages,
+        )
+
+    def missing_in_set(self, language: str, series: str, set_name: str) -> list[tuple[str, str]]:
+        # (path, card id) of the set's cards missing an illustrator, in card order
+        rows = self.query(
+            "SELECT path, card_id FROM cards WHERE language = ? AND series = ? AND set_name = ? AND missing = 1",
+            (language, series, set_name),
+        )
+        return sorted(rows, key=lambda row: card_sort_key(os.path.basename(row[0])))
+
+    def card_preview(self, path: str) -> dict | None:
+        # What the card file itself says, for showing a card before (or without) the API
+        rows = self.query(
+            "SELECT card_id, name, local_id, rarity, set_name, series FROM cards WHERE path = ?",
+            (os.path.abspath(path),),
+        )
+        if not rows:
+            return None
+        return dict(zip(("card_id", "name", "local_id", "rarity", "set_name", "series"), rows[0]))
+
+    def card_paths(self, languages: list[str]) -> dict[str, str]:
+        # card id -> path; the first language listed wins when both databases have the id
+        card_paths = {}
+        for card_id, path in self.query(
+            f"SELECT card_id, path FROM cards WHERE language IN ({','.join('?' * len(languages))}) ORDER BY language, path",
+            languages,
+        ):
+            card_paths.setdefault(card_id, path)
+        return card_paths
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+    # -------------------------------
+# -------------------------------
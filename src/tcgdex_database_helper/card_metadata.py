@@ -0,0 +1,141 @@
+import json
+import time
+import sqlite3
+import asyncio
+import threading
+
+from pathlib import Path
+
+from tcgdexsdk.models.Card import Card
+
+from tcgdex_database_helper.metrics import incr, span
+from tcgdex_database_helper.tcgdex_api import TCGdexApi
+
+
+# ---------- LOCAL CACHE ----------
+class CardCache:
+    # SQLite cache of raw card payloads keyed by (language, card id), with a TTL.
+
+    def __init__(self, db_path: Path, ttl_seconds: int):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cards (
+                    language   TEXT NOT NULL,
+                    card_id    TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    payload    TEXT NOT NULL,
+                    PRIMARY KEY (language, card_id)
+                )
+                """
+            )
+            self.conn.commit()
+
+    def get(self, language: str, card_id: str) -> dict | None:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT fetched_at, payload FROM cards WHERE language = ? AND card_id = ?",
+                (language, card_id),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, payload = row
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+        return json.loads(payload)
+
+    def put(self, language: str, card_id: str, data: dict):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cards (language, card_id, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                (language, card_id, time.time(), json.dumps(data, ensure_ascii=False)),
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+# -------------------------------
+
+
+# ---------- METADATA SERVICE ----------
+class CardMetadataService:
+    # Card lookups for the editor: served from the local cache when fresh,
+    # otherwise fetched from the TCGdex API (public or local endpoint).
+
+    def __init__(self, api: TCGdexApi, cache: CardCache, concurrency: int):
+        self.api = api
+        self.cache = cache
+        self.concurrency = concurrency
+        # card_id -> Card, so repeated lookups skip even the JSON decode
+        self.cards: dict[str, Card] = {}
+        # card_id -> running fetch, so concurrent lookups share one request
+        self.in_flight: dict[str, asyncio.Future] = {}
+
+    @property
+    def language(self) -> str:
+        return self.api.language
+
+    def build_card(self, data: dict) -> Card:
+        return self.api.build(Card, data)
+
+    def get_cached(self, card_id: str) -> Card | None:
+        card = self.cards.get(card_id)
+        if card is not None:
+            incr("card_cache.hits")
+            return card
+        data = self.cache.get(self.language, card_id)
+        if data is None:
+            return None
+        incr("card_cache.hits")
+        card = self.build_card(data)
+        self.cards[card_id] = card
+        return card
+
+    def get(self, card_id: str) -> Card:
+        card = self.get_cached(card_id)
+        if card is not None:
+            return card
+        # Counted here rather than in get_cached(), which callers may try first
+        incr("card_cache.misses")
+        with span("card_fetch"):
+            data = self.api.get_card_data(card_id)
+        self.cache.put(self.language, card_id, data)
+        card = self.build_card(data)
+        self.cards[card_id] = card
+        return card
+
+    async def get_async(self, card_id: str) -> Card:
+        card = self.cards.get(card_id)
+        if card is not None:
+            return card
+        task = self.in_flight.get(card_id)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(self.get, card_id))
+            self.in_flight[card_id] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(card_id, None))
+        # A cancelled waiter must not cancel the fetch other waiters share
+        return await asyncio.shield(task)
+
+    async def fetch_many(self, card_ids: list[str]) -> dict[str, Card | Exception]:
+        # Fetch every card not already cached, at most `concurrency` requests at a time
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_one(card_id):
+            async with semaphore:
+                try:
+                    return card_id, await self.get_async(card_id)
+                except Exception as e:
+                    print(f"⚠️ Could not fetch card {card_id}: {e}")
+                    return card_id, e
+
+        results = await asyncio.gather(*(fetch_one(card_id) for card_id in card_ids))
+        return dict(results)
+# -------------------------------
@@ -1,5 +1,6 @@
 from pathlib import Path
-import yaml
+
+from tcgdex_database_helper.metrics import timed
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 
@@ -9,6 +10,7 @@ LOCAL_CONFIG = CONFIG_DIR / "config.local.yaml"
 LANGUAGE = "en"
 NO_SSL_VERIFY = False
 IS_LOCAL_ENDPOINT = False
+OFFLINE = False
 
 def set_language(lang: str):
     global LANGUAGE
@@ -31,23 +33,48 @@ def set_is_local_endpoint(is_local: bool):
 def get_is_local_endpoint() -> bool:
     return IS_LOCAL_ENDPOINT
 
-def load_config() -> dict:
-    print("Loading configs...")
-    print("Default path:", DEFAULT_CONFIG, "Exists:", DEFAULT_CONFIG.exists())
-    print("Local path:", LOCAL_CONFIG, "Exists:", LOCAL_CONFIG.exists())
+def set_offline(offline: bool):
+    global OFFLINE
+    OFFLINE = offline
+
+def get_offline() -> bool:
+    return OFFLINE
+
+@timed("load_config")
+def load_config(quiet: bool = False) -> dict:
+    # quiet: headless commands keep stdout for their own output
+    if not quiet:
+        print("Loading configs...")
+        print("Default path:", DEFAULT_CONFIG, "Exists:", DEFAULT_CONFIG.exists())
+        print("Local path:", LOCAL_CONFIG, "Exists:", LOCAL_CONFIG.exists())
+
+    # Imported here so commands that never read the config (bench, --help) skip it
+    import yaml
 
+    # libyaml's loader when PyYAML was built with it, same result and much faster
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     config = {}
 
     if DEFAULT_CONFIG.exists():
         with DEFAULT_CONFIG.open() as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=loader) or {}
 
     if LOCAL_CONFIG.exists():
         with LOCAL_CONFIG.open() as f:
-            local = yaml.safe_load(f) or {}
+            local = yaml.load(f, Loader=loader) or {}
         deep_merge(config, local)
 
-    return resolve_paths(config)
+    config = resolve_paths(config)
+
+    # Aliases written by the dedupe command (exact equivalences and accepted proposals;
+    # pending proposals live in another file and are never loaded). The config's own entries win
+    aliases_file = config["paths"].get("illustrator_aliases_file")
+    if aliases_file is not None and aliases_file.exists():
+        with aliases_file.open(encoding="utf-8") as f:
+            generated = yaml.load(f, Loader=loader) or {}
+        config["illustrator_aliases"] = {**generated, **(config.get("illustrator_aliases") or {})}
+
+    return config
 
 
 def deep_merge(base: dict, override: dict):
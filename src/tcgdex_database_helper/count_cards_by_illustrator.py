@@ -1,45 +1,39 @@
 import os
-import re
 import csv
-import unicodedata
+import time
 
 from collections import Counter
 
 from pathlib import Path
 
+from tcgdex_database_helper.card_files import extract_card_fields
+from tcgdex_database_helper.normalization import canonical_illustrator, normalize_illustrator
+from tcgdex_database_helper.card_index import CardIndex
+from tcgdex_database_helper.metrics import rate, timed
+
 # ---------- CONFIG (initialized from main) ----------
 DATABASE_ROOT_EN: Path | None = None
 DATABASE_ROOT_JA: Path | None = None
 OUTPUT_CSV: Path | None = None
+CARD_INDEX_PATH: Path | None = None
+MAX_WORKERS: int | None = None
 # -----------------------------------------------
 
 
-ILLUSTRATOR_REGEX = re.compile(
-    r"illustrator\s*:\s*['\"](.+?)['\"]",
-    re.IGNORECASE
-)
-
 def configure_count_cards_by_illustrator(
     database_root_en: Path,
     database_root_ja: Path,
     illustrator_csv: Path,
+    card_index_path: Path,
+    max_workers: int | None = None,
 ):
-    global DATABASE_ROOT_EN, DATABASE_ROOT_JA, OUTPUT_CSV
+    global DATABASE_ROOT_EN, DATABASE_ROOT_JA, OUTPUT_CSV, CARD_INDEX_PATH, MAX_WORKERS
     DATABASE_ROOT_EN = database_root_en
     DATABASE_ROOT_JA = database_root_ja
     OUTPUT_CSV = illustrator_csv
-
-def normalize_illustrator(name: str) -> str:
-    # Normalize unicode (important for JP / full-width chars)
-    name = unicodedata.normalize("NFKC", name)
-
-    # Strip leading/trailing whitespace
-    name = name.strip()
-
-    # Collapse multiple spaces into one
-    name = re.sub(r"\s+", " ", name)
-
-    return name
+    CARD_INDEX_PATH = card_index_path
+    # 0 / None -> let the executor use os.cpu_count()
+    MAX_WORKERS = max_workers or None
 
 def iter_ts_files(root: str):
     #Yield full paths to all .ts files under root.
@@ -51,60 +45,75 @@ def iter_ts_files(root: str):
 
 def extract_illustrator(file_path: str) -> str | None:
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        with open(file_path, "rb") as f:
+            illustrator = extract_card_fields(f.read())["illustrator"]
     except Exception as e:
         print(f"⚠️ Could not read {file_path}: {e}")
         return None
 
-    match = ILLUSTRATOR_REGEX.search(content)
-    if not match:
+    if not illustrator:
         return None
 
-    return normalize_illustrator(match.group(1))
+    return normalize_illustrator(illustrator)
 
 
-def run_count_cards_by_illustrator():
+def open_card_index() -> CardIndex:
+    assert CARD_INDEX_PATH is not None, "Module not configured"
+    return CardIndex(CARD_INDEX_PATH, max_workers=MAX_WORKERS)
+
+
+def database_roots() -> dict:
+    return {"en": DATABASE_ROOT_EN, "ja": DATABASE_ROOT_JA}
+
+
+def count_illustrators(index: CardIndex) -> Counter:
     counter = Counter()
-    total_files = 0
-    with_illustrator = 0
+    for illustrator in index.illustrators():
+        counter[canonical_illustrator(illustrator)] += 1
+    return counter
 
-    ##LOAD GLOBALS
-    assert DATABASE_ROOT_EN is not None, "Module not configured"
-    assert OUTPUT_CSV is not None, "Module not configured"
-    
-    for file_path_en in iter_ts_files(DATABASE_ROOT_EN):
-        total_files += 1
-        illustrator = extract_illustrator(file_path_en)
-        if illustrator:
-            if illustrator == '313':
-                illustrator = '0313'
-            counter[illustrator] += 1
-            with_illustrator += 1
-
-    for file_path_ja in iter_ts_files(DATABASE_ROOT_JA):
-        total_files += 1
-        illustrator = extract_illustrator(file_path_ja)
-        if illustrator:
-            if illustrator == '313':
-                illustrator = '0313'
-            counter[illustrator] += 1
-            with_illustrator += 1
 
-    # Write CSV
-    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as csvfile:
+def write_illustrator_csv(counter: Counter, output_csv: Path):
+    # Written to a temp file and renamed, so a reader never sees a half-written CSV
+    tmp_path = Path(output_csv).with_name(Path(output_csv).name + ".tmp")
+    with open(tmp_path, "w", newline="", encoding="utf-8") as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(["Illustrator", "Card Count"])
 
         for illustrator, count in counter.most_common():
             writer.writerow([illustrator, count])
-    
+    os.replace(tmp_path, output_csv)
+
+
+@timed("run_count_cards_by_illustrator")
+def run_count_cards_by_illustrator():
+    ##LOAD GLOBALS
+    assert DATABASE_ROOT_EN is not None, "Module not configured"
+    assert OUTPUT_CSV is not None, "Module not configured"
+
+    # The card index only re-parses files changed since the last run
+    index = open_card_index()
+    try:
+        start = time.perf_counter()
+        stats = index.refresh(database_roots())
+        rate("census.files_per_s", stats["files"], time.perf_counter() - start)
+        # Counted in (language, path) order so ties in most_common() keep a stable CSV order
+        counter = count_illustrators(index)
+    finally:
+        index.close()
+    total_files = stats["files"]
+    reparsed = stats["parsed"]
+    with_illustrator = sum(counter.values())
+
+    # Write CSV
+    write_illustrator_csv(counter, OUTPUT_CSV)
+
     print("✅ Done")
     print(f"📁 Total card files scanned: {total_files}")
+    print(f"🔄 Card files re-parsed: {reparsed}")
     print(f"🎨 Cards with illustrator: {with_illustrator}")
     print(f"📊 Unique illustrators: {len(counter)}")
     print(f"💾 Output written to: {OUTPUT_CSV}")
 
 if __name__ == "__main__":
     run_count_cards_by_illustrator()
-
@@ -0,0 +1,149 @@
+import time
+import random
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from tcgdex_database_helper.metrics import incr
+
+# Worth retrying: throttling and transient server-side failures
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def is_unreachable(e: Exception) -> bool:
+    # The server can't be reached or keeps failing (5xx after the retries); a 4xx is an
+    # answer about the request itself (bad id, bad url), not an outage
+    if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(e, "response", None)
+    return isinstance(e, requests.HTTPError) and response is not None and response.status_code >= 500
+
+
+# ---------- STATS ----------
+class RequestStats:
+    # Per-request latency and retry counts, aggregated per host for the report
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests: dict[str, list[tuple[float, int]]] = defaultdict(list)
+        self.failures: dict[str, int] = defaultdict(int)
+
+    def record(self, host: str, latency: float, retries: int, ok: bool):
+        with self.lock:
+            self.requests[host].append((latency, retries))
+            if not ok:
+                self.failures[host] += 1
+
+    def summary(self) -> dict:
+        with self.lock:
+            summary = {}
+            for host, entries in self.requests.items():
+                latencies = sorted(latency for latency, _ in entries)
+                summary[host] = {
+                    "requests": len(entries),
+                    "failures": self.failures[host],
+                    "retries": sum(retries for _, retries in entries),
+                    "mean_ms": 1000 * sum(latencies) / len(latencies),
+                    "p95_ms": 1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                    "max_ms": 1000 * latencies[-1],
+                }
+            return summary
+
+    def report(self):
+        for host, s in self.summary().items():
+            print(
+                f"🌐 {host}: {s['requests']} requests, {s['failures']} failed, {s['retries']} retries, "
+                f"mean {s['mean_ms']:.0f} ms, p95 {s['p95_ms']:.0f} ms, max {s['max_ms']:.0f} ms"
+            )
+# -------------------------------
+
+
+# ---------- CLIENT ----------
+class HttpClient:
+    # Shared HTTP layer for API and image traffic:
+    #  - one keep-alive requests.Session with a pooled adapter
+    #  - at most max_concurrency requests in flight across all threads
+    #  - exponential backoff with full jitter, at most max_retries retries
+    #  - per-host timeouts ("local" applies to the local API endpoint)
+
+    def __init__(
+        self,
+        max_retries: int,
+        timeouts: dict,
+        pool_size: int = 8,
+        max_concurrency: int = 8,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        verify: bool = True,
+        local_endpoint: str | None = None,
+    ):
+        self.max_retries = max_retries
+        self.timeouts = timeouts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.verify = verify
+        self.local_host = urlsplit(local_endpoint).hostname if local_endpoint else None
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.stats = RequestStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.verify = verify
+        if not verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    def timeout_for(self, host: str | None) -> float:
+        if host is not None and host == self.local_host:
+            return self.timeouts.get("local", self.timeouts["default"])
+        return self.timeouts.get(host, self.timeouts["default"])
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        parts = urlsplit(url)
+        host = parts.netloc
+        timeout = kwargs.pop("timeout", self.timeout_for(parts.hostname))
+        start = time.perf_counter()
+        attempt = 0
+
+        while True:
+            error = None
+            response = None
+            try:
+                with self.semaphore:
+                    response = self.session.get(url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+
+            retryable = error is not None or response.status_code in RETRY_STATUS
+            if not retryable or attempt >= self.max_retries:
+                ok = error is None and response.ok
+                self.stats.record(host, time.perf_counter() - start, attempt, ok)
+                incr("http.requests")
+                incr("http.retries", attempt)
+                if not ok:
+                    incr("http.failures")
+                if error is not None:
+                    raise error
+                response.raise_for_status()
+                return response
+
+            delay = self.backoff(attempt)
+            attempt += 1
+            reason = error if error is not None else f"HTTP {response.status_code}"
+            print(f"⚠️ Retry {attempt}/{self.max_retries} for {url} in {delay:.1f}s ({reason})")
+            time.sleep(delay)
+
+    def get_json(self, url: str, **kwargs):
+        return self.get(url, **kwargs).json()
+
+    def close(self):
+        self.session.close()
+# -------------------------------
@@ -0,0 +1,206 @@
+import sys
+import time
+
+from pathlib import Path
+
+import pandas as pd
+
+from tcgdex_database_helper.card_index import CardIndex
+from tcgdex_database_helper.metrics import span, timed
+from tcgdex_database_helper.normalization import canonical_illustrator
+
+# Illustrator breakdowns over the card index, as pandas DataFrames. One row per card,
+# with the repeated text columns as categoricals, so every breakdown is a vectorized
+# groupby over integer codes instead of a Python loop over ~20k cards.
+
+CATEGORY_COLUMNS = ["language", "series", "set_name", "set_id", "illustrator", "rarity"]
+
+# Reports in output order; the names are also the sheet / file name suffixes
+REPORTS = ["summary", "illustrators", "illustrator_series", "missing_by_set", "top_per_series"]
+
+# ---------- CONFIG (initialized from main) ----------
+DATABASE_ROOT_EN: Path | None = None
+DATABASE_ROOT_JA: Path | None = None
+CARD_INDEX_PATH: Path | None = None
+MAX_WORKERS: int | None = None
+# -----------------------------------------------
+
+
+def configure_illustrator_analytics(
+    database_root_en: Path,
+    database_root_ja: Path,
+    card_index_path: Path,
+    max_workers: int | None = None,
+):
+    global DATABASE_ROOT_EN, DATABASE_ROOT_JA, CARD_INDEX_PATH, MAX_WORKERS
+    DATABASE_ROOT_EN = database_root_en
+    DATABASE_ROOT_JA = database_root_ja
+    CARD_INDEX_PATH = card_index_path
+    # 0 / None -> let the executor use os.cpu_count()
+    MAX_WORKERS = max_workers or None
+
+
+# ---------- LOADING ----------
+@timed("analytics.load")
+def load_cards(index: CardIndex, languages: list[str]) -> pd.DataFrame:
+    rows = index.query(
+        f"""
+        SELECT language, series, set_name, set_id, card_id, name, illustrator, rarity, missing
+        FROM cards WHERE language IN ({','.join('?' * len(languages))})
+        ORDER BY language, path
+        """,
+        languages,
+    )
+    cards = pd.DataFrame.from_records(
+        rows,
+        columns=["language", "series", "set_name", "set_id", "card_id", "name", "illustrator", "rarity", "missing"],
+    )
+    cards = cards.astype({column: "category" for column in CATEGORY_COLUMNS})
+    cards["missing"] = cards["missing"].astype(bool)
+    # Aliases resolved once per distinct spelling; two spellings can merge into one name
+    canonical = {name: canonical_illustrator(name) for name in cards["illustrator"].cat.categories}
+    cards["illustrator"] = cards["illustrator"].map(canonical).astype("category")
+    return cards
+# -------------------------------
+
+
+# ---------- BREAKDOWNS ----------
+def summary(cards: pd.DataFrame) -> pd.DataFrame:
+    # Per language: cards, missing illustrators, distinct illustrators, sets
+    grouped = cards.groupby("language", observed=True)
+    return pd.DataFrame({
+        "cards": grouped.size(),
+        "missing": grouped["missing"].sum(),
+        "missing_rate": grouped["missing"].mean(),
+        "illustrators": grouped["illustrator"].nunique(),
+        "sets": grouped["set_name"].nunique(),
+    }).reset_index()
+
+
+def illustrator_counts(cards: pd.DataFrame) -> pd.DataFrame:
+    # Cards per illustrator, one column per language plus the total
+    counts = pd.crosstab(cards["illustrator"], cards["language"])
+    counts.columns = counts.columns.astype(str)
+    counts["total"] = counts.sum(axis=1)
+    return counts.sort_values("total", ascending=False, kind="stable").reset_index()
+
+
+def illustrator_series_counts(cards: pd.DataFrame) -> pd.DataFrame:
+    # Cards per illustrator x series x language
+    counts = cards.groupby(["illustrator", "series", "language"], observed=True).size()
+    counts = counts.rename("cards").reset_index()
+    return counts.sort_values(["cards", "illustrator"], ascending=[False, True], kind="stable").reset_index(drop=True)
+
+
+def missing_by_set(cards: pd.DataFrame) -> pd.DataFrame:
+    # Missing-illustrator rate per set, worst first
+    grouped = cards.groupby(["language", "series", "set_name"], observed=True)
+    sets = grouped.agg(set_id=("set_id", "first"), cards=("missing", "size"), missing=("missing", "sum"))
+    sets["missing_rate"] = sets["missing"] / sets["cards"]
+    sets = sets.reset_index()
+    return sets.sort_values(["missing_rate", "missing"], ascending=False, kind="stable").reset_index(drop=True)
+
+
+def top_per_series(cards: pd.DataFrame, top: int = 10) -> pd.DataFrame:
+    # Top illustrators of each series (the series is the era: Sword & Shield, Scarlet & Violet, ...)
+    counts = cards.groupby(["series", "illustrator"], observed=True).size().rename("cards").reset_index()
+    counts = counts.sort_values(["series", "cards", "illustrator"], ascending=[True, False, True], kind="stable")
+    counts["rank"] = counts.groupby("series", observed=True).cumcount() + 1
+    counts = counts[counts["rank"] <= top]
+    return counts[["series", "rank", "illustrator", "cards"]].reset_index(drop=True)
+
+
+def build_reports(cards: pd.DataFrame, reports: list[str], top: int = 10) -> dict[str, pd.DataFrame]:
+    builders = {
+        "summary": lambda: summary(cards),
+        "illustrators": lambda: illustrator_counts(cards),
+        "illustrator_series": lambda: illustrator_series_counts(cards),
+        "missing_by_set": lambda: missing_by_set(cards),
+        "top_per_series": lambda: top_per_series(cards, top),
+    }
+    results = {}
+    for report in reports:
+        with span(f"analytics.{report}"):
+            results[report] = builders[report]()
+    return results
+# -------------------------------
+
+
+# ---------- EXPORT ----------
+def export_reports(results: dict[str, pd.DataFrame], output: Path) -> list[Path]:
+    # .xlsx: one sheet per report; .csv / .parquet: one file per report when there
+    # are several (<stem>_<report><suffix>), the output file itself otherwise
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    suffix = output.suffix.lower()
+
+    if suffix == ".xlsx":
+        with pd.ExcelWriter(output, engine="openpyxl") as writer:
+            for report, frame in results.items():
+                frame.to_excel(writer, sheet_name=report, index=False)
+        return [output]
+
+    if suffix not in (".csv", ".parquet"):
+        raise ValueError(f"Unsupported analytics output {output.name}, use .csv, .parquet or .xlsx")
+
+    written = []
+    for report, frame in results.items():
+        path = output if len(results) == 1 else output.with_name(f"{output.stem}_{report}{output.suffix}")
+        if suffix == ".csv":
+            frame.to_csv(path, index=False, encoding="utf-8")
+        else:
+            # Needs pyarrow (or fastparquet); pandas raises an ImportError naming it otherwise
+            frame.to_parquet(path, index=False)
+        written.append(path)
+    return written
+# -------------------------------
+
+
+def run_illustrator_analytics(
+    language: str = "all",
+    reports: list[str] | None = None,
+    top: int = 10,
+    output: Path | None = None,
+    rows: int = 20,
+):
+    assert CARD_INDEX_PATH is not None, "Module not configured"
+    reports = reports or REPORTS
+
+    roots = {}
+    for lang, root in {"en": DATABASE_ROOT_EN, "ja": DATABASE_ROOT_JA}.items():
+        if root is None or language not in ("all", lang):
+            continue
+        if not root.exists():
+            print(f"⚠️ Database root not found for {lang}: {root}", file=sys.stderr)
+            continue
+        roots[lang] = root
+
+    index = CardIndex(CARD_INDEX_PATH, max_workers=MAX_WORKERS)
+    try:
+        # Only files changed since the last run are re-parsed
+        stats = index.refresh(roots)
+        start = time.perf_counter()
+        cards = load_cards(index, list(roots))
+    finally:
+        index.close()
+    results = build_reports(cards, reports, top)
+    elapsed = time.perf_counter() - start
+
+    if output is None:
+        with pd.option_context("display.width", 200, "display.max_columns", None):
+            for report, frame in results.items():
+                print(f"\n## {report} ({len(frame)} rows)")
+                print(frame.head(rows).to_string(index=False))
+    else:
+        try:
+            written = export_reports(results, output)
+        except (ValueError, ImportError) as e:
+            print(f"⚠️ {e}", file=sys.stderr)
+            return
+        for path in written:
+            print(f"💾 Output written to: {path}", file=sys.stderr)
+
+    print("✅ Done", file=sys.stderr)
+    print(f"📁 Cards loaded: {len(cards)}", file=sys.stderr)
+    print(f"🔄 Card files re-parsed: {stats['parsed']}", file=sys.stderr)
+    print(f"⏱️ Load + breakdowns: {elapsed:.2f}s", file=sys.stderr)
@@ -0,0 +1,414 @@
+import os
+import re
+import sys
+import csv
+import json
+import time
+import unicodedata
+from collections import Counter
+
+from pathlib import Path
+
+from tcgdex_database_helper.count_cards_by_illustrator import count_illustrators, database_roots, open_card_index
+from tcgdex_database_helper.metrics import span
+from tcgdex_database_helper import normalization
+
+# Near-duplicate illustrator names in the census. Kinds of match:
+#  - exact: same match key (case, punctuation, accents, name order, macron vowels
+#    spelled out); these are the same name written differently and become aliases directly
+#  - romanization: same key once long vowels are folded (Satoo / Satou, but also
+#    Kouki / Koki, which are different names)
+#  - typo: same tokens except one, which is one insertion, deletion or adjacent
+#    swap away (Nishda / Nishida). Substitutions are not typos here: Japanese
+#    surnames one letter apart are different people (Ariga / Arita, Yamada / Yamaki).
+#  - cross-language: the en and ja databases credit the same cards to the two names
+#    (Mitsuhiro Arita / 有田満弘). Names with no card in both databases are not paired:
+#    kanji can't be romanized without a dictionary.
+# Only exact matches are applied; the others are proposals, applied once someone accepts them.
+# Comparing every pair is O(n²), so names are first blocked on shared n-grams.
+
+# Shorter tokens are only ever matched exactly (Aya / Saya, Mori / Morii)
+TYPO_MIN_TOKEN_LENGTH = 5
+
+# n-grams shared by more names than this say nothing about a pair and are not used as blocks
+MAX_BLOCK_SIZE = 200
+MIN_SHARED_NGRAMS = 2
+
+# Hepburn long vowels: Satō is Satou, so macrons are spelled out before accents are
+# stripped. Other spellings (Satoo, Sato) only match in the romanization tier, since
+# folding them also merges different names (Kouki / Koki)
+MACRON_VOWELS = str.maketrans({
+    "ā": "aa", "ē": "ee", "ī": "ii", "ō": "ou", "ū": "uu",
+    "â": "aa", "ê": "ee", "î": "ii", "ô": "ou", "û": "uu",
+})
+ROMANIZATION = (("ou", "o"), ("oo", "o"), ("uu", "u"))
+
+# A ja name and an en name are paired when at least this many shared cards, and this
+# share of each name's shared cards, credit one to the other
+CROSS_LANGUAGE_MIN_CARDS = 3
+CROSS_LANGUAGE_MIN_SHARE = 0.8
+
+# 有田 満弘 / 有田満弘: the space between CJK family and given name is optional
+CJK_SPACE_REGEX = re.compile(r"(?<=[^\x00-\x7f]) (?=[^\x00-\x7f])")
+
+PROPOSALS_HEADER = (
+    "# Romanization, typo and cross-language matches from the dedupe command, NOT applied. Set accept: true on the right ones,\n"
+    "# then run: python -m tcgdex_database_helper dedupe --accept-proposals\n"
+)
+
+CSV_HEADER = ["Cluster", "Canonical", "Illustrator", "Card Count", "Match"]
+
+# ---------- CONFIG (initialized from main) ----------
+ALIASES_FILE: Path | None = None
+PROPOSALS_FILE: Path | None = None
+# -----------------------------------------------
+
+
+def configure_illustrator_duplicates(aliases_file: Path | None, proposals_file: Path | None):
+    global ALIASES_FILE, PROPOSALS_FILE
+    ALIASES_FILE = aliases_file
+    PROPOSALS_FILE = proposals_file
+
+
+# ---------- MATCH KEYS ----------
+def match_key(name: str) -> str:
+    # Casefolded, macrons spelled out and other accents stripped from Latin letters,
+    # punctuation as spaces, no spaces inside CJK names; kana keep their (semi-)voiced marks
+    chars = []
+    for ch in unicodedata.normalize("NFKD", name.casefold().translate(MACRON_VOWELS)):
+        category = unicodedata.category(ch)
+        if category == "Mn" and chars and chars[-1].isascii():
+            continue
+        chars.append(" " if category[0] in "PSZ" else ch)
+    key = unicodedata.normalize("NFC", " ".join("".join(chars).split()))
+    return CJK_SPACE_REGEX.sub("", key)
+
+
+def fold_romanization(key: str) -> str:
+    for variant, replacement in ROMANIZATION:
+        key = key.replace(variant, replacement)
+    return key
+
+
+def sorted_tokens(key: str) -> str:
+    # "arita mitsuhiro" and "mitsuhiro arita" get the same key
+    return " ".join(sorted(key.split()))
+
+
+def ngrams(text: str) -> set[str]:
+    # Trigrams for Latin names, bigrams for CJK ones (a kanji carries more than a letter)
+    n = 3 if text.isascii() else 2
+    if len(text) <= n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def one_typo_apart(a: str, b: str) -> bool:
+    # One inserted / deleted character, or two adjacent characters swapped
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) == 1:
+        return any(b[:i] + b[i + 1:] == a for i in range(len(b)))
+    if len(a) != len(b):
+        return False
+    diffs = [i for i in range(len(a)) if a[i] != b[i]]
+    return len(diffs) == 2 and diffs[1] == diffs[0] + 1 and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]
+
+
+def typo_match(a: str, b: str) -> bool:
+    # Same tokens but one (in any order), and that one a typo of a long token
+    a_tokens, b_tokens = Counter(a.split()), Counter(b.split())
+    if sum(a_tokens.values()) != sum(b_tokens.values()):
+        return False
+    a_only = list((a_tokens - b_tokens).elements())
+    b_only = list((b_tokens - a_tokens).elements())
+    if len(a_only) != 1 or len(b_only) != 1:
+        return False
+    x, y = a_only[0], b_only[0]
+    return min(len(x), len(y)) >= TYPO_MIN_TOKEN_LENGTH and one_typo_apart(x, y)
+
+
+def cross_language_pairs(shared: list[tuple[str, str, int]]) -> list[tuple[str, str]]:
+    # shared: (en name, ja name, cards) over the card ids in both databases.
+    # (en name, ja name) pairs that credit the same cards, canonical names on both sides
+    pair_cards: Counter = Counter()
+    en_cards: Counter = Counter()
+    ja_cards: Counter = Counter()
+    for en, ja, cards in shared:
+        en, ja = normalization.canonical_illustrator(en), normalization.canonical_illustrator(ja)
+        pair_cards[en, ja] += cards
+        en_cards[en] += cards
+        ja_cards[ja] += cards
+
+    return sorted(
+        (en, ja)
+        for (en, ja), cards in pair_cards.items()
+        if en != ja
+        and cards >= CROSS_LANGUAGE_MIN_CARDS
+        and cards >= CROSS_LANGUAGE_MIN_SHARE * en_cards[en]
+        and cards >= CROSS_LANGUAGE_MIN_SHARE * ja_cards[ja]
+    )
+# -------------------------------
+
+
+# ---------- CLUSTERING ----------
+def candidate_pairs(keys: list[str]) -> set[tuple[int, int]]:
+    # Pairs of keys sharing at least MIN_SHARED_NGRAMS selective n-grams (or all of a short key's)
+    grams = [ngrams(key.replace(" ", "")) for key in keys]
+    postings: dict[str, list[int]] = {}
+    for i, key_grams in enumerate(grams):
+        for gram in key_grams:
+            postings.setdefault(gram, []).append(i)
+
+    pairs = set()
+    for i, key_grams in enumerate(grams):
+        shared: dict[int, int] = {}
+        for gram in key_grams:
+            posting = postings[gram]
+            if len(posting) > MAX_BLOCK_SIZE:
+                continue
+            for j in posting:
+                if j > i:
+                    shared[j] = shared.get(j, 0) + 1
+        for j, count in shared.items():
+            if count >= min(MIN_SHARED_NGRAMS, len(key_grams), len(grams[j])):
+                pairs.add((i, j))
+    return pairs
+
+
+def find_duplicate_clusters(counts: dict[str, int], linked: list[tuple[str, str]] = ()) -> list[dict]:
+    # [{"canonical", "cards", "members": [{"name", "cards", "match"}]}], most cards first.
+    # linked: cross-language pairs (cross_language_pairs).
+    # match is "canonical", "exact" (same match key as the canonical name), "romanization"
+    # (same key once long vowels are folded), "cross-language" or "typo".
+    names = sorted(counts)
+    parent = list(range(len(names)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        parent[find(i)] = find(j)
+
+    with span("dedupe.keys"):
+        keys = [sorted_tokens(match_key(name)) for name in names]
+        by_key: dict[str, int] = {}
+        key_ids = []
+        for i, key in enumerate(keys):
+            exact = by_key.setdefault(key, i)
+            if exact != i:
+                union(i, exact)
+            else:
+                key_ids.append(i)
+
+        folded = [fold_romanization(key) for key in keys]
+        by_folded: dict[str, int] = {}
+        folded_ids = []
+        for i in key_ids:
+            same = by_folded.setdefault(folded[i], i)
+            if same != i:
+                union(i, same)
+            else:
+                folded_ids.append(i)
+        key_ids = folded_ids
+
+    with span("dedupe.block"):
+        unique_keys = [folded[i] for i in key_ids]
+        pairs = candidate_pairs(unique_keys)
+
+    with span("dedupe.score"):
+        for a, b in pairs:
+            if typo_match(unique_keys[a], unique_keys[b]):
+                union(key_ids[a], key_ids[b])
+
+    name_ids = {name: i for i, name in enumerate(names)}
+    # Match keys of the linked names, so their other spellings are labeled cross-language too
+    cross_language = set()
+    for en, ja in linked:
+        if en in name_ids and ja in name_ids:
+            union(name_ids[en], name_ids[ja])
+            cross_language.update((keys[name_ids[en]], keys[name_ids[ja]]))
+
+    def match(i, canonical):
+        if i == canonical:
+            return "canonical"
+        if keys[i] == keys[canonical]:
+            return "exact"
+        if folded[i] == folded[canonical]:
+            return "romanization"
+        return "cross-language" if keys[i] in cross_language else "typo"
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(names)):
+        groups.setdefault(find(i), []).append(i)
+
+    # Already the target of an alias -> keep it canonical, otherwise the most cards wins
+    alias_targets = set(normalization.ILLUSTRATOR_ALIASES.values())
+    clusters = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        canonical = min(members, key=lambda i: (names[i] not in alias_targets, -counts[names[i]], names[i]))
+        clusters.append({
+            "canonical": names[canonical],
+            "cards": sum(counts[names[i]] for i in members),
+            "members": [
+                {
+                    "name": names[i],
+                    "cards": counts[names[i]],
+                    "match": match(i, canonical),
+                }
+                for i in sorted(members, key=lambda i: (i != canonical, -counts[names[i]], names[i]))
+            ],
+        })
+    clusters.sort(key=lambda cluster: (-cluster["cards"], cluster["canonical"]))
+    return clusters
+# -------------------------------
+
+
+# ---------- OUTPUT ----------
+def write_clusters(clusters: list[dict], output: Path):
+    # .jsonl: one line per cluster; otherwise CSV with one row per name
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        if Path(output).suffix.lower() == ".jsonl":
+            for cluster in clusters:
+                f.write(json.dumps(cluster, ensure_ascii=False) + "\n")
+            return
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for number, cluster in enumerate(clusters, 1):
+            for member in cluster["members"]:
+                writer.writerow([number, cluster["canonical"], member["name"], member["cards"], member["match"]])
+
+
+def read_yaml(path: Path, default):
+    import yaml
+
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or default
+
+
+def write_yaml(path: Path, data, header: str):
+    import yaml
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(header)
+        yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+    os.replace(tmp_path, path)
+
+
+def add_aliases(aliases_file: Path, new_aliases: dict[str, str]) -> int:
+    # Entries already in the file are kept.
+    # load_config merges this file into illustrator_aliases (the config's own entries win).
+    aliases = read_yaml(aliases_file, {})
+    added = 0
+    for variant, canonical in new_aliases.items():
+        if variant not in aliases:
+            aliases[variant] = canonical
+            added += 1
+    write_yaml(
+        aliases_file,
+        dict(sorted(aliases.items())),
+        "# Variant spelling -> canonical name: exact equivalences and accepted proposals from the dedupe command\n",
+    )
+    return added
+
+
+def write_aliases(clusters: list[dict], aliases_file: Path, proposals_file: Path) -> tuple[int, int]:
+    # Exact equivalences go straight to the aliases file; every other match goes to the
+    # proposals file, which is never loaded: an entry only takes effect once accepted (accept_proposals)
+    exact = {}
+    proposals = []
+    for cluster in clusters:
+        for member in cluster["members"][1:]:
+            if member["match"] == "exact":
+                exact[member["name"]] = cluster["canonical"]
+            else:
+                proposals.append({
+                    "variant": member["name"],
+                    "canonical": cluster["canonical"],
+                    "variant_cards": member["cards"],
+                    "canonical_cards": cluster["members"][0]["cards"],
+                    "match": member["match"],
+                    "accept": False,
+                })
+
+    # A rerun keeps the decisions already made in the proposals file
+    previous = {(entry["variant"], entry["canonical"]): entry for entry in read_yaml(proposals_file, [])}
+    for entry in proposals:
+        entry["accept"] = bool(previous.get((entry["variant"], entry["canonical"]), {}).get("accept"))
+    write_yaml(
+        proposals_file,
+        proposals,
+        PROPOSALS_HEADER,
+    )
+    return add_aliases(aliases_file, exact), len(proposals)
+
+
+def accept_proposals(aliases_file: Path, proposals_file: Path) -> int:
+    # Moves the accepted proposals into the aliases file; the others stay proposed
+    proposals = read_yaml(proposals_file, [])
+    accepted = {entry["variant"]: entry["canonical"] for entry in proposals if entry.get("accept")}
+    added = add_aliases(aliases_file, accepted)
+    write_yaml(
+        proposals_file,
+        [entry for entry in proposals if not entry.get("accept")],
+        PROPOSALS_HEADER,
+    )
+    return added
+# -------------------------------
+
+
+def run_illustrator_duplicates(
+    output: Path | None = None,
+    update_aliases: bool = False,
+    accept: bool = False,
+):
+    if (update_aliases or accept) and (ALIASES_FILE is None or PROPOSALS_FILE is None):
+        print("⚠️ illustrator_aliases_file and illustrator_alias_proposals must be set in paths", file=sys.stderr)
+        return
+
+    if accept:
+        added = accept_proposals(ALIASES_FILE, PROPOSALS_FILE)
+        print(f"💾 {added} accepted alias(es) added to: {ALIASES_FILE}", file=sys.stderr)
+        return
+
+    # The card index only re-parses files changed since the last run
+    index = open_card_index()
+    try:
+        stats = index.refresh(database_roots())
+        counter = count_illustrators(index)
+        shared = index.shared_card_illustrators()
+    finally:
+        index.close()
+
+    start = time.perf_counter()
+    clusters = find_duplicate_clusters(dict(counter), cross_language_pairs(shared))
+    elapsed = time.perf_counter() - start
+
+    if output is not None:
+        write_clusters(clusters, output)
+    else:
+        for cluster in clusters:
+            print(f"\n{cluster['canonical']} ({cluster['cards']} cards)")
+            for member in cluster["members"][1:]:
+                print(f"  ← {member['name']} ({member['cards']} cards, {member['match']})")
+
+    print("✅ Done", file=sys.stderr)
+    print(f"🔄 Card files re-parsed: {stats['parsed']}", file=sys.stderr)
+    print(f"📊 Unique illustrators: {len(counter)}", file=sys.stderr)
+    print(f"🎨 Candidate clusters: {len(clusters)} ({sum(len(c['members']) - 1 for c in clusters)} variant spellings)", file=sys.stderr)
+    print(f"⏱️ Matching: {elapsed:.2f}s", file=sys.stderr)
+    if output is not None:
+        print(f"💾 Output written to: {output}", file=sys.stderr)
+    if update_aliases:
+        added, proposed = write_aliases(clusters, ALIASES_FILE, PROPOSALS_FILE)
+        print(f"💾 {added} exact alias(es) added to: {ALIASES_FILE}", file=sys.stderr)
+        print(f"📝 {proposed} romanization / typo / cross-language match(es) to review in: {PROPOSALS_FILE}", file=sys.stderr)
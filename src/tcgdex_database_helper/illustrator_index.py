@@ -0,0 +1,194 @@
+import csv
+from bisect import bisect_left, bisect_right
+
+from pathlib import Path
+
+from tcgdex_database_helper.normalization import canonical_illustrator, normalize_illustrator
+
+NGRAM_SIZE = 3
+
+# Typo suggestions: names within this many edits (insert, delete, substitute, swap)
+SUGGEST_MAX_DISTANCE = 2
+# Deletes are only generated for this many leading characters (SymSpell's prefix length)
+SUGGEST_PREFIX_LENGTH = 7
+
+
+def iter_ngrams(text: str, n: int = NGRAM_SIZE):
+    for i in range(len(text) - n + 1):
+        yield text[i:i + n]
+
+
+def deletes(text: str, max_distance: int) -> set[str]:
+    # text and every string with up to max_distance characters removed
+    results = {text}
+    frontier = {text}
+    for _ in range(max_distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        results |= frontier
+    return results
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    # Optimal string alignment distance (adjacent swaps count as one edit),
+    # max_distance + 1 as soon as it is known to be larger
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class IllustratorIndex:
+    # Precomputed lookup structure for the illustrator autocomplete:
+    #  - a sorted array of casefolded keys for prefix hits (bisect)
+    #  - a trigram -> ids posting map for substring hits
+    # Every result list is ranked by card count (then name), so the most
+    # prolific illustrators come first.
+
+    def __init__(self, counts: dict[str, int]):
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        self.names = [name for name, _ in ranked]
+        self.counts = [count for _, count in ranked]
+        self.keys = [name.casefold() for name in self.names]
+        self.name_set = set(self.names)
+        self.count_by_name = dict(zip(self.names, self.counts))
+
+        # id == rank, so sorting ids sorts by card count
+        self.sorted_keys = sorted((key, i) for i, key in enumerate(self.keys))
+        self.sorted_key_strings = [key for key, _ in self.sorted_keys]
+
+        self.ngrams: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            for gram in set(iter_ngrams(key)):
+                self.ngrams.setdefault(gram, []).append(i)
+
+        self._last_query: str | None = None
+        self._last_starts: list[int] = []
+        self._last_contains: list[int] = []
+
+        # Deletion index for suggest(), built on first use (or ahead of time by prepare_suggestions)
+        self._deletes: dict[str, list[int]] | None = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.name_set
+
+    def count(self, name: str) -> int:
+        return self.count_by_name.get(name, 0)
+
+    # ---------- LOOKUPS ----------
+    def prefix_ids(self, query: str) -> list[int]:
+        lo = bisect_left(self.sorted_key_strings, query)
+        hi = bisect_right(self.sorted_key_strings, query + "\U0010ffff")
+        return sorted(i for _, i in self.sorted_keys[lo:hi])
+
+    def substring_ids(self, query: str) -> list[int]:
+        if len(query) < NGRAM_SIZE:
+            return [i for i, key in enumerate(self.keys) if query in key]
+
+        postings = sorted((self.ngrams.get(gram, []) for gram in set(iter_ngrams(query))), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return sorted(i for i in candidates if query in self.keys[i])
+
+    def search(self, text: str) -> list[str]:
+        # Prefix hits first, then substring hits, each ranked by card count.
+        query = normalize_illustrator(text).casefold()
+        if not query:
+            self._last_query = None
+            return []
+
+        if self._last_query is not None and query.startswith(self._last_query):
+            # The user only appended characters: narrow the previous result set
+            starts = [i for i in self._last_starts if self.keys[i].startswith(query)]
+            contains = [
+                i for i in self._last_contains if query in self.keys[i]
+            ] + [
+                i for i in self._last_starts
+                if query in self.keys[i] and not self.keys[i].startswith(query)
+            ]
+            contains.sort()
+        else:
+            starts = self.prefix_ids(query)
+            start_set = set(starts)
+            contains = [i for i in self.substring_ids(query) if i not in start_set]
+
+        self._last_query = query
+        self._last_starts = starts
+        self._last_contains = contains
+        return [self.names[i] for i in starts] + [self.names[i] for i in contains]
+
+
+    # ---------- SUGGESTIONS ----------
+    def prepare_suggestions(self):
+        # SymSpell-style: every key prefix with up to SUGGEST_MAX_DISTANCE characters deleted
+        # -> ids. Meant to run off the Tk thread, right after the index is built.
+        if self._deletes is not None:
+            return
+        index: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            for variant in deletes(key[:SUGGEST_PREFIX_LENGTH], SUGGEST_MAX_DISTANCE):
+                index.setdefault(variant, []).append(i)
+        self._deletes = index
+
+    def suggest(self, text: str, limit: int = 5, max_distance: int = SUGGEST_MAX_DISTANCE) -> list[str]:
+        # Known names closest to text, fewest edits first, then by card count.
+        # Two strings within max_distance edits share a deletion variant of their prefixes,
+        # so only the names behind the query's variants are compared.
+        query = normalize_illustrator(text).casefold()
+        if not query:
+            return []
+        max_distance = min(max_distance, SUGGEST_MAX_DISTANCE)
+        if len(query) <= 4:
+            # One edit already turns most 3-4 letter names into another name
+            max_distance = min(max_distance, 1)
+        self.prepare_suggestions()
+
+        candidates = set()
+        for variant in deletes(query[:SUGGEST_PREFIX_LENGTH], max_distance):
+            candidates.update(self._deletes.get(variant, ()))
+
+        matches = []
+        for i in candidates:
+            distance = edit_distance(query, self.keys[i], max_distance)
+            if distance <= max_distance:
+                matches.append((distance, i))
+        matches.sort()
+        return [self.names[i] for _, i in matches[:limit]]
+
+
+def load_illustrator_index(csv_path: Path) -> IllustratorIndex | None:
+    # Build the index from illustrator_card_count.csv; None if the census has never run
+    if not csv_path.exists():
+        return None
+
+    counts: dict[str, int] = {}
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            name = canonical_illustrator(row.get("Illustrator"))
+            if not name:
+                continue
+            try:
+                count = int(row.get("Card Count") or 0)
+            except ValueError:
+                count = 0
+            counts[name] = counts.get(name, 0) + count
+    return IllustratorIndex(counts)
@@ -0,0 +1,131 @@
+import sys
+import time
+import threading
+from collections import Counter
+
+from pathlib import Path
+
+from tcgdex_database_helper import count_cards_by_illustrator as census
+from tcgdex_database_helper.card_index import CardIndex
+from tcgdex_database_helper.count_cards_by_illustrator import count_illustrators, write_illustrator_csv
+from tcgdex_database_helper.normalization import canonical_illustrator
+
+
+# ---------- WATCHER ----------
+class IllustratorWatcher:
+    # Keeps the illustrator counts live while the databases are edited (by the GUI,
+    # another editor or a git pull). The card files' mtimes are polled through the
+    # card index, so only changed files are re-parsed, and each changed illustrator
+    # is applied to the Counter as a delta (-1 old, +1 new) instead of a recount.
+    #
+    # Every refresh of the index must go through the watcher once reset() has run,
+    # otherwise the deltas of that refresh are lost.
+
+    def __init__(
+        self,
+        index: CardIndex,
+        roots: dict[str, Path | None],
+        output_csv: Path | None,
+        poll_seconds: float,
+        on_change=None,
+    ):
+        self.index = index
+        self.roots = roots
+        self.output_csv = output_csv
+        self.poll_seconds = poll_seconds
+        # Called from the refreshing thread with the updated Counter
+        self.on_change = on_change
+        self.lock = threading.Lock()
+        self.counter: Counter | None = None
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def reset(self) -> Counter:
+        # Full count from the index; deltas are applied on top of this from now on
+        with self.lock:
+            self.counter = count_illustrators(self.index)
+            return self.counter.copy()
+
+    def apply_changes(self, changes: list[tuple]) -> bool:
+        # Called with the lock held
+        if self.counter is None or not changes:
+            return False
+
+        changed = False
+        for _, old, new in changes:
+            old = canonical_illustrator(old)
+            new = canonical_illustrator(new)
+            if old == new:
+                continue
+            if old is not None:
+                self.counter[old] -= 1
+                if self.counter[old] <= 0:
+                    del self.counter[old]
+            if new is not None:
+                self.counter[new] += 1
+            changed = True
+        return changed
+
+    def publish(self, counter: Counter):
+        if self.output_csv is not None:
+            write_illustrator_csv(counter, self.output_csv)
+        if self.on_change is not None:
+            self.on_change(counter)
+
+    def refresh(self, language: str | None = None, set_path: str | None = None) -> dict:
+        # Whole tree by default, or a single set (e.g. right after a save)
+        with self.lock:
+            if set_path is not None:
+                stats = self.index.refresh_set(language, set_path)
+            else:
+                stats = self.index.refresh(self.roots)
+            changed = self.apply_changes(stats["changes"])
+            counter = self.counter.copy() if changed else None
+
+        if counter is not None:
+            self.publish(counter)
+        return stats
+
+    def refresh_set(self, language: str, set_path: str) -> dict:
+        return self.refresh(language, set_path)
+
+    # ---------- POLLING ----------
+    def start(self):
+        if self.poll_seconds <= 0 or self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self.run, name="illustrator-watcher", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stop_event.wait(self.poll_seconds):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️ Illustrator watcher refresh failed: {e}", file=sys.stderr)
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=self.poll_seconds + 5)
+            self.thread = None
+    # -------------------------------
+# -------------------------------
+
+
+def run_illustrator_watch(poll_seconds: float):
+    # Headless: one census, then keep the CSV live until interrupted (Ctrl+C)
+    census.run_count_cards_by_illustrator()
+
+    index = census.open_card_index()
+    watcher = IllustratorWatcher(index, census.database_roots(), census.OUTPUT_CSV, poll_seconds)
+    watcher.reset()
+    print(f"👀 Watching for changes every {poll_seconds:g}s, Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(poll_seconds)
+            for path, old, new in watcher.refresh()["changes"]:
+                print(f"✏️ {path}: {old or '-'} -> {new or '-'}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        index.close()
@@ -0,0 +1,317 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+
+from pathlib import Path
+
+from PIL import Image
+
+from tcgdex_database_helper.http_client import HttpClient
+from tcgdex_database_helper.metrics import incr, span
+
+DISPLAY_SIZE = (600, 840)
+
+# TCGdex image qualities and their width in pixels, smallest first
+IMAGE_QUALITIES = (("low", 245), ("high", 600))
+IMAGE_EXTENSION = "png"
+
+# index.json is rewritten after this many changes, or on the first put this long after
+# the oldest unsaved one (and on shutdown), not on every insert
+INDEX_SAVE_BATCH = 32
+INDEX_SAVE_INTERVAL = 30.0
+# Bytes per pixel in Pillow's image memory; RGB is padded to 4 bytes like RGBA, and so
+# are the other multi-band modes
+PIXEL_BYTES = {"1": 1, "L": 1, "P": 1, "I;16": 2, "I;16L": 2, "I;16B": 2, "I;16N": 2}
+# Eviction trims the cache to this share of max_bytes, so a full cache doesn't evict on every put
+EVICT_TARGET_RATIO = 0.9
+
+
+def display_quality(size: tuple[int, int] = DISPLAY_SIZE) -> str:
+    # Smallest quality at least as wide as the display, the largest one otherwise
+    for quality, width in IMAGE_QUALITIES:
+        if width >= size[0]:
+            return quality
+    return IMAGE_QUALITIES[-1][0]
+
+
+def card_image_url(card) -> str | None:
+    return card.get_image_url(quality=display_quality(), extension=IMAGE_EXTENSION)
+
+
+def decode_display_image(source) -> Image.Image:
+    # Decoded as close to display size as the format allows (JPEG decodes at 1/2, 1/4
+    # or 1/8 scale via draft; other formats are reduced by an integer factor inside
+    # resize), so a full-resolution bitmap never sits next to the display-sized one
+    with Image.open(source) as image:
+        image.draft(None, DISPLAY_SIZE)
+        with span("image_decode"):
+            image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            # Palette images would otherwise be resized with nearest neighbour
+            image = image.convert("RGBA")
+        if image.size == DISPLAY_SIZE:
+            return image
+        with span("image_resize"):
+            return image.resize(DISPLAY_SIZE, reducing_gap=3.0)
+
+
+# ---------- DISK CACHE ----------
+class ImageCache:
+    # Size-bounded, content-addressed disk cache of display-sized card images.
+    # Blobs are stored as <sha256>.png; index.json maps image url -> digest.
+    # A hit touches the blob's mtime, eviction drops the oldest mtimes first (LRU).
+    # The blobs' total size is scanned once at startup and kept up to date by put();
+    # the blob directory is only scanned again when that total goes over max_bytes.
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        # Serializes index writes, so an older snapshot never replaces a newer one
+        self.save_lock = threading.Lock()
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.index: dict[str, str] = self.load_index()
+        self.total_bytes = sum(size for _, size, _ in self.scan_blobs())
+        self.unsaved = 0
+        self.unsaved_since = 0.0
+
+    def load_index(self) -> dict:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not read image cache index {self.index_path}: {e}")
+            return {}
+
+    def save_index(self, force: bool = False):
+        # Written outside self.lock, so get() on the Tk thread never waits on the dump
+        with self.save_lock:
+            with self.lock:
+                if not self.unsaved:
+                    return
+                due = (
+                    self.unsaved >= INDEX_SAVE_BATCH
+                    or time.monotonic() - self.unsaved_since >= INDEX_SAVE_INTERVAL
+                )
+                if not (force or due):
+                    return
+                index = dict(self.index)
+                self.unsaved = 0
+
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.index_path)
+
+    def flush(self):
+        self.save_index(force=True)
+
+    def mark_unsaved(self):
+        # Called with the lock held
+        if not self.unsaved:
+            self.unsaved_since = time.monotonic()
+        self.unsaved += 1
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / f"{digest}.png"
+
+    def get(self, url: str) -> Path | None:
+        with self.lock:
+            digest = self.index.get(url)
+            if digest is None:
+                return None
+            path = self.blob_path(digest)
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                # Evicted or removed by hand
+                del self.index[url]
+                self.mark_unsaved()
+                return None
+            incr("image_cache.hits")
+            return path
+
+    def put(self, url: str, data: bytes) -> Path:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        with self.lock:
+            if path.exists():
+                os.utime(path)
+            else:
+                tmp_path = path.with_name(path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                self.total_bytes += len(data)
+            if self.index.get(url) != digest:
+                self.index[url] = digest
+                self.mark_unsaved()
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+        self.save_index()
+        return path
+
+    def scan_blobs(self) -> list[tuple[int, int, str]]:
+        blobs = []
+        for entry in os.scandir(self.blob_dir):
+            if not entry.name.endswith(".png"):
+                continue
+            st = entry.stat()
+            blobs.append((st.st_mtime_ns, st.st_size, entry.path))
+        return blobs
+
+    def evict(self):
+        # Called with the lock held, only once the running total is over max_bytes
+        with span("image_cache_evict"):
+            blobs = self.scan_blobs()
+        # The scan also corrects any drift of the running total (blobs removed by hand)
+        total = sum(size for _, size, _ in blobs)
+        target = self.max_bytes * EVICT_TARGET_RATIO
+
+        removed = set()
+        for _, size, blob in sorted(blobs):
+            if total <= target:
+                break
+            try:
+                os.remove(blob)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed.add(Path(blob).stem)
+
+        self.total_bytes = total
+        if removed:
+            self.index = {url: digest for url, digest in self.index.items() if digest not in removed}
+            self.mark_unsaved()
+# -------------------------------
+
+
+# ---------- MEMORY CACHE ----------
+class DisplayImageCache:
+    # LRU of decoded display-sized images, bounded by their pixel memory (max_bytes).
+    # Only display-sized bitmaps are kept: downloads and full-size decodes are dropped
+    # as soon as the resize is done. Images are shared, callers must not modify them.
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.images: OrderedDict[str, Image.Image] = OrderedDict()
+        self.total_bytes = 0
+
+    @staticmethod
+    def image_bytes(image: Image.Image) -> int:
+        return image.width * image.height * PIXEL_BYTES.get(image.mode, 4)
+
+    def get(self, key: str) -> Image.Image | None:
+        with self.lock:
+            image = self.images.get(key)
+            if image is None:
+                return None
+            self.images.move_to_end(key)
+            incr("display_cache.hits")
+            return image
+
+    def put(self, key: str, image: Image.Image):
+        size = self.image_bytes(image)
+        with self.lock:
+            previous = self.images.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= self.image_bytes(previous)
+            if size > self.max_bytes:
+                return
+            self.images[key] = image
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.images.popitem(last=False)
+                self.total_bytes -= self.image_bytes(evicted)
+# -------------------------------
+
+
+# ---------- FETCH / PREFETCH ----------
+class ImagePipeline:
+    # Bounded worker pool that downloads, resizes and caches card images.
+    # Requests for the same url share one in-flight download.
+    # Display-sized bitmaps of the cached blobs are kept in memory, up to memory_max_bytes.
+
+    def __init__(self, cache: ImageCache, max_workers: int, http: HttpClient, memory_max_bytes: int = 64 * 1024 * 1024):
+        self.cache = cache
+        self.http = http
+        self.display_images = DisplayImageCache(memory_max_bytes)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-prefetch")
+        self.lock = threading.Lock()
+        self.in_flight: dict[str, Future] = {}
+
+    def prefetch(self, url: str) -> Future:
+        with self.lock:
+            future = self.in_flight.get(url)
+            if future is not None:
+                return future
+
+            cached = self.cache.get(url)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future
+
+            future = self.executor.submit(self.fetch, url)
+            self.in_flight[url] = future
+
+        future.add_done_callback(lambda _: self.forget(url))
+        return future
+
+    def forget(self, url: str):
+        with self.lock:
+            self.in_flight.pop(url, None)
+
+    def load(self, url: str) -> Path:
+        # Blocks only when the image is neither cached nor already downloading
+        return self.prefetch(url).result()
+
+    def fetch(self, url: str) -> Path:
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+
+        # Counted here rather than in get(), which prefetch() already tried
+        incr("image_cache.misses")
+        with span("image_fetch"):
+            data = self.http.get(url).content
+        image = decode_display_image(BytesIO(data))
+        # Only the display-sized bitmap is kept from here on
+        del data
+
+        with span("image_encode"):
+            buffer = BytesIO()
+            image.save(buffer, format="PNG")
+        path = self.cache.put(url, buffer.getvalue())
+        # Just downloaded means about to be shown (or prefetched for the next cards)
+        self.display_images.put(str(path), image)
+        return path
+
+    def display_image(self, path: Path) -> Image.Image:
+        # Display-sized bitmap of a cached blob (or any image file), decoded once while it
+        # stays in the memory LRU. Safe to call off the Tk thread.
+        key = str(path)
+        image = self.display_images.get(key)
+        if image is not None:
+            return image
+        incr("display_cache.misses")
+        image = decode_display_image(path)
+        self.display_images.put(key, image)
+        return image
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        # Index changes not yet written by a batch
+        self.cache.flush()
+# -------------------------------
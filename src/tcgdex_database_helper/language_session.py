@@ -0,0 +1,139 @@
+import os
+
+from pathlib import Path
+
+from tcgdexsdk import TCGdex
+from tcgdexsdk.models.Serie import Serie
+from tcgdexsdk.models.SerieResume import SerieResume
+
+from tcgdex_database_helper.card_metadata import CardCache, CardMetadataService
+from tcgdex_database_helper.http_client import HttpClient
+from tcgdex_database_helper.series_catalog import CatalogCache, SeriesCatalog
+from tcgdex_database_helper.tcgdex_api import TCGdexApi
+
+
+# ---------- LANGUAGE SESSION ----------
+class LanguageSession:
+    # Everything the editor needs that depends on the language: SDK client, API,
+    # card metadata and the series/sets catalog. The HTTP client, card and catalog
+    # caches, card index and image cache are shared by all sessions.
+
+    def __init__(
+        self,
+        language: str,
+        database_root: Path | None,
+        http: HttpClient,
+        card_cache: CardCache,
+        card_fetch_concurrency: int,
+        catalog_cache: CatalogCache,
+        catalog_ttl_seconds: float,
+        endpoint: str | None = None,
+        offline: bool = False,
+    ):
+        self.language = language
+        self.database_root = database_root
+        sdk = TCGdex(language)
+        if endpoint:
+            sdk = sdk.setEndpoint(endpoint)  ## Use local TCGdex instance
+        self.sdk = sdk
+        self.tcgdex = TCGdexApi(sdk, http)
+        self.card_service = CardMetadataService(self.tcgdex, card_cache, concurrency=card_fetch_concurrency)
+        self.catalog = SeriesCatalog(
+            language,
+            database_root,
+            catalog_cache,
+            catalog_ttl_seconds,
+            fetch=lambda series_id, etag: self.tcgdex.get_json_revalidated("series", series_id, etag),
+            offline=offline,
+        )
+
+    def set_path(self, series_name: str, series_id: str, set_name: str, set_id: str) -> str:
+        # data-asia folders are named by id, data/ ones by name
+        if self.language == "ja":
+            return os.path.join(self.database_root, series_id, set_id)
+        return os.path.join(self.database_root, series_name, set_name)
+
+    # ---------- CATALOG ----------
+    # cached_*: no network, None if not cached yet; revalidate_*: None if unchanged
+    @property
+    def offline(self) -> bool:
+        return self.catalog.offline
+
+    def build_series(self, payload) -> list[SerieResume] | None:
+        return [self.tcgdex.build(SerieResume, item) for item in payload] if payload is not None else None
+
+    def build_series_sets(self, series_id: str, payload) -> Serie:
+        if payload is None:
+            raise LookupError(f"Series {series_id} not found in the {self.language} catalog")
+        return self.tcgdex.build(Serie, payload)
+
+    def cached_series(self) -> list[SerieResume] | None:
+        return self.build_series(self.catalog.cached())
+
+    def list_series(self) -> list[SerieResume]:
+        return self.build_series(self.catalog.get())
+
+    def revalidate_series(self) -> list[SerieResume] | None:
+        return self.build_series(self.catalog.revalidate())
+
+    def cached_series_sets(self, series_id: str) -> Serie | None:
+        payload = self.catalog.cached(series_id)
+        return self.build_series_sets(series_id, payload) if payload is not None else None
+
+    def get_series(self, series_id: str) -> Serie:
+        return self.build_series_sets(series_id, self.catalog.get(series_id))
+
+    def revalidate_series_sets(self, series_id: str) -> Serie | None:
+        payload = self.catalog.revalidate(series_id)
+        return self.build_series_sets(series_id, payload) if payload is not None else None
+# -------------------------------
+
+
+class LanguageSessions:
+    # One session per language, created on first use and kept for the whole run
+
+    def __init__(
+        self,
+        database_roots: dict[str, Path | None],
+        http: HttpClient,
+        card_cache: CardCache,
+        card_fetch_concurrency: int,
+        catalog_cache: CatalogCache,
+        catalog_ttl_seconds: float,
+        endpoint: str | None = None,
+        offline: bool = False,
+    ):
+        self.database_roots = database_roots
+        self.http = http
+        self.card_cache = card_cache
+        self.card_fetch_concurrency = card_fetch_concurrency
+        self.catalog_cache = catalog_cache
+        self.catalog_ttl_seconds = catalog_ttl_seconds
+        self.endpoint = endpoint
+        self.offline = offline
+        self.sessions: dict[str, LanguageSession] = {}
+
+    @property
+    def languages(self) -> list[str]:
+        return [language for language, root in self.database_roots.items() if root is not None]
+
+    def get(self, language: str) -> LanguageSession:
+        session = self.sessions.get(language)
+        if session is None:
+            session = LanguageSession(
+                language,
+                self.database_roots.get(language),
+                self.http,
+                self.card_cache,
+                self.card_fetch_concurrency,
+                self.catalog_cache,
+                self.catalog_ttl_seconds,
+                endpoint=self.endpoint,
+                offline=self.offline,
+            )
+            self.sessions[language] = session
+        return session
+
+    def close(self):
+        self.card_cache.close()
+        self.catalog_cache.close()
@@ -1,22 +1,18 @@
 
 
 def main():
-    import asyncio
     import argparse
+    from pathlib import Path
     from tcgdex_database_helper.config import (
         load_config,
         set_language,
         set_no_ssl_verify,
         set_is_local_endpoint,
+        set_offline,
     )
-    from tcgdex_database_helper.count_cards_by_illustrator import (
-    configure_count_cards_by_illustrator,
-    run_count_cards_by_illustrator,
-    )
-    from tcgdex_database_helper.tcgDex_database_helper_GUI import (
-    configure_tcgDex_database_helper_GUI,
-    run_tcgDex_database_helper_GUI_async,
-    )
+    # Only the lightweight core is imported up front; every command imports
+    # what it needs below, so headless runs never load the GUI/HTTP stack
+    from tcgdex_database_helper.metrics import configure_metrics, default_report_path
     def parse_args():
         parser = argparse.ArgumentParser(
             description="TCGDex Database Helper GUI"
@@ -26,7 +22,7 @@ def main():
             "-l", "--lang",
             dest="language",
             default=None,
-            help="Language code to use (en or ja), if not set, uses en by default",
+            help="Language shown first (en or ja), en by default; both can be switched between from the window",
         )
         parser.add_argument(
             "-nsl", "--no_ssl_verify",
@@ -38,11 +34,380 @@ def main():
             action="store_true",
             help="Enable Usage of local API instance(configurable in the config file if not default)",
         )
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            help="Build the series/set lists from the database folders instead of the API",
+        )
+        parser.add_argument(
+            "--metrics",
+            action="store_true",
+            help="Time each stage (census, series/set loading, scan, card and image fetch, save) and write a report at exit",
+        )
+        parser.add_argument(
+            "--metrics-output",
+            type=Path,
+            default=None,
+            help="Metrics report, .json or .csv (implies --metrics), ./cache/metrics-<timestamp>.json by default",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Same as --metrics, plus a cProfile dump of the main thread",
+        )
+        parser.add_argument(
+            "--profile-output",
+            type=Path,
+            default=None,
+            help="cProfile dump (implies --profile), next to the metrics report by default",
+        )
+
+        subparsers = parser.add_subparsers(dest="command")
+
+        scan_parser = subparsers.add_parser(
+            "scan",
+            help="Headless report of every card missing an illustrator (no GUI)",
+        )
+        scan_parser.add_argument(
+            "-l", "--lang",
+            dest="scan_language",
+            choices=["en", "ja", "all"],
+            default="all",
+            help="Database to scan, both by default",
+        )
+        scan_parser.add_argument(
+            "-o", "--output",
+            type=Path,
+            default=None,
+            help="Output file, stdout if not set",
+        )
+        scan_parser.add_argument(
+            "-f", "--format",
+            dest="output_format",
+            choices=["jsonl", "csv"],
+            default=None,
+            help="Output format, inferred from the output file extension (jsonl by default)",
+        )
+        scan_parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=None,
+            help="Worker processes, one per CPU by default",
+        )
+        scan_parser.add_argument(
+            "--include-complete",
+            action="store_true",
+            help="Also report sets with no missing illustrators",
+        )
+
+        apply_parser = subparsers.add_parser(
+            "apply",
+            help="Apply illustrators in bulk from a CSV/JSONL mapping of card id or path -> illustrator",
+        )
+        apply_parser.add_argument(
+            "mapping",
+            type=Path,
+            help="CSV (with header) or JSONL file with illustrator and card_id and/or path",
+        )
+        apply_parser.add_argument(
+            "-n", "--dry-run",
+            action="store_true",
+            help="Write nothing, print a unified diff of the changes instead",
+        )
+        apply_parser.add_argument(
+            "-o", "--output",
+            type=Path,
+            default=None,
+            help="Dry-run diff file, stdout if not set",
+        )
+        apply_parser.add_argument(
+            "-l", "--lang",
+            dest="apply_language",
+            choices=["en", "ja", "all"],
+            default="all",
+            help="Database used to resolve card ids, both by default",
+        )
+        apply_parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=None,
+            help="Worker count, automatic by default",
+        )
+
+        watch_parser = subparsers.add_parser(
+            "watch",
+            help="Keep the illustrator count CSV up to date while the databases are edited (no GUI)",
+        )
+        watch_parser.add_argument(
+            "-i", "--interval",
+            type=float,
+            default=None,
+            help="Seconds between polls, watch_interval_seconds from the config by default",
+        )
+
+        analytics_parser = subparsers.add_parser(
+            "analytics",
+            help="Illustrator breakdowns per series, set and language from the card index (no GUI)",
+        )
+        analytics_parser.add_argument(
+            "-l", "--lang",
+            dest="analytics_language",
+            choices=["en", "ja", "all"],
+            default="all",
+            help="Database to analyze, both by default",
+        )
+        analytics_parser.add_argument(
+            "-r", "--report",
+            dest="reports",
+            action="append",
+            choices=["summary", "illustrators", "illustrator_series", "missing_by_set", "top_per_series"],
+            default=None,
+            help="Report to build, can be repeated; all of them by default",
+        )
+        analytics_parser.add_argument(
+            "-t", "--top",
+            type=int,
+            default=10,
+            help="Illustrators listed per series in top_per_series, 10 by default",
+        )
+        analytics_parser.add_argument(
+            "-o", "--output",
+            type=Path,
+            default=None,
+            help="Export to .csv / .parquet (one file per report) or .xlsx (one sheet per report), printed if not set",
+        )
+        analytics_parser.add_argument(
+            "--rows",
+            type=int,
+            default=20,
+            help="Rows printed per report when there is no output file",
+        )
+
+        dedupe_parser = subparsers.add_parser(
+            "dedupe",
+            help="Find near-duplicate illustrator spellings in the census and suggest aliases (no GUI)",
+        )
+        dedupe_parser.add_argument(
+            "-o", "--output",
+            type=Path,
+            default=None,
+            help="Clusters as .csv (one row per spelling) or .jsonl (one line per cluster), printed if not set",
+        )
+        dedupe_parser.add_argument(
+            "--write-aliases",
+            action="store_true",
+            help="Add exact equivalences to paths.illustrator_aliases_file and write the other matches to paths.illustrator_alias_proposals for review",
+        )
+        dedupe_parser.add_argument(
+            "--accept-proposals",
+            action="store_true",
+            help="Move the proposals marked accept: true into paths.illustrator_aliases_file",
+        )
+
+        bench_parser = subparsers.add_parser(
+            "bench",
+            help="Benchmark the hot paths against a generated synthetic cards-database (no GUI)",
+        )
+        bench_parser.add_argument(
+            "-n", "--cards",
+            type=int,
+            default=10000,
+            help="Card files in the synthetic database (data + data-asia), 10000 by default",
+        )
+        bench_parser.add_argument(
+            "-d", "--work-dir",
+            type=Path,
+            default=Path("./cache/benchmark"),
+            help="Where the synthetic database, index and caches live, reused between runs",
+        )
+        bench_parser.add_argument(
+            "-o", "--output",
+            type=Path,
+            default=None,
+            help="Results JSON, results-<timestamp>.json in the work dir if not set",
+        )
+        bench_parser.add_argument(
+            "-c", "--compare",
+            type=Path,
+            default=None,
+            help="Previous results JSON to compare this run against",
+        )
+        bench_parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of the synthetic database",
+        )
+        bench_parser.add_argument(
+            "--regenerate",
+            action="store_true",
+            help="Regenerate the synthetic database even if one with the same size and seed exists",
+        )
+        bench_parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=None,
+            help="Worker processes for the card index, one per CPU by default",
+        )
+        bench_parser.add_argument(
+            "--skip-http",
+            action="store_true",
+            help="Skip the API / image fetch benchmarks",
+        )
+        bench_parser.add_argument(
+            "--http-requests",
+            type=int,
+            default=200,
+            help="Card requests made against the local stand-in server",
+        )
+        bench_parser.add_argument(
+            "--latency-ms",
+            type=float,
+            default=20.0,
+            help="Latency added by the stand-in server to every request",
+        )
 
         return parser.parse_args()
     
     
     args = parse_args()
+
+    if args.metrics or args.metrics_output or args.profile or args.profile_output:
+        report_path = args.metrics_output or default_report_path()
+        profile_path = args.profile_output
+        if args.profile and profile_path is None:
+            profile_path = report_path.with_suffix(".prof")
+        configure_metrics(report_path=report_path, profile_path=profile_path)
+
+    if args.command == "scan":
+        from tcgdex_database_helper.batch_scan import configure_batch_scan, run_batch_scan
+
+        paths = load_config(quiet=True)["paths"]
+        configure_batch_scan(
+            database_root_en=paths["database_root_en"],
+            database_root_ja=paths["database_root_ja"],
+            card_index_path=paths["card_index"],
+        )
+        run_batch_scan(
+            language=args.scan_language,
+            output=args.output,
+            output_format=args.output_format,
+            max_workers=args.workers,
+            include_complete=args.include_complete,
+        )
+        return
+
+    if args.command == "apply":
+        from tcgdex_database_helper.bulk_apply import configure_bulk_apply, run_bulk_apply
+        from tcgdex_database_helper.normalization import configure_normalization
+
+        config = load_config(quiet=True)
+        paths = config["paths"]
+        configure_normalization(aliases=config.get("illustrator_aliases"))
+        configure_bulk_apply(
+            database_root_en=paths["database_root_en"],
+            database_root_ja=paths["database_root_ja"],
+            card_index_path=paths["card_index"],
+        )
+        run_bulk_apply(
+            mapping_path=args.mapping,
+            dry_run=args.dry_run,
+            output=args.output,
+            language=args.apply_language,
+            max_workers=args.workers,
+        )
+        return
+
+    if args.command == "analytics":
+        from tcgdex_database_helper.illustrator_analytics import (
+            configure_illustrator_analytics,
+            run_illustrator_analytics,
+        )
+        from tcgdex_database_helper.normalization import configure_normalization
+
+        config = load_config(quiet=True)
+        paths = config["paths"]
+        configure_normalization(aliases=config.get("illustrator_aliases"))
+        configure_illustrator_analytics(
+            database_root_en=paths["database_root_en"],
+            database_root_ja=paths["database_root_ja"],
+            card_index_path=paths["card_index"],
+            max_workers=config["runtime_settings"]["index_workers"],
+        )
+        run_illustrator_analytics(
+            language=args.analytics_language,
+            reports=args.reports,
+            top=args.top,
+            output=args.output,
+            rows=args.rows,
+        )
+        return
+
+    if args.command == "dedupe":
+        from tcgdex_database_helper.count_cards_by_illustrator import configure_count_cards_by_illustrator
+        from tcgdex_database_helper.illustrator_duplicates import (
+            configure_illustrator_duplicates,
+            run_illustrator_duplicates,
+        )
+        from tcgdex_database_helper.normalization import configure_normalization
+
+        config = load_config(quiet=True)
+        paths = config["paths"]
+        configure_normalization(aliases=config.get("illustrator_aliases"))
+        configure_count_cards_by_illustrator(
+            database_root_en=paths["database_root_en"],
+            database_root_ja=paths["database_root_ja"],
+            illustrator_csv=paths["illustrator_csv"],
+            card_index_path=paths["card_index"],
+            max_workers=config["runtime_settings"]["index_workers"],
+        )
+        configure_illustrator_duplicates(
+            aliases_file=paths.get("illustrator_aliases_file"),
+            proposals_file=paths.get("illustrator_alias_proposals"),
+        )
+        run_illustrator_duplicates(
+            output=args.output,
+            update_aliases=args.write_aliases,
+            accept=args.accept_proposals,
+        )
+        return
+
+    if args.command == "bench":
+        from tcgdex_database_helper.benchmark.runner import run_benchmarks
+
+        run_benchmarks(
+            card_count=args.cards,
+            work_dir=args.work_dir,
+            output=args.output,
+            compare=args.compare,
+            seed=args.seed,
+            regenerate=args.regenerate,
+            workers=args.workers,
+            skip_http=args.skip_http,
+            http_requests=args.http_requests,
+            latency_ms=args.latency_ms,
+        )
+        return
+
+    if args.command == "watch":
+        from tcgdex_database_helper.count_cards_by_illustrator import configure_count_cards_by_illustrator
+        from tcgdex_database_helper.illustrator_watcher import run_illustrator_watch
+        from tcgdex_database_helper.normalization import configure_normalization
+
+        config = load_config(quiet=True)
+        paths = config["paths"]
+        runtime_settings = config["runtime_settings"]
+        configure_normalization(aliases=config.get("illustrator_aliases"))
+        configure_count_cards_by_illustrator(
+            database_root_en=paths["database_root_en"],
+            database_root_ja=paths["database_root_ja"],
+            illustrator_csv=paths["illustrator_csv"],
+            card_index_path=paths["card_index"],
+            max_workers=runtime_settings["index_workers"],
+        )
+        run_illustrator_watch(args.interval or runtime_settings["watch_interval_seconds"] or 5)
+        return
+
     if args.language:
         if args.language in ["en", "ja"]:
             set_language(args.language)
@@ -58,16 +423,34 @@ def main():
     if args.local:
         set_is_local_endpoint(True)
 
+    if args.offline:
+        set_offline(True)
+
+    from tcgdex_database_helper.count_cards_by_illustrator import (
+    configure_count_cards_by_illustrator,
+    run_count_cards_by_illustrator,
+    )
+    from tcgdex_database_helper.normalization import configure_normalization
+
     #LOAD AND SET CONFIGS
     config = load_config()
     paths = config["paths"]
     runtime_settings = config["runtime_settings"]
     endpoints = config["endpoints"]
 
+    configure_normalization(aliases=config.get("illustrator_aliases"))
     configure_count_cards_by_illustrator(
         database_root_en=paths["database_root_en"],
         database_root_ja=paths["database_root_ja"],
         illustrator_csv=paths["illustrator_csv"],
+        card_index_path=paths["card_index"],
+        max_workers=runtime_settings["index_workers"],
+    )
+
+    # The GUI stack (tkinter, PIL, requests, SDK) is only imported on the GUI path
+    from tcgdex_database_helper.tcgDex_database_helper_GUI import (
+    configure_tcgDex_database_helper_GUI,
+    run_tcgDex_database_helper_GUI,
     )
     configure_tcgDex_database_helper_GUI(
         database_root_en=paths["database_root_en"],
@@ -76,8 +459,21 @@ def main():
         fallback_image=paths["fallback_image"],
         max_retries=runtime_settings["max_retries"],
         autocomplete_min_chars=runtime_settings["autocomplete_min_chars"],
-        local_endpoint=endpoints["local_enpoint"]
-
+        local_endpoint=endpoints["local_enpoint"],
+        image_cache_dir=paths["image_cache"],
+        image_cache_max_mb=runtime_settings["image_cache_max_mb"],
+        image_memory_max_mb=runtime_settings["image_memory_max_mb"],
+        prefetch_count=runtime_settings["prefetch_count"],
+        prefetch_workers=runtime_settings["prefetch_workers"],
+        card_cache=paths["card_cache"],
+        card_cache_ttl_hours=runtime_settings["card_cache_ttl_hours"],
+        card_fetch_concurrency=runtime_settings["card_fetch_concurrency"],
+        http_settings=config["http"],
+        card_index=paths["card_index"],
+        watch_interval_seconds=runtime_settings["watch_interval_seconds"],
+        catalog_cache=paths["catalog_cache"],
+        catalog_ttl_hours=runtime_settings["catalog_ttl_hours"],
+        save_journal=paths["save_journal"],
+        save_retries=runtime_settings["save_retries"],
     )
-    run_count_cards_by_illustrator()
-    asyncio.run(run_tcgDex_database_helper_GUI_async())
\ No newline at end of file
+    run_tcgDex_database_helper_GUI(census=run_count_cards_by_illustrator)
\ No newline at end of file
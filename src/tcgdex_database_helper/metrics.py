@@ -0,0 +1,212 @@
+import sys
+import csv
+import json
+import time
+import atexit
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+from pathlib import Path
+
+# Opt-in timing spans and counters (--metrics / --profile). When disabled, span()
+# and incr() return right away, so they stay in the code paths permanently.
+
+# inspect.CO_COROUTINE; checked on the code object so importing this module stays cheap
+CO_COROUTINE = 0x80
+
+# Upper bounds of the histogram buckets, in ms (the last bucket is open-ended)
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# ---------- CONFIG (initialized from main) ----------
+ENABLED = False
+REPORT_PATH: Path | None = None
+PROFILE_PATH: Path | None = None
+PROFILER = None
+# -----------------------------------------------
+
+
+# ---------- REGISTRY ----------
+class Metrics:
+    # Span durations (seconds), plain counters and rate samples, from any thread
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.spans: dict[str, list[float]] = defaultdict(list)
+        self.counters: dict[str, int] = defaultdict(int)
+        self.rates: dict[str, list[float]] = defaultdict(list)
+
+    def record(self, name: str, seconds: float):
+        with self.lock:
+            self.spans[name].append(seconds)
+
+    def incr(self, name: str, n: int = 1):
+        with self.lock:
+            self.counters[name] += n
+
+    def rate(self, name: str, count: float, seconds: float):
+        if seconds > 0:
+            with self.lock:
+                self.rates[name].append(count / seconds)
+
+    @staticmethod
+    def histogram(samples_ms: list[float]) -> dict:
+        counts = [0] * (len(BUCKETS_MS) + 1)
+        for sample in samples_ms:
+            counts[bisect_left(BUCKETS_MS, sample)] += 1
+        labels = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return dict(zip(labels, counts))
+
+    @staticmethod
+    def percentile(samples: list[float], p: float) -> float:
+        return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+    def summary(self) -> dict:
+        with self.lock:
+            spans = {name: sorted(1000 * s for s in samples) for name, samples in self.spans.items()}
+            counters = dict(self.counters)
+            rates = {name: list(samples) for name, samples in self.rates.items()}
+
+        summary = {"wall_seconds": time.perf_counter() - self.started, "spans": {}, "counters": counters, "rates": {}}
+        for name, samples in sorted(spans.items()):
+            summary["spans"][name] = {
+                "count": len(samples),
+                "total_ms": sum(samples),
+                "mean_ms": sum(samples) / len(samples),
+                "p50_ms": self.percentile(samples, 0.5),
+                "p90_ms": self.percentile(samples, 0.9),
+                "p99_ms": self.percentile(samples, 0.99),
+                "max_ms": samples[-1],
+                "histogram": self.histogram(samples),
+            }
+        for name, samples in sorted(rates.items()):
+            summary["rates"][name] = {"count": len(samples), "mean": sum(samples) / len(samples), "min": min(samples), "max": max(samples)}
+        # <name>.hits / <name>.misses counters -> <name>.hit_rate
+        for name in sorted(counters):
+            if name.endswith(".hits"):
+                prefix = name[: -len(".hits")]
+                total = counters[name] + counters.get(prefix + ".misses", 0)
+                summary["rates"][prefix + ".hit_rate"] = {"count": total, "mean": counters[name] / total if total else 0.0}
+        return summary
+
+    def write_report(self, path: Path):
+        # JSON by default, one row per span / counter / rate for a .csv path
+        summary = self.summary()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix.lower() != ".csv":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+            return
+
+        labels = list(self.histogram([]))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kind", "name", "count", "total_ms", "mean", "p50_ms", "p90_ms", "p99_ms", "max", *labels])
+            for name, s in summary["spans"].items():
+                writer.writerow([
+                    "span", name, s["count"], f"{s['total_ms']:.3f}", f"{s['mean_ms']:.3f}",
+                    f"{s['p50_ms']:.3f}", f"{s['p90_ms']:.3f}", f"{s['p99_ms']:.3f}", f"{s['max_ms']:.3f}",
+                    *(s["histogram"][label] for label in labels),
+                ])
+            for name, value in sorted(summary["counters"].items()):
+                writer.writerow(["counter", name, value])
+            for name, s in summary["rates"].items():
+                writer.writerow(["rate", name, s["count"], "", f"{s['mean']:.4f}", "", "", "", s.get("max", "")])
+
+    def report(self):
+        summary = self.summary()
+        print(f"⏱️ {summary['wall_seconds']:.1f}s wall time", file=sys.stderr)
+        for name, s in summary["spans"].items():
+            print(
+                f"⏱️ {name}: {s['count']}x, total {s['total_ms']:.0f} ms, "
+                f"p50 {s['p50_ms']:.1f} ms, p90 {s['p90_ms']:.1f} ms, max {s['max_ms']:.1f} ms",
+                file=sys.stderr,
+            )
+        for name, value in sorted(summary["counters"].items()):
+            print(f"🔢 {name}: {value}", file=sys.stderr)
+        for name, s in summary["rates"].items():
+            print(f"📈 {name}: {s['mean']:.2f}", file=sys.stderr)
+
+
+METRICS = Metrics()
+# -------------------------------
+
+
+def configure_metrics(report_path: Path | None = None, profile_path: Path | None = None):
+    # Turns recording on; the report (and cProfile dump) are written at exit
+    global ENABLED, REPORT_PATH, PROFILE_PATH, PROFILER
+    ENABLED = True
+    REPORT_PATH = report_path
+    PROFILE_PATH = profile_path
+    if profile_path is not None:
+        import cProfile
+
+        # cProfile only sees the thread that enabled it: the main/Tk thread and headless commands
+        PROFILER = cProfile.Profile()
+        PROFILER.enable()
+    atexit.register(finish_metrics)
+
+
+def finish_metrics():
+    global PROFILER
+    if PROFILER is not None:
+        PROFILER.disable()
+        Path(PROFILE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        PROFILER.dump_stats(PROFILE_PATH)
+        print(f"💾 cProfile stats written to: {PROFILE_PATH}", file=sys.stderr)
+        PROFILER = None
+
+    if not ENABLED:
+        return
+    METRICS.report()
+    if REPORT_PATH is not None:
+        METRICS.write_report(REPORT_PATH)
+        print(f"💾 Metrics written to: {REPORT_PATH}", file=sys.stderr)
+
+
+def default_report_path() -> Path:
+    return Path("./cache") / f"metrics-{time.strftime('%Y%m%d-%H%M%S')}.json"
+
+
+@contextmanager
+def span(name: str):
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        METRICS.record(name, time.perf_counter() - start)
+
+
+def timed(name: str):
+    # Decorator form of span(), for plain and async functions
+    def decorator(func):
+        if func.__code__.co_flags & CO_COROUTINE:
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def incr(name: str, n: int = 1):
+    if ENABLED:
+        METRICS.incr(name, n)
+
+
+def rate(name: str, count: float, seconds: float):
+    if ENABLED:
+        METRICS.rate(name, count, seconds)
@@ -0,0 +1,46 @@
+import unicodedata
+from functools import lru_cache
+
+# Illustrator name normalization shared by the census, the card index, the editor
+# and the bulk tools. A few hundred distinct spellings cover tens of thousands of
+# cards, so both steps are memoized.
+
+CACHE_SIZE = 8192
+
+# ---------- CONFIG (initialized from main) ----------
+# normalized variant -> canonical name
+ILLUSTRATOR_ALIASES: dict[str, str] = {"313": "0313"}
+# -----------------------------------------------
+
+
+def configure_normalization(aliases: dict | None = None):
+    global ILLUSTRATOR_ALIASES
+    if aliases is not None:
+        # Keys are normalized so "３１３" or " 313 " hit the same alias as "313"
+        ILLUSTRATOR_ALIASES = {
+            normalize_illustrator(str(variant)): normalize_illustrator(str(canonical))
+            for variant, canonical in aliases.items()
+        }
+    canonical_illustrator.cache_clear()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_illustrator(name: str) -> str:
+    # Normalize unicode (important for JP / full-width chars);
+    # plain ASCII is already NFKC-normal, so it skips straight to the whitespace step
+    if not name.isascii():
+        name = unicodedata.normalize("NFKC", name)
+
+    # Strip leading/trailing whitespace and collapse runs of whitespace into one space
+    return " ".join(name.split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_illustrator(name: str | None) -> str | None:
+    # Normalized name with aliases resolved; None for a missing or blank name
+    if name is None:
+        return None
+    name = normalize_illustrator(name)
+    if not name:
+        return None
+    return ILLUSTRATOR_ALIASES.get(name, name)
@@ -0,0 +1,259 @@
+import os
+import sys
+import json
+import time
+import queue
+import threading
+
+from pathlib import Path
+
+from tcgdex_database_helper.card_files import atomic_write, set_illustrator
+from tcgdex_database_helper.metrics import incr, span
+
+
+class SaveError(Exception):
+    # Not worth retrying: the file can't take the edit
+    pass
+
+
+def write_illustrator(path: str, illustrator: str):
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    content = set_illustrator(content, illustrator)
+    if content is None:
+        raise SaveError("Could not locate rarity field")
+
+    atomic_write(path, content)
+
+
+# ---------- SAVE QUEUE ----------
+class SaveQueue:
+    # Write-behind illustrator saves: submit() returns right away and a worker thread
+    # writes the card files in batches, retrying failed writes with backoff.
+    #
+    # Every save is appended to a JSONL journal (fsynced) before it is queued, and
+    # marked done or failed once written, so saves still pending when the app dies
+    # are replayed on the next start. Replaying is safe: setting the same
+    # illustrator twice leaves the same file.
+    #
+    # Callbacks run on the worker thread:
+    #   on_status({"pending", "committed", "failed"}), on_committed([paths]),
+    #   on_failed(path, illustrator, error)
+
+    def __init__(
+        self,
+        journal_path: Path,
+        batch_size: int = 20,
+        batch_delay: float = 0.2,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        on_status=None,
+        on_committed=None,
+        on_failed=None,
+    ):
+        self.journal_path = Path(journal_path)
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.on_status = on_status
+        self.on_committed = on_committed
+        self.on_failed = on_failed
+
+        self.queue: queue.Queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.pending = 0
+        self.committed = 0
+        self.failed = 0
+        self.idle = threading.Event()
+        self.idle.set()
+        self.thread: threading.Thread | None = None
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal = None
+
+    # ---------- JOURNAL ----------
+    def journal_write(self, *entries: dict):
+        with self.lock:
+            for entry in entries:
+                self.journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.journal.flush()
+            os.fsync(self.journal.fileno())
+
+    def read_journal(self) -> list[dict]:
+        # Saves journaled but never marked done / failed, oldest first
+        if not self.journal_path.exists():
+            return []
+        saves = {}
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-append
+                    continue
+                if entry.get("op") == "save":
+                    saves[entry["id"]] = entry
+                else:
+                    saves.pop(entry.get("id"), None)
+        return list(saves.values())
+
+    def replay(self) -> int:
+        # Rewrites the journal with only the unfinished saves and queues them again
+        unfinished = self.read_journal()
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for number, entry in enumerate(unfinished):
+                entry["id"] = number
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.journal_path)
+
+        self.next_id = len(unfinished)
+        self.journal = open(self.journal_path, "a", encoding="utf-8")
+        for entry in unfinished:
+            self.enqueue(entry)
+        if unfinished:
+            print(f"🔄 Replaying {len(unfinished)} unfinished save(s) from {self.journal_path}")
+        return len(unfinished)
+    # -------------------------------
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.replay()
+        self.thread = threading.Thread(target=self.run, name="save-queue", daemon=True)
+        self.thread.start()
+
+    def status(self) -> dict:
+        with self.lock:
+            return {"pending": self.pending, "committed": self.committed, "failed": self.failed}
+
+    def publish_status(self):
+        if self.on_status is not None:
+            self.on_status(self.status())
+
+    def enqueue(self, entry: dict):
+        with self.lock:
+            self.pending += 1
+            self.idle.clear()
+        self.queue.put(entry)
+        self.publish_status()
+
+    def submit(self, path: str, illustrator: str):
+        with self.lock:
+            save_id = self.next_id
+            self.next_id += 1
+        entry = {"op": "save", "id": save_id, "path": str(path), "illustrator": illustrator, "time": time.time()}
+        # On disk before it is acknowledged, so a crash can't lose it
+        self.journal_write(entry)
+        self.enqueue(entry)
+
+    # ---------- WORKER ----------
+    def take_batch(self) -> list[dict] | None:
+        entry = self.queue.get()
+        if entry is None:
+            return None
+        batch = [entry]
+        # Saves that arrive right after this one (fast reviewing) go in the same batch
+        deadline = time.monotonic() + self.batch_delay
+        while len(batch) < self.batch_size:
+            try:
+                entry = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if entry is None:
+                self.queue.put(None)
+                break
+            batch.append(entry)
+        return batch
+
+    def write_batch(self, batch: list[dict]):
+        # The same card saved twice in one batch: only the last save is written
+        latest = {}
+        for entry in batch:
+            latest[entry["path"]] = entry
+        superseded = [entry for entry in batch if latest[entry["path"]] is not entry]
+
+        done = [{"op": "done", "id": entry["id"]} for entry in superseded]
+        committed = []
+        failures = []
+        with span("save_write"):
+            for path, entry in latest.items():
+                error = self.write_with_retries(path, entry["illustrator"])
+                if error is None:
+                    done.append({"op": "done", "id": entry["id"]})
+                    committed.append(path)
+                else:
+                    done.append({"op": "failed", "id": entry["id"], "error": str(error)})
+                    failures.append((entry, error))
+        self.journal_write(*done)
+
+        with self.lock:
+            self.pending -= len(batch)
+            # Files actually written: a superseded save is done, but wrote nothing
+            self.committed += len(committed)
+            self.failed += len(failures)
+            if self.pending == 0:
+                self.idle.set()
+        incr("save.committed", len(committed))
+        incr("save.failed", len(failures))
+
+        for entry, error in failures:
+            print(f"⚠️ Could not save {entry['path']}: {error}", file=sys.stderr)
+            if self.on_failed is not None:
+                self.on_failed(entry["path"], entry["illustrator"], error)
+        if committed and self.on_committed is not None:
+            self.on_committed(committed)
+        self.publish_status()
+
+    def write_with_retries(self, path: str, illustrator: str) -> Exception | None:
+        attempt = 0
+        while True:
+            try:
+                write_illustrator(path, illustrator)
+                return None
+            except SaveError as e:
+                return e
+            except OSError as e:
+                if attempt >= self.max_retries:
+                    return e
+                attempt += 1
+                incr("save.retries")
+                time.sleep(self.retry_delay * (2 ** (attempt - 1)))
+
+    def run(self):
+        while True:
+            batch = self.take_batch()
+            if batch is None:
+                return
+            try:
+                self.write_batch(batch)
+            except Exception as e:
+                # Journal itself unwritable: the saves stay unfinished there and are replayed next start
+                print(f"⚠️ Save queue batch failed: {e}", file=sys.stderr)
+                with self.lock:
+                    self.pending -= len(batch)
+                    self.failed += len(batch)
+                    if self.pending == 0:
+                        self.idle.set()
+                self.publish_status()
+    # -------------------------------
+
+    def flush(self, timeout: float | None = None) -> bool:
+        # True once every submitted save has been written (or has failed)
+        return self.idle.wait(timeout)
+
+    def close(self, timeout: float | None = 30):
+        # Waits for pending saves; whatever doesn't make it stays in the journal
+        if self.thread is not None:
+            self.flush(timeout)
+            self.queue.put(None)
+            self.thread.join(timeout=5)
+            self.thread = None
+        if self.journal is not None:
+            with self.lock:
+                self.journal.close()
+            self.journal = None
+# -------------------------------
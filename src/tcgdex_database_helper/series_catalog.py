@@ -0,0 +1,225 @@
+import os
+import re
+import sys
+import json
+import time
+import sqlite3
+import threading
+
+from pathlib import Path
+
+from tcgdex_database_helper.card_files import extract_card_fields, iter_set_dirs, localized_name
+from tcgdex_database_helper.http_client import is_unreachable
+
+OFFICIAL_COUNT_REGEX = re.compile(rb"\bofficial\s*:\s*(\d+)")
+
+
+# ---------- LOCAL CACHE ----------
+class CatalogCache:
+    # SQLite cache of the series list and series (with their sets) payloads, keyed by
+    # (language, key), with the ETag they were served with for conditional revalidation.
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS catalog (
+                    language   TEXT NOT NULL,
+                    key        TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    etag       TEXT,
+                    payload    TEXT NOT NULL,
+                    PRIMARY KEY (language, key)
+                )
+                """
+            )
+            self.conn.commit()
+
+    def get(self, language: str, key: str) -> tuple | None:
+        # (payload, etag, fetched_at), stale or not
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT payload, etag, fetched_at FROM catalog WHERE language = ? AND key = ?",
+                (language, key),
+            ).fetchone()
+        if row is None:
+            return None
+        payload, etag, fetched_at = row
+        return json.loads(payload), etag, fetched_at
+
+    def put(self, language: str, key: str, payload, etag: str | None):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO catalog (language, key, fetched_at, etag, payload) VALUES (?, ?, ?, ?, ?)",
+                (language, key, time.time(), etag, json.dumps(payload, ensure_ascii=False)),
+            )
+            self.conn.commit()
+
+    def touch(self, language: str, key: str):
+        # 304 Not Modified: the cached payload is good for another TTL
+        with self.lock:
+            self.conn.execute(
+                "UPDATE catalog SET fetched_at = ? WHERE language = ? AND key = ?",
+                (time.time(), language, key),
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+# -------------------------------
+
+
+# ---------- OFFLINE CATALOG ----------
+def read_ts_header(path: str) -> dict:
+    # id and localized names of a <series>.ts / <set>.ts file, {} if there is none
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return {}
+    fields = extract_card_fields(raw)
+    official = OFFICIAL_COUNT_REGEX.search(raw)
+    fields["official"] = int(official.group(1)) if official else None
+    return fields
+
+
+def build_offline_catalog(root: Path, language: str) -> dict:
+    # Same payload shapes as GET /series and GET /series/<id>, read from the database layout.
+    # The set path is built from ids for ja (data-asia folders are named by id) and from
+    # names otherwise (data/ folders are named by the English names), so those come from
+    # the folder names; the other field is read from the .ts file.
+    catalog = {"series": [], "sets": {}}
+    if root is None or not os.path.isdir(root):
+        return catalog
+
+    series_sets = {}
+    for series, set_name, set_path in iter_set_dirs(root):
+        series_sets.setdefault(series, []).append((set_name, set_path))
+
+    for series, sets in series_sets.items():
+        header = read_ts_header(os.path.join(root, f"{series}.ts"))
+        if language == "ja":
+            series_id, name = series, localized_name(header.get("name") or {}, language) or series
+        else:
+            series_id, name = header.get("id") or series, series
+
+        set_items = []
+        for set_name, set_path in sets:
+            set_header = read_ts_header(os.path.join(root, series, f"{set_name}.ts"))
+            total = sum(1 for entry in os.listdir(set_path) if entry.endswith(".ts"))
+            if language == "ja":
+                set_id, display_name = set_name, localized_name(set_header.get("name") or {}, language) or set_name
+            else:
+                set_id, display_name = set_header.get("id") or set_name, set_name
+            set_items.append({
+                "id": set_id,
+                "name": display_name,
+                "logo": None,
+                "symbol": None,
+                "cardCount": {"total": total, "official": set_header.get("official") or total},
+            })
+
+        catalog["series"].append({"id": series_id, "name": name, "logo": None})
+        catalog["sets"][series_id] = {"id": series_id, "name": name, "logo": None, "sets": set_items}
+    return catalog
+# -------------------------------
+
+
+# ---------- CATALOG ----------
+class SeriesCatalog:
+    # Series list and series -> sets of one language, as raw API payloads.
+    #  - cached entries are served right away, even past their TTL; revalidate()
+    #    refreshes them with a conditional request (ETag) in the background
+    #  - missing entries are fetched and cached
+    #  - when the API can't be reached (or offline is set), the catalog is built
+    #    from the database directory layout instead, and not cached
+    #
+    # fetch(series_id, etag) -> (payload, etag), payload None for 304 Not Modified;
+    # series_id None is the series list.
+
+    def __init__(
+        self,
+        language: str,
+        database_root: Path | None,
+        cache: CatalogCache,
+        ttl_seconds: float,
+        fetch,
+        offline: bool = False,
+    ):
+        self.language = language
+        self.database_root = database_root
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.fetch = fetch
+        self.offline = offline
+        self.offline_catalog: dict | None = None
+
+    @staticmethod
+    def key(series_id: str | None) -> str:
+        return "series" if series_id is None else f"series/{series_id}"
+
+    def offline_payload(self, series_id: str | None):
+        if self.offline_catalog is None:
+            self.offline_catalog = build_offline_catalog(self.database_root, self.language)
+        if series_id is None:
+            return self.offline_catalog["series"]
+        return self.offline_catalog["sets"].get(series_id)
+
+    def cached(self, series_id: str | None = None):
+        # Cheap enough for the Tk thread: no network, and no directory walk either
+        if self.offline:
+            return self.offline_payload(series_id) if self.offline_catalog is not None else None
+        entry = self.cache.get(self.language, self.key(series_id))
+        return entry[0] if entry is not None else None
+
+    def is_stale(self, series_id: str | None = None) -> bool:
+        if self.offline:
+            return False
+        entry = self.cache.get(self.language, self.key(series_id))
+        return entry is None or time.time() - entry[2] > self.ttl_seconds
+
+    def get(self, series_id: str | None = None):
+        if self.offline:
+            return self.offline_payload(series_id)
+        payload = self.cached(series_id)
+        if payload is not None:
+            return payload
+        try:
+            payload, etag = self.fetch(series_id, None)
+        except OSError as e:
+            # requests' errors are OSErrors; only an outage switches the whole language offline
+            if not is_unreachable(e):
+                raise
+            print(f"⚠️ TCGdex API unreachable ({e}), building the {self.language} catalog from {self.database_root}", file=sys.stderr)
+            self.offline = True
+            return self.offline_payload(series_id)
+        self.cache.put(self.language, self.key(series_id), payload, etag)
+        return payload
+
+    def revalidate(self, series_id: str | None = None):
+        # The new payload if it changed since the cached copy, None otherwise
+        if self.offline:
+            return None
+        key = self.key(series_id)
+        entry = self.cache.get(self.language, key)
+        try:
+            payload, etag = self.fetch(series_id, entry[1] if entry is not None else None)
+        except OSError as e:
+            # Keep serving the cached copy; the next revalidation tries again
+            print(f"⚠️ Could not revalidate the {self.language} {key} catalog: {e}", file=sys.stderr)
+            return None
+        if payload is None:
+            self.cache.touch(self.language, key)
+            return None
+        self.cache.put(self.language, key, payload, etag)
+        if entry is not None and entry[0] == payload:
+            return None
+        return payload
+# -------------------------------
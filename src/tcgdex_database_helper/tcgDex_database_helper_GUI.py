@@ -1,25 +1,41 @@
 import os
-import re
-import csv
 import asyncio
 import ssl
-import unicodedata
 import tkinter as tk
 from tkinter import ttk, messagebox
-from io import BytesIO
-from threading import Thread
 
-import requests
-from PIL import Image, ImageTk
-from tcgdexsdk import TCGdex
-from tcgdex_database_helper.config import get_language, get_no_ssl_verify, get_is_local_endpoint
+from PIL import ImageTk
+from tcgdex_database_helper.config import get_language, get_no_ssl_verify, get_is_local_endpoint, get_offline
+from tcgdex_database_helper.illustrator_index import IllustratorIndex, load_illustrator_index
+from tcgdex_database_helper.image_cache import (
+    DISPLAY_SIZE,
+    ImageCache,
+    ImagePipeline,
+    card_image_url,
+    decode_display_image,
+)
+from tcgdex_database_helper.card_metadata import CardCache
+from tcgdex_database_helper.async_bridge import AsyncBridge
+from tcgdex_database_helper.http_client import HttpClient
+from tcgdex_database_helper.language_session import LanguageSession, LanguageSessions
+from tcgdex_database_helper.series_catalog import CatalogCache
+from tcgdex_database_helper.card_index import CardIndex
+from tcgdex_database_helper.illustrator_watcher import IllustratorWatcher
+from tcgdex_database_helper.normalization import canonical_illustrator
+from tcgdex_database_helper.metrics import span, timed
+from tcgdex_database_helper.count_cards_by_illustrator import count_illustrators
+from tcgdex_database_helper.save_queue import SaveQueue
+from tcgdex_database_helper.card_files import (
+    extract_card_id,
+    missing_illustrator,
+)
 
 
 from pathlib import Path
 
 # ---------- CONFIG ----------
 LANGUAGE: str | None = None
-DATABASE_ROOT: Path | None = None
+DATABASE_ROOTS: dict | None = None
 ILLUSTRATOR_CSV: Path | None = None
 FALLBACK_IMAGE_PATH: Path | None = None
 MAX_RETRIES: int | None = None
@@ -27,6 +43,22 @@ AUTOCOMPLETE_MIN_CHARS: int | None = None
 NO_SSL_VERIFICATION: bool = None
 IS_LOCAL_ENDPOINT: bool | None = None
 LOCAL_ENDPOINT: str | None = None
+IMAGE_CACHE_DIR: Path | None = None
+IMAGE_CACHE_MAX_BYTES: int | None = None
+IMAGE_MEMORY_MAX_BYTES: int | None = None
+PREFETCH_COUNT: int | None = None
+PREFETCH_WORKERS: int | None = None
+CARD_CACHE_PATH: Path | None = None
+CARD_CACHE_TTL_SECONDS: int | None = None
+CARD_FETCH_CONCURRENCY: int | None = None
+HTTP_SETTINGS: dict | None = None
+CARD_INDEX_PATH: Path | None = None
+WATCH_INTERVAL_SECONDS: float | None = None
+CATALOG_CACHE_PATH: Path | None = None
+CATALOG_TTL_SECONDS: int | None = None
+OFFLINE: bool = False
+SAVE_JOURNAL_PATH: Path | None = None
+SAVE_RETRIES: int | None = None
 # ----------------------------
 
 #Config_Loading#
@@ -38,12 +70,28 @@ def configure_tcgDex_database_helper_GUI(
     max_retries: int,
     autocomplete_min_chars: int,
     local_endpoint: str,
+    image_cache_dir: Path,
+    image_cache_max_mb: int,
+    image_memory_max_mb: int,
+    prefetch_count: int,
+    prefetch_workers: int,
+    card_cache: Path,
+    card_cache_ttl_hours: int,
+    card_fetch_concurrency: int,
+    http_settings: dict,
+    card_index: Path,
+    watch_interval_seconds: float,
+    catalog_cache: Path,
+    catalog_ttl_hours: int,
+    save_journal: Path,
+    save_retries: int,
 ):
-    global DATABASE_ROOT, LANGUAGE, ILLUSTRATOR_CSV, FALLBACK_IMAGE_PATH, MAX_RETRIES, AUTOCOMPLETE_MIN_CHARS, NO_SSL_VERIFICATION, IS_LOCAL_ENDPOINT, LOCAL_ENDPOINT
-    if get_language() == "en":
-            DATABASE_ROOT = database_root_en
-    if get_language() == "ja":
-            DATABASE_ROOT = database_root_ja
+    global DATABASE_ROOTS, LANGUAGE, ILLUSTRATOR_CSV, FALLBACK_IMAGE_PATH, MAX_RETRIES, AUTOCOMPLETE_MIN_CHARS, NO_SSL_VERIFICATION, IS_LOCAL_ENDPOINT, LOCAL_ENDPOINT
+    global IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES, IMAGE_MEMORY_MAX_BYTES, PREFETCH_COUNT, PREFETCH_WORKERS
+    global CARD_CACHE_PATH, CARD_CACHE_TTL_SECONDS, CARD_FETCH_CONCURRENCY, HTTP_SETTINGS, CARD_INDEX_PATH, WATCH_INTERVAL_SECONDS
+    global CATALOG_CACHE_PATH, CATALOG_TTL_SECONDS, OFFLINE, SAVE_JOURNAL_PATH, SAVE_RETRIES
+    # Both databases are open at once; LANGUAGE is only the one shown first
+    DATABASE_ROOTS = {"en": database_root_en, "ja": database_root_ja}
     LANGUAGE = get_language()
     ILLUSTRATOR_CSV = illustrator_csv
     FALLBACK_IMAGE_PATH = fallback_image
@@ -52,28 +100,92 @@ def configure_tcgDex_database_helper_GUI(
     NO_SSL_VERIFICATION = get_no_ssl_verify()
     IS_LOCAL_ENDPOINT = get_is_local_endpoint()
     LOCAL_ENDPOINT = local_endpoint
+    IMAGE_CACHE_DIR = image_cache_dir
+    IMAGE_CACHE_MAX_BYTES = image_cache_max_mb * 1024 * 1024
+    IMAGE_MEMORY_MAX_BYTES = image_memory_max_mb * 1024 * 1024
+    PREFETCH_COUNT = prefetch_count
+    PREFETCH_WORKERS = prefetch_workers
+    CARD_CACHE_PATH = card_cache
+    CARD_CACHE_TTL_SECONDS = card_cache_ttl_hours * 3600
+    CARD_FETCH_CONCURRENCY = card_fetch_concurrency
+    HTTP_SETTINGS = http_settings
+    CARD_INDEX_PATH = card_index
+    WATCH_INTERVAL_SECONDS = watch_interval_seconds
+    CATALOG_CACHE_PATH = catalog_cache
+    CATALOG_TTL_SECONDS = catalog_ttl_hours * 3600
+    OFFLINE = get_offline()
+    SAVE_JOURNAL_PATH = save_journal
+    SAVE_RETRIES = save_retries
 
 #------------------#
 
-# ---------- NORMALIZATION ----------
-def normalize_illustrator(name: str) -> str:
-    name = unicodedata.normalize("NFKC", name)
-    name = name.strip()
-    name = re.sub(r"\s+", " ", name)
-    return name
+# ---------- LOAD CSV ----------
+def read_possible_illustrators(card_index: CardIndex | None = None) -> IllustratorIndex | None:
+    # Safe to call off the Tk thread: no widgets touched here.
+    # Counts come straight from the card index once it is populated, else from the CSV.
+    if card_index is not None and card_index.count():
+        index = IllustratorIndex(count_illustrators(card_index))
+    else:
+        index = load_illustrator_index(Path(ILLUSTRATOR_CSV))
+    if index is not None:
+        # Typo suggestions for the unknown-illustrator warning, built here rather than on the Tk thread
+        index.prepare_suggestions()
+    return index
+# -------------------------------
+
+def language_for_path(path) -> str | None:
+    # Database a card file belongs to (saves replayed from the journal carry no language)
+    path = os.path.abspath(path)
+    for language, root in DATABASE_ROOTS.items():
+        if root is not None and path.startswith(os.path.abspath(root) + os.sep):
+            return language
+    return None
 # -------------------------------
 
 # ---------- GUI APP ----------
 class CardInspectorApp(tk.Tk):
-    def __init__(self, api):
+    def __init__(self, language):
         super().__init__()
 
-        self.title("TCGDex Illustrator Editor")
-        self.geometry("480x260")
-
-        # Store the API instance
-        self.api = api
+        self.geometry("480x380")
+
+        # One pooled client for API and image traffic, shared by every language
+        self.http = HttpClient(
+            max_retries=MAX_RETRIES,
+            timeouts=HTTP_SETTINGS["timeouts"],
+            pool_size=HTTP_SETTINGS["pool_size"],
+            max_concurrency=HTTP_SETTINGS["max_concurrency"],
+            backoff_base=HTTP_SETTINGS["backoff_base"],
+            backoff_max=HTTP_SETTINGS["backoff_max"],
+            verify=not NO_SSL_VERIFICATION,
+            local_endpoint=LOCAL_ENDPOINT if IS_LOCAL_ENDPOINT else None,
+        )
+        # Per-language API clients and loaded series, kept for the whole run
+        self.sessions = LanguageSessions(
+            DATABASE_ROOTS,
+            self.http,
+            CardCache(CARD_CACHE_PATH, CARD_CACHE_TTL_SECONDS),
+            CARD_FETCH_CONCURRENCY,
+            CatalogCache(CATALOG_CACHE_PATH),
+            CATALOG_TTL_SECONDS,
+            endpoint=LOCAL_ENDPOINT if IS_LOCAL_ENDPOINT else None,
+            offline=OFFLINE,
+        )
+        # Language picked in the UI, and the one of the set being reviewed
+        self.session: LanguageSession = self.sessions.get(language)
+        self.review_session: LanguageSession = self.session
+        # Parsed card files; the set scan and autocomplete read from here
+        self.card_index = CardIndex(CARD_INDEX_PATH)
+        # Keeps counts, CSV and autocomplete live as card files change (here or elsewhere)
+        self.watcher = IllustratorWatcher(
+            self.card_index,
+            DATABASE_ROOTS,
+            Path(ILLUSTRATOR_CSV),
+            WATCH_INTERVAL_SECONDS or 0,
+            on_change=self.on_illustrators_changed,
+        )
 
+        self.language_var = tk.StringVar(value=language)
         self.series_var = tk.StringVar()
         self.set_var = tk.StringVar()
 
@@ -81,48 +193,207 @@ class CardInspectorApp(tk.Tk):
         self.set_map = {}
         self.series_obj = None
 
+        # Set folder of the latest scan, so a slower earlier scan can't replace its result
+        self.scan_path = None
         self.missing_cards = []
         self.current_index = 0
-        self.card: TCGdex.card.Card | None = None
+        self.card = None
+        # Local card file data of the card on screen, until (or unless) the API answers
+        self.preview = None
+        # Fallback image at display size, loaded on first use
+        self.fallback_display_image = None
+        # path -> illustrator saved during this review, shown when going back to a card
+        self.saved_illustrators = {}
+        # Created on the first review and reused afterwards
+        self.review_window: tk.Toplevel | None = None
+
+        # card ids whose metadata and image are already being warmed
+        self.prefetching = set()
+        self.image_pipeline = ImagePipeline(
+            ImageCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES),
+            max_workers=PREFETCH_WORKERS,
+            http=self.http,
+            memory_max_bytes=IMAGE_MEMORY_MAX_BYTES,
+        )
 
         self.possible_illustrators = set()
-        self.load_possible_illustrators()
+        self.illustrator_index: IllustratorIndex | None = None
+
+        # All async work runs on one long-lived event loop; results come back via after()
+        self.bridge = AsyncBridge(self)
+        self.pending_tasks = []
+
+        # Saves are written behind the editor's back; status comes back through the bridge
+        self.save_queue = SaveQueue(
+            SAVE_JOURNAL_PATH,
+            max_retries=SAVE_RETRIES,
+            on_status=lambda status: self.bridge.post(self.update_save_status, status),
+            on_committed=self.on_saves_committed,
+            on_failed=lambda path, illustrator, e: self.bridge.post(self.on_save_failed, (path, illustrator, e)),
+        )
 
         if NO_SSL_VERIFICATION:
             print("Disabling SSL verification for requests")
             ssl._create_default_https_context = ssl._create_unverified_context
 
         self.create_widgets()
+        self.update_title()
+        # Replays saves a previous run didn't get to write
+        self.save_queue.start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    # ---------- BACKGROUND TASKS ----------
+    def run_async(self, label, coro, on_done, group=None, on_error=None):
+        self.pending_tasks.append(label)
+        self.update_progress()
+
+        def finish():
+            if label in self.pending_tasks:
+                self.pending_tasks.remove(label)
+            self.update_progress()
+
+        def done(result):
+            finish()
+            on_done(result)
+
+        def failed(e):
+            finish()
+            if on_error is not None:
+                on_error(e)
+            else:
+                self.on_background_error(label, e)
+
+        return self.bridge.submit(coro, on_done=done, on_error=failed, on_cancel=finish, group=group)
+
+    def run_in_background(self, label, func, on_done, group=None):
+        # Blocking work (disk scans, census) runs in a thread owned by the event loop
+        return self.run_async(label, asyncio.to_thread(func), on_done, group=group)
+
+    def on_background_error(self, label, e):
+        print(f"⚠️ {label} failed: {e}")
+        messagebox.showerror("Error", f"{label} failed:\n{e}")
+
+    def on_close(self):
+        if self.save_queue.status()["pending"]:
+            print("💾 Writing pending saves…")
+        self.save_queue.close()
+        self.watcher.stop()
+        self.bridge.shutdown()
+        self.image_pipeline.shutdown()
+        self.http.stats.report()
+        self.http.close()
+        self.card_index.close()
+        self.sessions.close()
+        self.destroy()
+
+    def update_progress(self):
+        if self.pending_tasks:
+            self.status_var.set("Loading: " + ", ".join(self.pending_tasks) + "…")
+            if not self.progress.winfo_ismapped():
+                self.progress.pack(fill="x", padx=20, before=self.status_label)
+                self.progress.start(10)
+        else:
+            self.status_var.set("Ready (offline catalog)" if self.session.offline else "Ready")
+            self.progress.stop()
+            self.progress.pack_forget()
+
+    def start_background_loading(self, census=None):
+        # The window is already usable; fill the comboboxes and autocomplete as data arrives
+        self.load_series()
+
+        if census is None:
+            self.run_in_background(
+                "illustrators",
+                lambda: read_possible_illustrators(self.card_index),
+                self.apply_possible_illustrators,
+            )
+            return
+
+        def census_then_reload():
+            # Serve the previous census right away, then refresh once the index is up to date
+            if self.card_index.count() or os.path.exists(ILLUSTRATOR_CSV):
+                self.bridge.post(self.apply_possible_illustrators, read_possible_illustrators(self.card_index))
+            census()
+            # From here on the watcher applies changes as deltas
+            counts = self.watcher.reset()
+            self.watcher.start()
+            index = IllustratorIndex(counts)
+            index.prepare_suggestions()
+            return index
+
+        self.run_in_background("illustrator census", census_then_reload, self.apply_possible_illustrators)
 
     # ---------- ASYNC LOAD DATA ----------
-    async def load_series_async(self):
-        series = await self.api.serie.list()
-        for s in series:
-            self.series_map[s.name] = s.id
+    def load_series(self):
+        session = self.session
+        # Cached catalog: fill the combobox now, refresh it in the background once the TTL is up
+        series = session.cached_series()
+        if series is not None:
+            self.apply_series(session, series)
+            if session.catalog.is_stale():
+                self.run_in_background(
+                    f"series list update ({session.language})",
+                    session.revalidate_series,
+                    lambda series: self.apply_series(session, series) if series is not None else None,
+                    group="language",
+                )
+            return
+
+        self.run_async(
+            f"series list ({session.language})",
+            self.load_series_async(session),
+            lambda series: self.apply_series(session, series),
+            group="language",
+        )
+
+    @timed("load_series_async")
+    async def load_series_async(self, session):
+        # HTTP calls block, so keep them off the loop thread; cached per language after the first
+        return await asyncio.to_thread(session.list_series)
+
+    def apply_series(self, session, series):
+        if session is not self.session:
+            # Finished after the user switched language
+            return
+        self.series_map = {s.name: s.id for s in series}
         self.series_cb["values"] = sorted(self.series_map.keys())
+        # A failed API call may have switched the session to the offline catalog
+        self.update_progress()
 
     async def fetch_card_async(self, card_id):
-        return await self.api.card.get(card_id)
+        return await self.review_session.card_service.get_async(card_id)
     
     # ---------- LOAD CSV ----------
-    def load_possible_illustrators(self):
-        if not os.path.exists(ILLUSTRATOR_CSV):
+    def apply_possible_illustrators(self, index):
+        if index is None:
             messagebox.showwarning(
                 "Warning",
                 f"{ILLUSTRATOR_CSV} not found.\nAutocomplete disabled."
             )
             return
 
-        with open(ILLUSTRATOR_CSV, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row.get("Illustrator")
-                if name:
-                    self.possible_illustrators.add(normalize_illustrator(name))
+        self.illustrator_index = index
+        self.possible_illustrators = index.name_set
+
+    def on_illustrators_changed(self, counts):
+        # Watcher thread: rebuild the autocomplete index here, swap it in on the Tk thread
+        index = IllustratorIndex(counts)
+        index.prepare_suggestions()
+        self.bridge.post(self.apply_possible_illustrators, index)
 
     # ---------- UI ----------
     def create_widgets(self):
-        ttk.Label(self, text="Series").pack(pady=(20, 5))
+        ttk.Label(self, text="Language").pack(pady=(20, 5))
+        self.language_cb = ttk.Combobox(
+            self,
+            textvariable=self.language_var,
+            values=self.sessions.languages,
+            state="readonly",
+        )
+        self.language_cb.pack(fill="x", padx=20)
+        self.language_cb.bind("<<ComboboxSelected>>", self.on_language_selected)
+
+        ttk.Label(self, text="Series").pack(pady=(15, 5))
         self.series_cb = ttk.Combobox(self, textvariable=self.series_var, state="readonly")
         self.series_cb.pack(fill="x", padx=20)
         self.series_cb.bind("<<ComboboxSelected>>", self.on_series_selected)
@@ -140,22 +411,78 @@ class CardInspectorApp(tk.Tk):
         )
         self.scan_btn.pack(pady=25)
 
+        self.progress = ttk.Progressbar(self, mode="indeterminate")
+        self.status_var = tk.StringVar(value="Ready")
+        self.status_label = ttk.Label(self, textvariable=self.status_var)
+        self.status_label.pack(pady=(5, 0))
+
+        self.save_status_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.save_status_var).pack(pady=(0, 10))
+
+    def update_title(self):
+        self.title(f"TCGDex Illustrator Editor ({self.session.language})")
+
     # ---------- DATA ----------
+    def on_language_selected(self, _):
+        language = self.language_var.get()
+        if language == self.session.language:
+            return
+        # The review in progress (if any) keeps its own session
+        self.session = self.sessions.get(language)
+        self.update_title()
+
+        self.bridge.cancel_group("language")
+        self.bridge.cancel_group("series")
+        self.series_map = {}
+        self.set_map = {}
+        self.series_obj = None
+        self.series_cb.set("")
+        self.series_cb["values"] = []
+        self.set_cb.set("")
+        self.set_cb["values"] = []
+        self.set_cb["state"] = "disabled"
+        self.scan_btn["state"] = "disabled"
+        self.load_series()
+
     def on_series_selected(self, _):
         self.set_cb.set("")
         self.scan_btn["state"] = "disabled"
         self.set_cb["state"] = "readonly"
         series_name = self.series_var.get()
         series_id = self.series_map[series_name]
-        # run async function in separate thread
-        
-        # Create, launch and wait on a thread to fetch series data
-        def worker():
-            import asyncio
-            self.series_obj = asyncio.run(self.api.serie.get(series_id))
-        series_selected_thread = Thread(target=worker, daemon=True)
-        series_selected_thread.start()
-        series_selected_thread.join()
+
+        # Drop whatever is still loading for the previously selected series/set
+        self.bridge.cancel_group("series")
+        self.bridge.cancel_group("set")
+        session = self.session
+        series_obj = session.cached_series_sets(series_id)
+        if series_obj is not None:
+            self.apply_series_sets(session, series_obj)
+            if session.catalog.is_stale(series_id):
+                self.run_in_background(
+                    "sets update",
+                    lambda: session.revalidate_series_sets(series_id),
+                    lambda series_obj: self.apply_series_sets(session, series_obj) if series_obj is not None else None,
+                    group="series",
+                )
+            return
+
+        self.run_async(
+            "sets",
+            self.load_series_sets_async(session, series_id),
+            lambda series_obj: self.apply_series_sets(session, series_obj),
+            group="series",
+        )
+
+    @timed("on_series_selected")
+    async def load_series_sets_async(self, session, series_id):
+        return await asyncio.to_thread(session.get_series, series_id)
+
+    def apply_series_sets(self, session, series_obj):
+        if session is not self.session or series_obj.id != self.series_map.get(self.series_var.get()):
+            # Finished after the user picked another series
+            return
+        self.series_obj = series_obj
 
         #Fill sets combobox
         sets_dict = {s.name: s.id for s in self.series_obj.sets}
@@ -168,205 +495,422 @@ class CardInspectorApp(tk.Tk):
         self.scan_btn["state"] = "normal"
 
     # ---------- SCAN ----------
+    @timed("start_scan")
     def start_scan(self):
         series = self.series_var.get()
         set_name = self.set_var.get()
         set_id = self.set_map[set_name]
         series_id = self.series_map[series]
-        if LANGUAGE == "ja":
-            path = os.path.join(DATABASE_ROOT, series_id, set_id)
-        if LANGUAGE == "en":
-            path = os.path.join(DATABASE_ROOT, series, set_name)
-       
+        session = self.session
+        path = session.set_path(series, series_id, set_name, set_id)
+
+        self.bridge.cancel_group("set")
+        self.bridge.cancel_group("card")
         self.missing_cards.clear()
         self.current_index = 0
+        self.prefetching.clear()
+        self.saved_illustrators.clear()
+        self.back_index = None
+        if self.review_window is not None:
+            self.close_review()
         ##Add a check to see if path exists
         if not os.path.exists(path):
             messagebox.showerror("Error", f"Path does not exist: {path}\nThe cards from the selected set ({set_id}/{set_name}) from the selected series({series_id}/{series}) may not have been added yet.")
             return
-        for file in sorted(
-            os.listdir(path),
-            key=lambda x: int(x.split(".")[0]) if x.split(".")[0].isdigit() else float("inf")
-        ):
-            if not file.endswith(".ts"):
-                continue
-
-            full = os.path.join(path, file)
-            with open(full, "r", encoding="utf-8") as f:
-                content = f.read()
+        self.review_session = session
+        self.scan_path = path
+
+        def scan():
+            # Off the Tk thread: the refresh waits on the watcher lock (held for a whole poll
+            # pass) and on SQLite while the startup census writes the index
+            with span("set_scan"):
+                # Re-parse only the files changed since the last scan, then it is an indexed lookup
+                self.watcher.refresh_set(session.language, path)
+                return self.card_index.missing_in_set(*CardIndex.set_key(session.language, path))
+
+        self.run_in_background(
+            "set scan",
+            scan,
+            lambda missing_cards: self.on_set_scanned(session, path, missing_cards),
+            group="set",
+        )
 
-            if self.missing_illustrator(content):
-                card_id = self.extract_card_id(
-                    content=content,
-                    set_id=self.set_map[self.set_var.get()],
-                    filename=file
-                )
-                self.missing_cards.append((full, card_id))
+    def on_set_scanned(self, session, path, missing_cards):
+        if path != self.scan_path or session is not self.review_session:
+            # Another scan was started while this one ran
+            return
+        self.missing_cards = missing_cards
 
         if not self.missing_cards:
             messagebox.showinfo("Done", "No cards missing illustrator 🎉")
             return
 
+        # Fill the card cache for the whole set so stepping through cards needs no API calls
+        card_ids = [card_id for _, card_id in self.missing_cards]
+        self.run_async(
+            "card metadata",
+            session.card_service.fetch_many(card_ids),
+            self.on_cards_fetched,
+            group="set",
+        )
+
         self.open_card_editor()
 
-    # ---------- CARD EDITOR ----------
-    def open_card_editor(self):
-        if self.current_index >= len(self.missing_cards):
-            messagebox.showinfo("Done", "All missing illustrators processed 🎉")
-            return
+    def on_cards_fetched(self, results):
+        failed = [card_id for card_id, card in results.items() if isinstance(card, Exception)]
+        if failed:
+            print(f"⚠️ Could not fetch {len(failed)} of {len(results)} cards: {', '.join(failed)}")
+
+    # ---------- REVIEW WINDOW ----------
+    def build_review_window(self):
+        # Built once per run: moving to another card only swaps the image and the fields
+        review = tk.Toplevel(self)
+        review.geometry("760x1040")
+        review.protocol("WM_DELETE_WINDOW", self.close_review)
+        self.review_window = review
+
+        # Double buffer: one PhotoImage on screen, the other painted with the next card ahead of time
+        self.photos = [ImageTk.PhotoImage("RGBA", DISPLAY_SIZE), ImageTk.PhotoImage("RGBA", DISPLAY_SIZE)]
+        self.front = 0
+        # Card index painted on the back buffer, None if it holds nothing useful
+        self.back_index = None
+
+        # The text shows while there is no image yet
+        self.img_label = ttk.Label(review, image=self.photos[self.front], text="Loading image…")
+        self.img_label.pack(pady=10)
+
+        self.position_var = tk.StringVar()
+        ttk.Label(review, textvariable=self.position_var).pack()
+        self.details_var = tk.StringVar()
+        ttk.Label(review, textvariable=self.details_var, justify="center").pack()
+        ttk.Label(review, textvariable=self.save_status_var).pack()
 
-        path, card_id = self.missing_cards[self.current_index]
-        # Create, launch and wait on a thread to fetch card data
-        def worker():
-            import asyncio
-            self.card = asyncio.run(self.fetch_card_async(card_id))
+        # ---------- INPUT ----------
+        ttk.Label(review, text="Illustrator").pack(pady=(10, 5))
 
-        get_card_thread = Thread(target=worker, daemon=True)
-        get_card_thread.start()
-        get_card_thread.join() 
+        input_frame = ttk.Frame(review)
+        input_frame.pack(fill="x", padx=20)
 
-        editor = tk.Toplevel(self)
-        editor.title(self.card.name)
-        editor.geometry("760x1000")
+        self.illustrator_var = tk.StringVar()
+        self.illustrator_entry = ttk.Entry(input_frame, textvariable=self.illustrator_var)
+        self.illustrator_entry.pack(side="left", fill="x", expand=True)
 
-        # ---------- IMAGE ----------
-        image = None
-        r = None
-        img_url = self.card.get_image_url(quality="high", extension="png")
+        ttk.Button(input_frame, text="Skip", command=self.skip_card).pack(side="left", padx=(10, 10))
 
-        try:
-            if NO_SSL_VERIFICATION:
-                r = requests.get(img_url, timeout=30, verify=False)
-            else:
-                r = requests.get(img_url, timeout=30)
-        except Exception as e:
-            print(f"⚠️ Could not load image for card {self.card.name} from {img_url} with error: {e}")
-        
-        if r is not None and r.content is not None and r.status_code == 200:
-            image = Image.open(BytesIO(r.content)).resize((600, 840))
-        else:
-            if not FALLBACK_IMAGE_PATH.exists():
-                raise FileNotFoundError(
-                    f"Fallback image not found: {FALLBACK_IMAGE_PATH}"
-                )
-            else:
-                messagebox.showerror(
-                    "Image Load Error",
-                    f"Could not load image for card {self.card.name} ."
-                )
-                image = Image.open(FALLBACK_IMAGE_PATH).resize((600, 840))
+        self.save_btn = ttk.Button(
+            input_frame,
+            text="Save",
+            state="disabled",
+            command=lambda: self.validate_and_save(review, self.current_path(), self.illustrator_var.get())
+        )
+        self.save_btn.pack(side="right")
 
-        photo = ImageTk.PhotoImage(image) 
-        img_label = ttk.Label(editor, image=photo)
-        img_label.image = photo
-        img_label.pack(pady=10)
+        # ---------- NAVIGATION ----------
+        nav_frame = ttk.Frame(review)
+        nav_frame.pack(fill="x", padx=20, pady=(15, 0))
 
-        # ---------- INPUT ----------
-        ttk.Label(editor, text="Illustrator").pack(pady=(10, 5))
+        ttk.Button(nav_frame, text="◀ Previous (PgUp)", command=self.previous_card).pack(side="left")
+        ttk.Button(nav_frame, text="Next (PgDn) ▶", command=self.next_card).pack(side="left", padx=(10, 0))
 
-        input_frame = ttk.Frame(editor)
-        input_frame.pack(fill="x", padx=20)
+        self.jump_var = tk.StringVar()
+        ttk.Button(nav_frame, text="Go", command=self.jump_to_card).pack(side="right")
+        self.jump_entry = ttk.Entry(nav_frame, textvariable=self.jump_var, width=6)
+        self.jump_entry.pack(side="right", padx=(0, 5))
+        ttk.Label(nav_frame, text="Go to card # (Ctrl+G)").pack(side="right", padx=(0, 5))
 
-        illustrator_var = tk.StringVar()
-        entry = ttk.Entry(input_frame, textvariable=illustrator_var)
-        entry.pack(side="left", fill="x", expand=True)
-        entry.focus_set()
+        # ---------- AUTOCOMPLETE ----------
+        self.autocomplete = tk.Listbox(review, height=6)
+        self.autocomplete.place_forget()
 
-        skip_btn = ttk.Button(
-            input_frame,
-            text="Skip",
-            command=lambda: self.skip_card(editor)
+        # Traces and bindings are set up once, so long sessions don't pile them up
+        self.illustrator_var.trace_add("write", self.update_autocomplete)
+        self.illustrator_var.trace_add(
+            "write",
+            lambda *_: self.save_btn.config(
+                state="normal" if self.illustrator_var.get().strip() else "disabled"
+            )
         )
-        skip_btn.pack(side="left", padx=(10, 10))
 
-        save_btn = ttk.Button(
-            input_frame,
-            text="Save",
-            state="disabled",
-            command=lambda: self.validate_and_save(editor, path, illustrator_var.get())
+        entry = self.illustrator_entry
+        listbox = self.autocomplete
+        entry.bind("<Down>", lambda e: listbox.focus_set() if listbox.winfo_ismapped() else None)
+        entry.bind("<Tab>", lambda e: (self.accept_selection(0), "break")[1] if listbox.winfo_ismapped() else None)
+        entry.bind(
+            "<Return>",
+            lambda e: self.validate_and_save(review, self.current_path(), self.illustrator_var.get())
+            if self.illustrator_var.get().strip() else None
         )
-        save_btn.pack(side="right")
 
-        # ---------- AUTOCOMPLETE ----------
-        listbox = tk.Listbox(editor, height=6)
-        listbox.place_forget()
+        listbox.bind("<Return>", lambda e: self.accept_selection(listbox.curselection()[0]))
+        listbox.bind("<Double-Button-1>", lambda e: self.accept_selection(listbox.curselection()[0]))
 
-        def update_autocomplete(*_):
-            text = illustrator_var.get()
-            listbox.delete(0, tk.END)
+        review.bind("<Prior>", lambda e: self.previous_card())
+        review.bind("<Next>", lambda e: self.next_card())
+        review.bind("<Control-g>", lambda e: (self.jump_entry.focus_set(), self.jump_entry.select_range(0, tk.END)))
+        review.bind("<Escape>", lambda e: listbox.place_forget())
+        self.jump_entry.bind("<Return>", lambda e: self.jump_to_card())
 
-            if len(text) < AUTOCOMPLETE_MIN_CHARS:
-                listbox.place_forget()
-                return
+    def close_review(self):
+        # Hidden, not destroyed: the next review reuses it
+        self.bridge.cancel_group("card")
+        self.autocomplete.place_forget()
+        self.review_window.withdraw()
 
-            text_norm = normalize_illustrator(text).lower()
+    def update_autocomplete(self, *_):
+        text = self.illustrator_var.get()
+        listbox = self.autocomplete
+        entry = self.illustrator_entry
+        listbox.delete(0, tk.END)
 
-            starts = []
-            contains = []
+        if len(text) < AUTOCOMPLETE_MIN_CHARS or self.illustrator_index is None:
+            listbox.place_forget()
+            return
 
-            for name in self.possible_illustrators:
-                n = name.lower()
-                if n.startswith(text_norm):
-                    starts.append(name)
-                elif text_norm in n:
-                    contains.append(name)
+        matches = self.illustrator_index.search(text)
 
-            matches = sorted(starts) + sorted(contains)
+        if not matches:
+            listbox.place_forget()
+            return
 
-            if not matches:
-                listbox.place_forget()
-                return
+        listbox.insert(tk.END, *matches)
 
-            for name in matches:
-                listbox.insert(tk.END, name)
+        x = entry.winfo_rootx() - self.review_window.winfo_rootx()
+        y = entry.winfo_rooty() - self.review_window.winfo_rooty() + entry.winfo_height()
+        listbox.place(x=x, y=y, width=entry.winfo_width())
 
-            x = entry.winfo_rootx() - editor.winfo_rootx()
-            y = entry.winfo_rooty() - editor.winfo_rooty() + entry.winfo_height()
-            listbox.place(x=x, y=y, width=entry.winfo_width())
+    def accept_selection(self, index=0):
+        if self.autocomplete.size() == 0:
+            return
+        self.illustrator_var.set(self.autocomplete.get(index))
+        self.autocomplete.place_forget()
+        self.illustrator_entry.focus_set()
+        self.illustrator_entry.icursor(tk.END)
 
-        def accept_selection(index=0):
-            if listbox.size() == 0:
-                return
-            illustrator_var.set(listbox.get(index))
-            listbox.place_forget()
-            entry.focus_set()
-            entry.icursor(tk.END)
+    # ---------- CARD EDITOR ----------
+    def current_path(self):
+        return self.missing_cards[self.current_index][0]
+
+    def open_card_editor(self):
+        if self.current_index >= len(self.missing_cards):
+            messagebox.showinfo("Done", "All missing illustrators processed 🎉")
+            if self.review_window is not None:
+                self.close_review()
+            return
+
+        if self.review_window is None:
+            self.build_review_window()
+        else:
+            self.review_window.deiconify()
 
-        illustrator_var.trace_add("write", update_autocomplete)
+        index = self.current_index
+        path, card_id = self.missing_cards[index]
+        self.show_position(index)
 
-        entry.bind("<Down>", lambda e: listbox.focus_set() if listbox.winfo_ismapped() else None)
-        entry.bind("<Tab>", lambda e: (accept_selection(0), "break")[1] if listbox.winfo_ismapped() else None)
+        # Warm the cache for the next cards while the user types on this one
+        self.prefetch_upcoming()
 
-        listbox.bind("<Return>", lambda e: accept_selection(listbox.curselection()[0]))
-        listbox.bind("<Double-Button-1>", lambda e: accept_selection(listbox.curselection()[0]))
+        # Fast path: card and image already cached -> no round trip through the loop
+        cached = self.cached_card(card_id)
+        if cached is not None:
+            self.show_card_editor(index, path, *cached)
+            return
 
-        entry.bind(
-            "<Return>",
-            lambda e: self.validate_and_save(editor, path, illustrator_var.get())
-            if illustrator_var.get().strip() else None
+        # The local data is already on screen (show_position): image and API metadata follow
+        self.img_label.configure(image="")
+        self.run_async(
+            "card",
+            self.load_card_async(card_id),
+            lambda loaded: self.show_card_editor(index, path, *loaded),
+            group="card",
+            on_error=lambda e: self.on_card_load_failed(index, card_id, e),
         )
 
-        illustrator_var.trace_add(
-            "write",
-            lambda *_: save_btn.config(
-                state="normal" if illustrator_var.get().strip() else "disabled"
-            )
+    def show_position(self, index):
+        path, card_id = self.missing_cards[index]
+        saved = self.saved_illustrators.get(path)
+        position = f"Card {index + 1} of {len(self.missing_cards)} · {card_id}"
+        self.position_var.set(position + (f" · saved as {saved}" if saved else ""))
+        self.jump_var.set(str(index + 1))
+        # Coming back to a saved card shows what was saved
+        self.illustrator_var.set(saved or "")
+        self.illustrator_entry.focus_set()
+
+        # Local-first: name, number, rarity and set straight from the indexed card file,
+        # so the card can be reviewed while the API is slow or down
+        self.card = None
+        self.preview = self.card_index.card_preview(path) or {"card_id": card_id}
+        self.show_card_details()
+
+    def show_card_details(self, note=None):
+        preview = self.preview
+        name = preview.get("name") or preview["card_id"]
+        details = [name]
+        if preview.get("local_id"):
+            details.append(f"#{preview['local_id']}")
+        if preview.get("rarity"):
+            details.append(preview["rarity"])
+        if preview.get("set_name"):
+            details.append(preview["set_name"])
+        self.review_window.title(name)
+        self.details_var.set(" · ".join(details) + (f"\n{note}" if note else ""))
+
+    def on_card_load_failed(self, index, card_id, e):
+        # API down or card unknown to it: keep reviewing from the local data, no error box per card
+        print(f"⚠️ Could not load card {card_id}: {e}")
+        if index != self.current_index or self.review_window is None:
+            return
+        self.show_card_details(note="⚠️ TCGdex unavailable, showing the card file data")
+        if self.back_index != index:
+            self.photos[1 - self.front].paste(self.load_fallback_image())
+        self.flip_buffers()
+
+    def load_fallback_image(self):
+        if self.fallback_display_image is None:
+            if not FALLBACK_IMAGE_PATH.exists():
+                raise FileNotFoundError(
+                    f"Fallback image not found: {FALLBACK_IMAGE_PATH}"
+                )
+            self.fallback_display_image = decode_display_image(FALLBACK_IMAGE_PATH)
+        return self.fallback_display_image
+
+    def flip_buffers(self):
+        # Swap buffers; the old front becomes the back buffer for the next card
+        self.front = 1 - self.front
+        self.back_index = None
+        self.img_label.configure(image=self.photos[self.front])
+
+    def cached_card(self, card_id):
+        # (card, image url, image path) when nothing has to be fetched, else None
+        card = self.review_session.card_service.get_cached(card_id)
+        if card is None:
+            return None
+        img_url = card_image_url(card)
+        image_path = self.image_pipeline.cache.get(img_url) if img_url else None
+        if image_path is None and img_url is not None:
+            return None
+        return card, img_url, image_path
+
+    async def load_card_async(self, card_id):
+        card = await self.fetch_card_async(card_id)
+        img_url = card_image_url(card)
+        image_path = None
+        if img_url:
+            try:
+                image_path = await asyncio.wrap_future(self.image_pipeline.prefetch(img_url))
+            except Exception as e:
+                print(f"⚠️ Could not load image for card {card.name} from {img_url} with error: {e}")
+        return card, img_url, image_path
+
+    @timed("show_card_editor")
+    def show_card_editor(self, index, path, card, img_url, image_path):
+        if index != self.current_index or self.review_window is None:
+            # The reviewer moved on while this card was loading
+            return
+        self.card = card
+        # API metadata over the local data, where the API has it
+        remote = {
+            "name": card.name,
+            "local_id": card.localId,
+            "rarity": card.rarity,
+            "set_name": card.set.name if card.set is not None else None,
+        }
+        self.preview.update({key: value for key, value in remote.items() if value})
+
+        # ---------- IMAGE ----------
+        note = None
+        if self.back_index != index:
+            image = None
+            if image_path is not None:
+                try:
+                    # Decoded once; going back to a card or painting the next one ahead of time hits memory
+                    image = self.image_pipeline.display_image(image_path)
+                except Exception as e:
+                    print(f"⚠️ Could not load image for card {card.name} from {img_url} with error: {e}")
+
+            if image is None:
+                note = "⚠️ No card image, showing the fallback"
+                image = self.load_fallback_image()
+            self.photos[1 - self.front].paste(image)
+
+        self.show_card_details(note=note)
+        self.flip_buffers()
+
+        self.prepare_next(index + 1)
+
+    def prepare_next(self, index):
+        # Decode the next card's image off the Tk thread and paint it on the back buffer
+        if index >= len(self.missing_cards) or self.back_index == index:
+            return
+        cached = self.cached_card(self.missing_cards[index][1])
+        if cached is None or cached[2] is None:
+            # Not downloaded yet: prefetch_upcoming() calls back here when it is
+            return
+
+        def paint(image):
+            if index == self.current_index + 1:
+                self.photos[1 - self.front].paste(image)
+                self.back_index = index
+
+        self.bridge.submit(
+            asyncio.to_thread(self.image_pipeline.display_image, cached[2]),
+            on_done=paint,
+            on_error=lambda e: None,
+            group="card",
         )
 
-    # ---------- ACTIONS ----------
-    def skip_card(self, editor):
-        editor.destroy()
-        self.current_index += 1
+    # ---------- PREFETCH ----------
+    def prefetch_upcoming(self):
+        start = self.current_index + 1
+        upcoming = self.missing_cards[start:start + PREFETCH_COUNT]
+        for index, (_, card_id) in enumerate(upcoming, start):
+            if card_id not in self.prefetching:
+                self.prefetching.add(card_id)
+                self.bridge.submit(
+                    self.load_card_async(card_id),
+                    on_done=lambda _, index=index: self.prepare_next(index) if index == self.current_index + 1 else None,
+                    on_error=lambda e: None,
+                    group="set",
+                )
+
+    # ---------- NAVIGATION ----------
+    def go_to_card(self, index):
+        if not self.missing_cards:
+            return
+        self.bridge.cancel_group("card")
+        self.current_index = max(0, min(index, len(self.missing_cards)))
         self.open_card_editor()
 
+    def next_card(self):
+        self.go_to_card(self.current_index + 1)
+
+    def previous_card(self):
+        if self.current_index > 0:
+            self.go_to_card(self.current_index - 1)
+
+    def jump_to_card(self):
+        try:
+            number = int(self.jump_var.get())
+        except ValueError:
+            self.jump_var.set(str(self.current_index + 1))
+            return
+        self.go_to_card(max(1, min(number, len(self.missing_cards))) - 1)
+
+    # ---------- ACTIONS ----------
+    def skip_card(self):
+        self.next_card()
+
     def validate_and_save(self, editor, path, illustrator):
-        illustrator_norm = normalize_illustrator(illustrator)
+        # Saved the way the census counts it: normalized, aliases resolved
+        illustrator_norm = canonical_illustrator(illustrator)
+        if not illustrator_norm:
+            messagebox.showwarning("Warning", "Illustrator is empty.", parent=editor)
+            return
 
         if self.possible_illustrators and illustrator_norm not in self.possible_illustrators:
-            self.show_unknown_illustrator_warning(editor, path, illustrator)
+            self.show_unknown_illustrator_warning(editor, path, illustrator_norm)
             return
 
-        self.save_illustrator(editor, path, illustrator)
+        self.save_illustrator(editor, path, illustrator_norm)
 
     def show_unknown_illustrator_warning(self, editor, path, illustrator):
         warning = tk.Toplevel(editor)
@@ -374,82 +918,84 @@ class CardInspectorApp(tk.Tk):
         warning.transient(editor)
         warning.grab_set()
 
+        # Known names a few edits away (typos, swapped letters, case), one click to save instead
+        with span("illustrator_suggest"):
+            suggestions = self.illustrator_index.suggest(illustrator) if self.illustrator_index is not None else []
+
         ttk.Label(
             warning,
-            text=f"Illustrator “{illustrator}” was not found.\nSave anyway?",
+            text=f"Illustrator “{illustrator}” was not found.\n" + ("Did you mean:" if suggestions else "Save anyway?"),
             justify="center"
         ).pack(padx=20, pady=20)
 
+        for number, name in enumerate(suggestions, 1):
+            save_suggestion = lambda event=None, name=name: (warning.destroy(), self.save_illustrator(editor, path, name))
+            button = ttk.Button(
+                warning,
+                text=f"{number}. {name} ({self.illustrator_index.count(name)} cards)",
+                command=save_suggestion,
+            )
+            button.pack(fill="x", padx=20, pady=2)
+            warning.bind(str(number), save_suggestion)
+            if number == 1:
+                button.focus_set()
+                warning.bind("<Return>", save_suggestion)
+
         btns = ttk.Frame(warning)
         btns.pack(pady=10)
 
         ttk.Button(btns, text="Cancel", command=warning.destroy).pack(side="left", padx=10)
         ttk.Button(
             btns,
-            text="Confirm",
+            text="Save anyway" if suggestions else "Confirm",
             command=lambda: (warning.destroy(), self.save_illustrator(editor, path, illustrator))
         ).pack(side="right", padx=10)
+        warning.bind("<Escape>", lambda event: warning.destroy())
 
+    @timed("save_illustrator")
     def save_illustrator(self, editor, path, illustrator):
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # 1️⃣ Locate rarity and indentation
-        rarity_match = re.search(r"\n(\s*)rarity\s*:", content)
-        if not rarity_match:
-            messagebox.showerror("Error", "Could not locate rarity field")
-            return
-
-        indent = rarity_match.group(1)
-        illustrator_line = f'\n{indent}illustrator: "{illustrator}",'
-
-        # 2️⃣ If illustrator already exists → overwrite it
-        if re.search(r"\n\s*illustrator\s*:\s*['\"].*?['\"],?", content):
-            content = re.sub(
-                r"\n(\s*)illustrator\s*:\s*['\"].*?['\"],?",
-                f"\n{illustrator_line}",
-                content,
-                count=1
-            )
-        # 3️⃣ Otherwise → insert illustrator before rarity
-        else:
-            content = re.sub(
-                r"\n(\s*rarity\s*:)",
-                f"\n{illustrator_line}\n\\1",
-                content,
-                count=1
-            )
+        # Journaled and queued; the write happens on the save worker, so the next card shows right away
+        self.save_queue.submit(path, illustrator)
+        self.saved_illustrators[path] = illustrator
+        self.next_card()
+
+    # ---------- SAVE STATUS ----------
+    def update_save_status(self, status):
+        text = f"💾 {status['pending']} pending · {status['committed']} saved"
+        if status["failed"]:
+            text += f" · ⚠️ {status['failed']} failed"
+        self.save_status_var.set(text)
+
+    def on_saves_committed(self, paths):
+        # Save worker thread: counts, CSV and autocomplete pick the new illustrators up without a rescan
+        for language, set_path in {(language_for_path(path), os.path.dirname(path)) for path in paths}:
+            if language is None:
+                # Not under either database root (moved since it was journaled): nothing indexed to update
+                continue
+            try:
+                self.watcher.refresh_set(language, set_path)
+            except Exception as e:
+                print(f"⚠️ Could not refresh illustrator counts for {set_path}: {e}")
 
-        # 4️⃣ Write file back
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        editor.destroy()
-        self.current_index += 1
-        self.open_card_editor()
+    def on_save_failed(self, failure):
+        path, illustrator, e = failure
+        if self.saved_illustrators.get(path) == illustrator:
+            del self.saved_illustrators[path]
+        messagebox.showerror("Save failed", f"Could not save illustrator “{illustrator}” to\n{path}:\n{e}")
 
     # ---------- UTIL ----------
-    @staticmethod
-    def missing_illustrator(content):
-        return not re.search(r"illustrator\s*:", content) or re.search(r"illustrator\s*:\s*['\"]\s*['\"]", content)
-
-    @staticmethod
-    def extract_card_id(content, set_id, filename):
-        match = re.search(r"id\s*:\s*['\"](.+?)['\"]", content)
-        return match.group(1) if match else f"{set_id}-{filename.replace('.ts','')}"
+    missing_illustrator = staticmethod(missing_illustrator)
+    extract_card_id = staticmethod(extract_card_id)
 
 
 # ---------- RUN ----------
-async def run_tcgDex_database_helper_GUI_async():
-# Initialize API once
-    api = TCGdex(LANGUAGE)
-    if IS_LOCAL_ENDPOINT:
-        api = api.setEndpoint(LOCAL_ENDPOINT) ## Use local TCGdex instance
-    app = CardInspectorApp(api)
-    
-    # Load series before showing GUI
-    await app.load_series_async()
-    
+def run_tcgDex_database_helper_GUI(census=None):
+    # API clients are created per language inside the app, on first use
+    app = CardInspectorApp(LANGUAGE)
+
+    # Show the window right away; census, CSV and series load in the background
+    app.start_background_loading(census=census)
+
     # Now run Tkinter mainloop
     app.mainloop()
     
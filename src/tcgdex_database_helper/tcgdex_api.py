@@ -0,0 +1,63 @@
+from dacite import from_dict
+from tcgdexsdk import __version__ as TCGDEX_SDK_VERSION
+from tcgdexsdk.models.Serie import Serie
+from tcgdexsdk.models.SerieResume import SerieResume
+
+from tcgdex_database_helper.http_client import HttpClient
+
+
+class TCGdexApi:
+    # TCGdex REST calls routed through the shared HttpClient (pooling, retries,
+    # stats). Builds the same SDK models api.<endpoint>.get()/list() return;
+    # the SDK instance only provides the endpoint and language.
+
+    def __init__(self, sdk, http: HttpClient):
+        self.sdk = sdk
+        self.http = http
+        self.headers = {"User-Agent": f"@tcgdex/python-sdk@{TCGDEX_SDK_VERSION}"}
+
+    @property
+    def language(self) -> str:
+        return str(getattr(self.sdk.language, "value", self.sdk.language))
+
+    def url(self, endpoint: str, item_id: str | None = None) -> str:
+        url = f"{self.sdk.getEndpoint()}/{self.language}/{endpoint}"
+        if item_id is not None:
+            url += f"/{item_id.replace(' ', '%20')}"
+        return url
+
+    def get_json(self, endpoint: str, item_id: str | None = None):
+        return self.http.get_json(self.url(endpoint, item_id), headers=self.headers)
+
+    def get_json_revalidated(self, endpoint: str, item_id: str | None = None, etag: str | None = None) -> tuple:
+        # Conditional GET: (payload, etag), payload None when the server answers 304 Not Modified
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        r = self.http.get(self.url(endpoint, item_id), headers=headers)
+        if r.status_code == 304:
+            return None, etag
+        return r.json(), r.headers.get("ETag")
+
+    def build(self, cls, data: dict):
+        # Same as the SDK: attach the sdk instance to the model and its children
+        model = from_dict(cls, data)
+        model.sdk = self.sdk
+        for value in model.__dict__.values():
+            if isinstance(value, list):
+                for item in value:
+                    if hasattr(item, "sdk"):
+                        item.sdk = self.sdk
+            elif hasattr(value, "sdk"):
+                value.sdk = self.sdk
+        return model
+
+    # ---------- ENDPOINTS ----------
+    def list_series(self) -> list[SerieResume]:
+        return [self.build(SerieResume, item) for item in self.get_json("series")]
+
+    def get_series(self, series_id: str) -> Serie:
+        return self.build(Serie, self.get_json("series", series_id))
+
+    def get_card_data(self, card_id: str) -> dict:
+        return self.get_json("cards", card_id)